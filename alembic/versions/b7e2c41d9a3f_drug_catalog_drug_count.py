@@ -0,0 +1,31 @@
+"""'drug catalog drug count'
+
+Revision ID: b7e2c41d9a3f
+Revises: 1756643edec3
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c41d9a3f'
+down_revision: Union[str, None] = '1756643edec3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('drug_catalogs', sa.Column(
+        'drug_count', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE drug_catalogs SET drug_count = ("
+        "SELECT count(*) FROM drugs WHERE drugs.catalog_id = drug_catalogs.id"
+        ") WHERE status = 'completed'")
+
+
+def downgrade() -> None:
+    op.drop_column('drug_catalogs', 'drug_count')
@@ -0,0 +1,31 @@
+"""'mapping import progress'
+
+Revision ID: c4f1a8e2d6b7
+Revises: b7e2c41d9a3f
+Create Date: 2026-10-18 19:40:12.207431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a8e2d6b7'
+down_revision: Union[str, None] = 'b7e2c41d9a3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'mapping_import_progress',
+        sa.Column('mapping_id', sa.BigInteger(), nullable=False),
+        sa.Column('chunks_done', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('mapping_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('mapping_import_progress')
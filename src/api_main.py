@@ -4,6 +4,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.config.constants import C
 from src.config.settings import get_config
+from src.domain.services.password_service import shutdown_password_executor
+from src.infrastructure.services.confidential_ledger import (
+    shutdown_ledger, startup_ledger)
 from src.infrastructure.taskiq.broker import broker
 from src.presentation.view import register_api_routes
 
@@ -11,7 +14,10 @@ from src.presentation.view import register_api_routes
 @asynccontextmanager
 async def __lifespan(app: FastAPI):
     await broker.startup()
+    startup_ledger(get_config())
     yield
+    await shutdown_ledger()
+    shutdown_password_executor()
 
 
 # Application factory
@@ -16,9 +16,13 @@ class DrugDto(BaseSchema):
 
 class DrugPaginatedDto(BaseSchema):
     data: list[DrugDto]
-    page: int
+    # page is None for cursor pages, total depends on the count strategy
+    page: int | None = None
     limit: int
-    total: int
+    total: int | None = None
+    has_next: bool = False
+    # cursor of the following page, None on the last one
+    next: str | None = None
 
 
 class DrugMappingsCount(BaseSchema):
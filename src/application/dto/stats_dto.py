@@ -19,6 +19,28 @@ class MappingsStatsDto(BaseSchema):
     total: int
 
 
+class AutocompleteIndexStatsDto(BaseSchema):
+    catalog_id: int
+    drugs: int
+    memory_bytes: int
+
+
+class CacheStatsDto(BaseSchema):
+    name: str
+    size: int
+    hits: int
+    misses: int
+    hit_ratio: float | None
+
+
+class DatabasePoolStatsDto(BaseSchema):
+    runner: str
+    size: int | None
+    checked_out: int | None
+    checked_in: int | None
+    overflow: int | None
+
+
 class AdminStatsDto(BaseSchema):
     central_catalog: CentralCatalogStatsDto | None = None
     total_catalogs: CatalogStatsDto | None = None
@@ -26,3 +26,7 @@ class MappingTransactionDto(BaseTransactionDto):
 
 class TransactionDto(BaseSchema):
     valid: bool
+
+
+class TransactionVerificationDto(TransactionDto):
+    transaction_id: str
@@ -1,4 +1,5 @@
 from src.utils.exc import UnauthorizedAccessError
+from src.domain.services.password_service import verify_password
 from src.application.dto.auth_dto import AuthDto, AuthSuccessDto
 from src.infrastructure.repositories.contract import UserRepositoryInterface
 from src.infrastructure.services.token_service import TokenServiceInterface
@@ -17,7 +18,7 @@ class UserLoginUseCase:
 
     async def execute(self, credentials: AuthDto) -> AuthSuccessDto:
         user = await self.user_repository.get_user_by_email(credentials.username)
-        if not user or not user.verify_password(credentials.password):
+        if not user or not await verify_password(user, credentials.password):
             raise UnauthorizedAccessError("Invalid credentials")
 
         access_token = self.access_token_service.generate_token(user.sub, [])
@@ -1,9 +1,9 @@
 from typing import List, Literal
 
 from src.application.dto.drug_dto import DrugMappingsCount
-from src.domain.entities.drug import Drug
 from src.infrastructure.repositories.contract import (
     DrugCatalogRepositoryInterface, DrugRepositoryInterface)
+from src.infrastructure.services.drug_autocomplete import DrugAutocomplete
 from src.application.dto.drug_catalog_dto import _CountryCode
 
 
@@ -14,21 +14,35 @@ class GetDrugsByCountryUseCase:
     def __init__(
         self,
         drug_catalog_repository: DrugCatalogRepositoryInterface,
-        drug_repository: DrugRepositoryInterface
+        drug_repository: DrugRepositoryInterface,
+        autocomplete: DrugAutocomplete | None = None,
     ):
         self.drug_catalog_repository = drug_catalog_repository
         self.drug_repository = drug_repository
+        self.autocomplete = autocomplete
 
     async def execute(
-            self, country: DrugCountry, drug_name_or_code: str) -> List[Drug]:
+            self, country: DrugCountry, drug_name_or_code: str,
+            limit: int = 20) -> List[DrugMappingsCount]:
         catalog = await self.drug_catalog_repository.get_first_by_country(
             country)
         if not catalog:
             return []
 
-        drugs = await self.drug_repository.\
-            get_all_like_code_or_name_by_catalog_id(
-                catalog._id, drug_name_or_code)
+        if self.autocomplete is not None:
+            entries = await self.autocomplete.search(
+                catalog, drug_name_or_code, limit,
+                self.drug_repository.get_search_entries_by_catalog_id)
+            # None when the catalog is not indexed, the database answers
+            if entries is not None:
+                return [DrugMappingsCount(
+                    drug_code=drug_code,
+                    drug_name=drug_name,
+                    drug_id=drug_id
+                ) for drug_id, drug_code, drug_name in entries]
+
+        drugs = await self.drug_repository.search_by_catalog_id(
+            catalog._id, drug_name_or_code, limit)
         return [DrugMappingsCount(
             drug_code=drug.drug_code,
             drug_name=drug.drug_name,
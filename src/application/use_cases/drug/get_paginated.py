@@ -1,8 +1,14 @@
+from typing import List
+
 from src.application.dto.drug_dto import DrugDto, DrugPaginatedDto
+from src.config.settings.base import CountStrategy
+from src.domain.entities.drug import Drug
+from src.domain.entities.drug_catalog import DrugCatalog
 from src.infrastructure.repositories.contract import (
     DrugCatalogRepositoryInterface,
     DrugRepositoryInterface,
 )
+from src.utils.cursor import decode_cursor, encode_cursor
 from src.utils.exc import ResourceNotFound
 
 
@@ -15,12 +21,54 @@ class GetPaginatedDrugsUseCase:
         self.drug_catalog_repository = drug_catalog_repository
         self.drug_repository = drug_repository
 
+    @staticmethod
+    def _next_cursor(items: List[Drug], has_next: bool) -> str | None:
+        if not has_next or not items:
+            return None
+        return encode_cursor(items[-1]._id)
+
+    @staticmethod
+    def _estimated_total(
+        catalog: DrugCatalog, name_or_code_filter: str
+    ) -> int | None:
+        # the import counter only covers the whole catalog
+        if name_or_code_filter:
+            return None
+        return catalog.drug_count
+
+    async def _cursor_page(
+        self,
+        after: str,
+        page_size: int,
+        catalog: DrugCatalog,
+        name_or_code_filter: str,
+        count: CountStrategy,
+    ) -> DrugPaginatedDto:
+        drugs = await self.drug_repository.get_page_after_id(
+            decode_cursor(after) if after else None,
+            page_size + 1, catalog._id, name_or_code_filter
+        )
+        has_next = len(drugs) > page_size
+        drugs = drugs[:page_size]
+        total = None
+        if count == "ESTIMATED":
+            total = self._estimated_total(catalog, name_or_code_filter)
+        return DrugPaginatedDto(
+            data=[DrugDto.model_validate(drug) for drug in drugs],
+            limit=page_size,
+            total=total,
+            has_next=has_next,
+            next=self._next_cursor(drugs, has_next),
+        )
+
     async def execute(
         self,
         page: int,
         page_size: int,
         name_or_code_filter: str,
         catalog_id: int = None,
+        after: str | None = None,
+        count: CountStrategy = "EXACT",
     ) -> DrugPaginatedDto:
         if catalog_id:
             catalog = await self.drug_catalog_repository.get_by_id(catalog_id)
@@ -29,13 +77,28 @@ class GetPaginatedDrugsUseCase:
         if not catalog:
             raise ResourceNotFound("Catalog not found")
 
+        if after is not None:
+            # cursor mode never counts exactly, that would scan the catalog
+            return await self._cursor_page(
+                after, page_size, catalog, name_or_code_filter, count)
+
+        total = None
+        if count == "ESTIMATED":
+            total = self._estimated_total(catalog, name_or_code_filter)
+            # catalogs still importing have no counter yet, count them
+            if total is None and not name_or_code_filter:
+                count = "EXACT"
+
         result = await self.drug_repository.get_paginated_by_catalog_id(
-            page, page_size, catalog._id, name_or_code_filter
+            page, page_size, catalog._id, name_or_code_filter,
+            with_total=count == "EXACT"
         )
         items = [DrugDto.model_validate(drug) for drug in result.items]
         return DrugPaginatedDto(
             data=items,
             page=result.current_page,
             limit=result.page_size,
-            total=result.total_count,
+            total=result.total_count if count == "EXACT" else total,
+            has_next=result.has_next,
+            next=self._next_cursor(result.items, result.has_next),
         )
@@ -4,10 +4,16 @@ import traceback
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.settings.imports import IngestionEngine
 from src.domain.entities.drug_catalog import TaskStatus
 from src.domain.entities.ltransactions import CatalogTransaction, CatalogTransactionData
-from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
-from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
+from src.infrastructure.services.confidential_ledger.contract import (
+    LedgerInterface,
+    TransactionInserted,
+)
+from src.infrastructure.services.confidential_ledger.write_behind import (
+    LedgerWriteBehind)
+from src.infrastructure.services.pandas_parser.drug.pool import ParserLoader
 from src.infrastructure.repositories.contract import (
     CatalogTransactionRepositoryInterface,
     DrugCatalogRepositoryInterface,
@@ -28,37 +34,74 @@ class CatalogImportUseCase:
         drug_repository: DrugRepositoryInterface,
         ledger_service: LedgerInterface,
         catalog_id: int,
-        parser: PandasParser,
+        parser: ParserLoader,
         session: AsyncSession,
+        ingestion_engine: IngestionEngine = "ORM",
+        ledger_ready_timeout: float = 10.0,
         logger: logging.Logger = logging.getLogger(__name__)
     ):
         self._drug_catalog_repository = drug_catalog_repository
         self._transaction_repository = transaction_repository
         self._drug_repository = drug_repository
         self._ledger_service = ledger_service
+        self._ledger_writes = LedgerWriteBehind(ledger_service)
         self._catalog_id = catalog_id
         self._parser = parser
         self._session = session
+        self._ingestion_engine = ingestion_engine
+        self._ledger_ready_timeout = ledger_ready_timeout
         self._logger = logger
 
-    async def _update_status(self, status: TaskStatus):
+    async def _wait_until_ready(self, transaction: TransactionInserted):
+        """Polls the ledger until `transaction` is committed.
+
+        The next status entry is only written once the previous one is ready,
+        polling backs off from 50ms up to 1s and gives up after
+        `ledger_ready_timeout` seconds.
+        """
+        if transaction.status == "ready":
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._ledger_ready_timeout
+        delay = 0.05
+        while (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(min(delay, remaining))
+            current = await self._ledger_service.retrieve_transaction(
+                transaction.transaction_id)
+            if current is not None and current.status == "ready":
+                return
+            delay = min(delay * 2, 1.0)
+        self._logger.warning(
+            f"Ledger transaction {transaction.transaction_id} not ready after "
+            f"{self._ledger_ready_timeout}s, continuing")
+
+    async def _save_transactions(self, wait: bool = False):
+        """Saves the ledger entries written so far, all of them if `wait`."""
+        async for payload, ledger_transaction in self._ledger_writes.written(wait):
+            transaction = CatalogTransaction(
+                transaction_id=ledger_transaction.transaction_id,
+                catalog_id=self._catalog_id,
+                payload=payload,
+            )
+            self._logger.info("Saving transaction in repository")
+            await self._transaction_repository.save(transaction)
+
+    async def _update_status(self, status: TaskStatus, wait_ready: bool = False):
+        """Updates the catalog status and queues its ledger entry.
+
+        The entry is written behind the import and saved by
+        `_save_transactions`, the next one is only written once it is ready
+        when `wait_ready` is set.
+        """
         self._logger.info(
             f"Updating catalog {self._catalog_id} status to '{status}'")
         await self._drug_catalog_repository.status_update(self._catalog_id, status)
         self._transaction_data["status"] = status
         self._transaction_data["created_at"] = _created_at()
         self._logger.info("Inserting transaction into ledger")
-        ledger_transaction = self._ledger_service.insert_transaction(
-            self._transaction_data
-        )
-
-        transaction = CatalogTransaction(
-            transaction_id=ledger_transaction.transaction_id,
-            catalog_id=self._catalog_id,
-            payload=self._transaction_data,
-        )
-        self._logger.info("Saving transaction in repository")
-        await self._transaction_repository.save(transaction)
+        await self._ledger_writes.submit(
+            dict(self._transaction_data),
+            self._wait_until_ready if wait_ready else None)
 
     async def prepare_transaction_data(self, filename: str, file_path: str):
         self._logger.info(
@@ -71,23 +114,28 @@ class CatalogImportUseCase:
             catalog_id=str(self._catalog_id),
             created_at_tz="UTC",
         )
-        await self._update_status("created")
-        await asyncio.sleep(2)
+        await self._update_status("created", wait_ready=True)
 
     async def execute(self):
         self._logger.info(f"Starting execution of catalog {self._catalog_id}")
-        await self._update_status("processing")
-        await asyncio.sleep(5)
+        await self._update_status("processing", wait_ready=True)
 
         try:
             self._logger.info("Starting file parsing")
-            self._parser.parse()
+            parser = await self._parser.load()
 
-            self._logger.info("Saving parsed data to database")
-            await self._parser.save_all(self._session, self._catalog_id)
+            self._logger.info(
+                f"Saving parsed data to database ({self._ingestion_engine})")
+            report = await parser.save_all(
+                self._session, self._catalog_id, self._ingestion_engine)
+            await self._drug_catalog_repository.drug_count_update(
+                self._catalog_id, report.rows)
 
+            # a failed ledger entry fails the import before it completes
+            await self._save_transactions(wait=True)
             self._logger.info("Updating status to 'completed'")
             await self._update_status("completed")
+            await self._save_transactions(wait=True)
 
         except Exception as err:
             self._logger.error(f"Catalog ID: {self._catalog_id}")
@@ -99,3 +147,4 @@ class CatalogImportUseCase:
             self._logger.info(
                 "Removing all drug records from catalog due to failure")
             await self._drug_repository.delete_all_by_catalog_id(self._catalog_id)
+            await self._save_transactions(wait=True)
@@ -1,14 +1,18 @@
-from fastapi import UploadFile
+import asyncio
+import logging
+import traceback
 from datetime import datetime, timezone
 
 from src.infrastructure.taskiq.broker import mapping_import_taskiq
 from src.infrastructure.taskiq.mapping_import import MappingsTaskData
-from src.utils.checksum import uploadfile_checksum
+from src.utils.checksum import filepath_checksum
 from src.domain.entities.drug_catalog import TaskStatus
 from src.domain.entities.ltransactions import MappingTransaction, MappingTransactionData
 from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
-from src.infrastructure.services.pandas_parser.mapping.parse import MappingParser
+from src.infrastructure.services.confidential_ledger.write_behind import LedgerWriteBehind
+from src.infrastructure.services.pandas_parser.mapping.parse import MappingParserLoader
 from src.infrastructure.repositories.contract import (
+    MappingRepositoryInterface,
     MappingTransactionRepositoryInterface,
 )
 
@@ -22,40 +26,56 @@ class MappingImportUseCase:
         self,
         transaction_repository: MappingTransactionRepositoryInterface,
         ledger_service: LedgerInterface,
-        mapping_parser: MappingParser,
+        mapping_parser: MappingParserLoader,
         mapping_id: int,
         central_catalog_id: int,
         related_catalog_id: int,
+        chunk_rows: int = 100,
+        chunk_bytes: int | None = None,
+        mapping_repository: MappingRepositoryInterface | None = None,
+        max_in_flight: int | None = None,
+        in_flight_timeout: float = 30.0,
+        logger: logging.Logger = logging.getLogger(__name__)
     ):
         self._transaction_repository = transaction_repository
         self._ledger_service = ledger_service
+        self._ledger_writes = LedgerWriteBehind(ledger_service)
         self._mapping_parser = mapping_parser
         self._mapping_id = mapping_id
         self._central_catalog_id = central_catalog_id
         self._related_catalog_id = related_catalog_id
+        self._chunk_rows = chunk_rows
+        self._chunk_bytes = chunk_bytes
+        self._mapping_repository = mapping_repository
+        # the cap needs the processed chunks counted in the database
+        self._max_in_flight = max_in_flight if mapping_repository else None
+        self._in_flight_timeout = in_flight_timeout
+        self._logger = logger
+
+    async def _save_transactions(self, wait: bool = False):
+        """Saves the ledger entries written so far, all of them if `wait`."""
+        async for payload, ledger_transaction in self._ledger_writes.written(wait):
+            transaction = MappingTransaction(
+                transaction_id=ledger_transaction.transaction_id,
+                mapping_id=self._mapping_id,
+                catalog_id=self._central_catalog_id,
+                related_catalog_id=self._related_catalog_id,
+                payload=payload,
+            )
+            await self._transaction_repository.save(transaction)
 
     async def _update_status(self, status: TaskStatus):
+        # the entry is written behind the import, see _save_transactions
         self._transaction_data["status"] = status
         self._transaction_data["created_at"] = _created_at()
-        ledger_transaction = self._ledger_service.insert_transaction(
-            self._transaction_data
-        )
+        await self._ledger_writes.submit(dict(self._transaction_data))
 
-        transaction = MappingTransaction(
-            transaction_id=ledger_transaction.transaction_id,
-            mapping_id=self._mapping_id,
-            catalog_id=self._central_catalog_id,
-            related_catalog_id=self._related_catalog_id,
-            payload=self._transaction_data,
-        )
-        await self._transaction_repository.save(transaction)
-
-    async def prepare_task(self, file: UploadFile):
+    async def prepare_task(self, filename: str, file_path: str):
         self._transaction_data = MappingTransactionData(
             status="created",
             created_at=_created_at(),
-            filename=file.filename,
-            file_checksum=await uploadfile_checksum(file),
+            filename=filename,
+            file_checksum=await filepath_checksum(file_path),
             created_at_tz="UTC",
             mapping_id=str(self._mapping_id),
             catalog_id=str(self._central_catalog_id),
@@ -63,16 +83,69 @@ class MappingImportUseCase:
         )
         await self._update_status("created")
 
+    async def _wait_for_chunks(self, count: int) -> bool:
+        """Polls the processed chunks until `count` of them are.
+
+        Polling backs off from 50ms up to 1s and gives up after
+        `in_flight_timeout` seconds. This task holds a worker slot while it
+        waits, if the imports waiting took every slot no chunk would finish.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._in_flight_timeout
+        delay = 0.05
+        while True:
+            done = await self._mapping_repository.get_chunks_done(
+                self._mapping_id)
+            if done >= count:
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
     async def execute(self):
         await self._update_status("processing")
 
-        for mappings in self._mapping_parser.parse():
-            data = MappingsTaskData(
-                mappings=mappings,
-                central_catalog_id=self._central_catalog_id,
-                related_catalog_id=self._related_catalog_id,
-                mapping_id=self._mapping_id
-            )
-            await mapping_import_taskiq.kiq(data.model_dump())
+        max_in_flight = self._max_in_flight
+        try:
+            parser = await self._mapping_parser.load()
+            chunks = parser.parse(
+                self._chunk_rows, self._chunk_bytes)
+            if max_in_flight:
+                await self._mapping_repository.start_progress(self._mapping_id)
+            for queued, mappings in enumerate(chunks):
+                # hold the next chunk back while max_in_flight are unprocessed
+                if max_in_flight and queued >= max_in_flight:
+                    if not await self._wait_for_chunks(
+                            queued - max_in_flight + 1):
+                        self._logger.warning(
+                            f"Mapping ID: {self._mapping_id}, no chunk "
+                            f"processed in {self._in_flight_timeout}s, "
+                            "queuing the remaining chunks without a cap")
+                        max_in_flight = None
+
+                data = MappingsTaskData(
+                    mappings=mappings,
+                    central_catalog_id=self._central_catalog_id,
+                    related_catalog_id=self._related_catalog_id,
+                    mapping_id=self._mapping_id,
+                    counted=bool(self._max_in_flight),
+                )
+                await mapping_import_taskiq.kiq(data.model_dump())
+
+            # a failed ledger entry fails the import before it completes
+            await self._save_transactions(wait=True)
+            await self._update_status("completed")
+            await self._save_transactions(wait=True)
+
+        except Exception as err:
+            self._logger.error(f"Mapping ID: {self._mapping_id}")
+            self._logger.error("Error during mapping import: %s\n%s",
+                               err, traceback.format_exc())
+            await self._update_status("failed")
+            await self._save_transactions(wait=True)
 
-        await self._update_status("completed")
+        finally:
+            if self._max_in_flight:
+                await self._mapping_repository.end_progress(self._mapping_id)
@@ -0,0 +1,37 @@
+import asyncio
+from typing import List
+
+from src.utils.cache import TTLCache
+from src.application.dto.transaction import TransactionVerificationDto
+from src.application.use_cases.transaction.verify_transaction import (
+    TransactionVerifier,
+)
+from src.infrastructure.repositories.contract import (
+    CatalogTransactionRepositoryInterface,
+)
+from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
+
+
+class VerifyCatalogTransactionsUseCase:
+    def __init__(
+        self,
+        ct_repository: CatalogTransactionRepositoryInterface,
+        ledger_service: LedgerInterface,
+        cache: TTLCache[str, str | None] | None = None,
+        pending_ttl: float = 5.0,
+    ):
+        self._ct_repository = ct_repository
+        self._verifier = TransactionVerifier(ledger_service, cache, pending_ttl)
+
+    async def execute(self, catalog_id: int) -> List[TransactionVerificationDto]:
+        # payloads come in a single query, only the ledger is hit concurrently
+        transactions = await self._ct_repository.get_all_by_catalog_id(catalog_id)
+        valid = await asyncio.gather(*[
+            self._verifier.is_valid(transaction.transaction_id, transaction.payload)
+            for transaction in transactions
+        ])
+        return [
+            TransactionVerificationDto(
+                transaction_id=transaction.transaction_id, valid=is_valid)
+            for transaction, is_valid in zip(transactions, valid)
+        ]
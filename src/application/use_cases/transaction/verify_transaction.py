@@ -1,26 +1,70 @@
+from src.utils.cache import TTLCache
 from src.utils.checksum import dict_hash
 from src.application.dto.transaction import TransactionDto
 from src.infrastructure.repositories.contract import TransactionRepositoryInterface
 from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
 
 
+_NOT_CACHED = object()
+
+
+class TransactionVerifier:
+    """Checks stored payloads against the hashes recorded in the ledger.
+
+    Ledger entries are immutable once `ready`, their hash is cached without
+    expiry. Entries still processing or not found are cached for `pending_ttl`
+    seconds only. Payloads are never cached, they are what is being verified.
+    """
+
+    def __init__(
+        self,
+        ledger_service: LedgerInterface,
+        cache: TTLCache[str, str | None] | None = None,
+        pending_ttl: float = 5.0,
+    ):
+        self._ledger_service = ledger_service
+        self._cache = cache
+        self._pending_ttl = pending_ttl
+
+    async def _ledger_hash(self, transaction_id: str) -> str | None:
+        if self._cache is not None:
+            cached = self._cache.get(transaction_id, _NOT_CACHED)
+            if cached is not _NOT_CACHED:
+                return cached
+
+        transaction = await self._ledger_service.retrieve_transaction(
+            transaction_id)
+        if transaction is None or transaction.status != "ready":
+            ledger_hash, ttl = None, self._pending_ttl
+        else:
+            ledger_hash, ttl = transaction.transaction_data["hash"], None
+
+        if self._cache is not None:
+            self._cache.set(transaction_id, ledger_hash, ttl=ttl)
+        return ledger_hash
+
+    async def is_valid(self, transaction_id: str, payload: dict) -> bool:
+        ledger_hash = await self._ledger_hash(transaction_id)
+        if ledger_hash is None:
+            return False
+        return dict_hash(payload) == ledger_hash
+
+
 class VerifyTransactionUseCase:
     def __init__(
         self,
         t_repository: TransactionRepositoryInterface,
         ledger_service: LedgerInterface,
+        cache: TTLCache[str, str | None] | None = None,
+        pending_ttl: float = 5.0,
     ):
         self._t_repository = t_repository
-        self._ledger_service = ledger_service
+        self._verifier = TransactionVerifier(ledger_service, cache, pending_ttl)
 
     async def execute(self, transaction_id: str) -> TransactionDto:
         payload = await self._t_repository.get_payload_by_transaction_id(transaction_id)
         if payload is None:
             return TransactionDto(valid=False)
 
-        transaction = self._ledger_service.retrieve_transaction(transaction_id)
-        if transaction is None:
-            return TransactionDto(valid=False)
-
-        valid = dict_hash(payload) == transaction.transaction_data["hash"]
+        valid = await self._verifier.is_valid(transaction_id, payload)
         return TransactionDto(valid=valid)
@@ -5,10 +5,13 @@ from pydantic_settings import BaseSettings
 
 from src.config.settings.base import BaseEnvs
 from src.config.settings.blob import BlobEnvs
+from src.config.settings.database import DatabaseEnvs
+from src.config.settings.imports import ImportEnvs
 from src.config.settings.ledger import LedgerEnvs
 
 
-class Envs(LedgerEnvs, BlobEnvs, BaseEnvs, BaseSettings): ...
+class Envs(
+    DatabaseEnvs, ImportEnvs, LedgerEnvs, BlobEnvs, BaseEnvs, BaseSettings): ...
 
 
 @lru_cache
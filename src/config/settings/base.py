@@ -2,6 +2,9 @@ from typing import List, Literal
 
 
 EnvType = Literal["PROD", "DEV", "TEST"]
+# how paginated drug lists get their total: "EXACT" counts the rows, "ESTIMATED"
+# reads the per-catalog counter kept at import, "NONE" skips it
+CountStrategy = Literal["EXACT", "ESTIMATED", "NONE"]
 
 
 class BaseEnvs:
@@ -14,7 +17,22 @@ class BaseEnvs:
     JWT_SECRET: str = "thisissecret"
     JWT_ACCESS_EXPIRATION: int = 900  # 900 seconds = 15 minutes
     JWT_REFRESH_EXPIRATION: int = 1800  # 1800 seconds = 30 minutes
+    # bcrypt cost of new password hashes, each step doubles the work, and the
+    # threads hashing or checking passwords at once
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    # seconds an authenticated user is kept in memory before it is read again
+    USER_CACHE_TTL: float = 30.0
 
     RABBITMQ_URL: str
     DATABASE_URL: str
     DATABASE_ECHO: bool = False
+
+    DRUG_COUNT_STRATEGY: CountStrategy = "EXACT"
+    # serve /drugs/country/{country} from in-process indexes of completed
+    # catalogs, those above the row limit keep using the database
+    DRUG_AUTOCOMPLETE_INDEX: bool = False
+    DRUG_AUTOCOMPLETE_MAX_ROWS: int = 500_000
+    # seconds catalog lookups of the API stay cached, bounds how late writes
+    # from the worker or other API processes are seen
+    CATALOG_CACHE_TTL: float = 60.0
@@ -0,0 +1,22 @@
+from typing import Literal
+
+Runner = Literal["API", "WORKER"]
+
+
+class DatabaseEnvs:
+    # process kind, set by the container entrypoint, picks the pool profile
+    RUNNER: Runner = "API"
+
+    # the API checks out many connections for short requests, the worker
+    # holds fewer for longer and needs room for bursts of tasks
+    DATABASE_API_POOL_SIZE: int = 10
+    DATABASE_API_MAX_OVERFLOW: int = 10
+    DATABASE_WORKER_POOL_SIZE: int = 5
+    DATABASE_WORKER_MAX_OVERFLOW: int = 20
+    # seconds before a pooled connection is replaced, -1 keeps them forever
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_POOL_PRE_PING: bool = False
+    # asyncpg statement caches per connection, 0 disables them (needed
+    # behind PgBouncer in transaction mode)
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 100
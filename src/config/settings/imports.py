@@ -0,0 +1,28 @@
+from typing import Literal
+from pydantic import Field
+
+IngestionEngine = Literal["ORM", "BULK"]
+
+
+class ImportEnvs:
+    # how parsed drugs are persisted: "ORM" (one object per row) or "BULK"
+    # (COPY on PostgreSQL, multi-row INSERT elsewhere)
+    DRUG_INGESTION_ENGINE: IngestionEngine = "ORM"
+
+    # rows per chunk for parsers that can stream their file (CSV/TSV/XML),
+    # unset to load the whole file at once
+    PARSER_CHUNK_SIZE: int | None = None
+    # processes opening and parsing whole catalog files, 0 parses them in a
+    # thread of the worker instead
+    PARSER_PROCESS_POOL_SIZE: int = 2
+
+    # mapping files are fanned out to the workers in chunks of at most
+    # MAPPING_CHUNK_ROWS rows, optionally capped by their payload size
+    MAPPING_CHUNK_ROWS: int = Field(100, gt=0)
+    MAPPING_CHUNK_BYTES: int | None = Field(None, gt=0)
+    # chunks of a single mapping queued and not processed yet, unset for no
+    # limit. Past MAPPING_IN_FLIGHT_TIMEOUT seconds without progress the
+    # import stops waiting, so imports holding every worker slot cannot
+    # deadlock
+    MAPPING_MAX_IN_FLIGHT: int | None = Field(None, gt=0)
+    MAPPING_IN_FLIGHT_TIMEOUT: float = 30.0
@@ -9,6 +9,13 @@ class LedgerEnvs:
     AZURE_CREDENTIAL_TENNANT_ID: str | None = None
     AZURE_CREDENTIAL_CLIENT_ID: str | None = None
     AZURE_CREDENTIAL_CERTIFICATE_PATH: str | None = None
+    # seconds a catalog import waits for a status entry to be committed
+    # before writing the next one
+    LEDGER_READY_TIMEOUT: float = 10.0
+    # ledger hashes kept by the verification cache, entries that are not
+    # ready yet are retried after LEDGER_VERIFY_PENDING_TTL seconds
+    LEDGER_VERIFY_CACHE_SIZE: int = 10_000
+    LEDGER_VERIFY_PENDING_TTL: float = 5.0
 
     @model_validator(mode="after")
     def check_upload_strategy(cls, values: "BaseEnvs") -> "LedgerEnvs":
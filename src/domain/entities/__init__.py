@@ -3,5 +3,6 @@ from src.domain.entities.user import User as User
 from src.domain.entities.drug import Drug as Drug
 from src.domain.entities.drug_catalog import DrugCatalog as DrugCatalog
 from src.domain.entities.drug_mapping import DrugMapping as DrugMapping
+from src.domain.entities.drug_mapping import MappingImportProgress as MappingImportProgress
 from src.domain.entities.ltransactions import CatalogTransaction as CatalogTransaction
 from src.domain.entities.ltransactions import MappingTransaction as MappingTransaction
@@ -17,6 +17,8 @@ class DrugCatalog(IdMixin, Base):
         sq.String(10), nullable=False, default="created"
     )
     is_central: Mapped[bool] = mapped_column(sq.Boolean, nullable=False, default=False)
+    # drugs saved by the catalog import, None until it completes
+    drug_count: Mapped[int | None] = mapped_column(sq.Integer, nullable=True)
 
     def __init__(
         self,
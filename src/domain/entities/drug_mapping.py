@@ -29,3 +29,21 @@ class DrugMapping(Base):
         self._mapping_id = mapping_id
         self._drug_id = drug_id
         self._related_drug_id = related_drug_id
+
+
+class MappingImportProgress(Base):
+    """Chunks of a mapping import processed so far.
+
+    Only kept while an import caps its chunks in flight, the file import
+    reads it to know when to queue more.
+    """
+    __tablename__ = "mapping_import_progress"
+
+    _mapping_id: Mapped[int] = mapped_column(
+        "mapping_id", sq.BigInteger, primary_key=True, nullable=False
+    )
+    chunks_done: Mapped[int] = mapped_column(sq.Integer, nullable=False)
+
+    def __init__(self, mapping_id: int):
+        self._mapping_id = mapping_id
+        self.chunks_done = 0
@@ -4,6 +4,7 @@ from pydantic import EmailStr
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 
+from src.config.settings import get_config
 from src.infrastructure.db.base import Base, generate_snowflake_id
 
 
@@ -27,13 +28,18 @@ class User(Base):
 
     @password.setter
     def password(self, raw_password: str):
-        """Generates a hash from a plain-text password."""
+        """Generates a hash from a plain-text password, costing BCRYPT_ROUNDS."""
         password_bytes = raw_password.encode("utf-8")
-        password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+        password_hash = bcrypt.hashpw(
+            password_bytes, bcrypt.gensalt(get_config().BCRYPT_ROUNDS))
         self._password = password_hash.decode("utf-8")
 
     def verify_password(self, raw_password: str) -> bool:
-        """Verifies a plain-text password against the stored hash."""
+        """Verifies a plain-text password against the stored hash.
+
+        The cost is the one the hash was made with. Blocks for the whole
+        check, async code goes through `password_service.verify_password`.
+        """
         return bcrypt.checkpw(
             raw_password.encode("utf-8"), self.password.encode("utf-8")
         )
@@ -0,0 +1,37 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config.settings import get_config
+from src.domain.entities.user import User
+
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_password_executor() -> ThreadPoolExecutor:
+    """Threads running bcrypt, sized by PASSWORD_HASH_WORKERS.
+
+    bcrypt releases the GIL while hashing, so the event loop keeps serving
+    requests. The pool bounds how many hashes run at once, further logins
+    queue for a free thread.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            get_config().PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+    return _executor
+
+
+def shutdown_password_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def verify_password(user: User, raw_password: str) -> bool:
+    """`User.verify_password` run off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_password_executor(), user.verify_password, raw_password)
+
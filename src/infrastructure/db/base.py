@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List, Type, TypeVar
 import sqlalchemy as sq
 from functools import lru_cache
 from pydantic_core import core_schema
@@ -8,6 +8,8 @@ from sqlalchemy.orm import Mapped, mapped_column, declarative_base
 
 Base = declarative_base()
 
+E = TypeVar("E")
+
 
 @lru_cache(maxsize=1)
 def __get_snowflake_generator(instance: int = 1):
@@ -19,6 +21,45 @@ def generate_snowflake_id() -> int:
     return next(snowflake_gen)
 
 
+def generate_snowflake_ids(count: int) -> List[int]:
+    """Generates `count` snowflake ids in one go.
+
+    The generator yields None once the sequence of the current millisecond
+    is exhausted, those values are skipped until the clock moves on.
+    """
+    snowflake_gen = __get_snowflake_generator()
+    ids = []
+    while len(ids) < count:
+        snowflake_id = next(snowflake_gen)
+        if snowflake_id is not None:
+            ids.append(snowflake_id)
+    return ids
+
+
+def column_snapshot(
+    entity: Any, keys: Iterable[str] | None = None
+) -> Dict[str, Any]:
+    """Column values of a loaded entity, all of them unless `keys` are given.
+
+    Unlike the entity, the values stay readable once its session rolls back
+    or closes, which makes them safe to keep across requests.
+    """
+    if keys is None:
+        keys = [attr.key for attr in sq.inspect(entity).mapper.column_attrs]
+    return {key: getattr(entity, key) for key in keys}
+
+
+def from_snapshot(entity_class: Type[E], snapshot: Dict[str, Any]) -> E:
+    """A new transient entity holding the values of `column_snapshot`.
+
+    `__init__` is skipped, the entity belongs to no session.
+    """
+    entity = sq.inspect(entity_class).class_manager.new_instance()
+    for key, value in snapshot.items():
+        setattr(entity, key, value)
+    return entity
+
+
 class IdMixin:
     _id: Mapped[int] = mapped_column(
         "id",
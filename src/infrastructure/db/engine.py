@@ -1,12 +1,43 @@
-from src.config.settings import get_config
+from typing import Dict
+
+from src.config.settings import Envs, get_config
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+
+
+def engine_options(config: Envs) -> dict:
+    """Keyword arguments of the engine for the pool profile of `RUNNER`."""
+    options = {"echo": config.DATABASE_ECHO}
+    url = make_url(config.DATABASE_URL)
+    # SQLite (tests) uses a single connection pool without these settings
+    if url.get_backend_name() != "postgresql":
+        return options
+
+    if config.RUNNER == "WORKER":
+        pool_size = config.DATABASE_WORKER_POOL_SIZE
+        max_overflow = config.DATABASE_WORKER_MAX_OVERFLOW
+    else:
+        pool_size = config.DATABASE_API_POOL_SIZE
+        max_overflow = config.DATABASE_API_MAX_OVERFLOW
+    options.update(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=config.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=config.DATABASE_POOL_PRE_PING,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": config.DATABASE_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size":
+                config.DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+        }
+    return options
 
 
 _async_engine = create_async_engine(
-    get_config().DATABASE_URL,
-    echo=get_config().DATABASE_ECHO,
-)
+    get_config().DATABASE_URL, **engine_options(get_config()))
 
 AsyncLocalSession = async_sessionmaker(
     _async_engine, autoflush=False, expire_on_commit=False
@@ -18,6 +49,13 @@ class Base(DeclarativeBase):
 
 
 async def get_session():
+    """Request session, shared by every dependency of the same request.
+
+    FastAPI caches dependencies per request, so `manager` and the route get
+    the same session and a single connection. Security scopes are part of
+    that cache key: reaching it through `Security(..., scopes=...)` opens a
+    second session.
+    """
     async with AsyncLocalSession() as session:
         try:
             yield session
@@ -36,3 +74,17 @@ async def create_all():
 async def drop_all():
     async with _async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+def pool_status(engine: AsyncEngine = _async_engine) -> Dict[str, int | None]:
+    """Occupancy of the connection pool, None where the pool has no limit."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return dict.fromkeys(("size", "checked_out", "checked_in", "overflow"))
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # negative until the pool has opened `size` connections
+        "overflow": max(pool.overflow(), 0),
+    }
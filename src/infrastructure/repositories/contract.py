@@ -1,7 +1,7 @@
 from pydantic import EmailStr
 from sqlalchemy import Sequence
 from dataclasses import dataclass
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Set, Tuple, TypeVar
 from abc import abstractmethod, ABC
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,9 +24,10 @@ T = TypeVar("T")
 @dataclass
 class PagedItems(Generic[T]):
     items: Sequence[T]
-    total_count: int
+    total_count: int | None
     current_page: int
     page_size: int
+    has_next: bool = False
 
 
 class BaseRepository(ABC):
@@ -80,6 +81,11 @@ class DrugCatalogRepositoryInterface(BaseRepository):
         """Update the import status of a drug catalog."""
         ...
 
+    @abstractmethod
+    async def drug_count_update(self, drug_catalog_id: int, drug_count: int):
+        """Update the number of drugs imported into a drug catalog."""
+        ...
+
     @abstractmethod
     async def get_central(self) -> DrugCatalog | None:
         """Check if a central drug catalog exists."""
@@ -121,10 +127,17 @@ class DrugRepositoryInterface(BaseRepository):
         ...
 
     @abstractmethod
-    async def get_all_like_code_or_name_by_catalog_id(
-        self, catalog_id: int, name_or_code: str
+    async def search_by_catalog_id(
+        self, catalog_id: int, name_or_code: str, limit: int
     ) -> List[Drug]:
-        """Get all drugs that match the given name or code."""
+        """Get up to `limit` drugs matching the given name or code, best first."""
+        ...
+
+    @abstractmethod
+    async def get_search_entries_by_catalog_id(
+        self, catalog_id: int
+    ) -> List[Tuple[int, str, str]]:
+        """Get the id, code and name of every drug of a specific catalog ID."""
         ...
 
     @abstractmethod
@@ -141,8 +154,23 @@ class DrugRepositoryInterface(BaseRepository):
         page_size: int,
         drug_catalog_id: int,
         name_or_code_filter: str = None,
+        with_total: bool = True,
     ) -> PagedItems[Drug]:
-        """Get paginated drugs, optionally filtered by name or code."""
+        """Get paginated drugs, optionally filtered by name or code.
+
+        The total is only counted when `with_total` is set.
+        """
+        ...
+
+    @abstractmethod
+    async def get_page_after_id(
+        self,
+        after_id: int | None,
+        page_size: int,
+        drug_catalog_id: int,
+        name_or_code_filter: str = None,
+    ) -> List[Drug]:
+        """Get the drugs following `after_id`, optionally filtered by name or code."""
         ...
 
 
@@ -161,6 +189,15 @@ class MappingRepositoryInterface(BaseRepository):
         """Save a drug to the database."""
         ...
 
+    @abstractmethod
+    async def save_many(
+        self, mappings: List[DrugMapping]
+    ) -> Set[Tuple[int, int]]:
+        """Save mappings in one statement, skipping the existing ones.
+
+        Returns the (drug_id, related_drug_id) pairs actually inserted."""
+        ...
+
     @abstractmethod
     async def get_drugs_id_by_related_to(self, related_to: int) -> List[int]:
         """Get all drugs id associated with a specific related_to ID."""
@@ -183,6 +220,26 @@ class MappingRepositoryInterface(BaseRepository):
         """Delete all mappings associated with a specific mapping ID."""
         ...
 
+    @abstractmethod
+    async def start_progress(self, mapping_id: int):
+        """Start counting the processed chunks of a mapping import."""
+        ...
+
+    @abstractmethod
+    async def chunk_done(self, mapping_id: int):
+        """Count one more processed chunk, if the import is counted."""
+        ...
+
+    @abstractmethod
+    async def get_chunks_done(self, mapping_id: int) -> int:
+        """Get the processed chunks of a mapping import, 0 if not counted."""
+        ...
+
+    @abstractmethod
+    async def end_progress(self, mapping_id: int):
+        """Stop counting the processed chunks of a mapping import."""
+        ...
+
 
 class TransactionRepositoryInterface(BaseRepository):
     @abstractmethod
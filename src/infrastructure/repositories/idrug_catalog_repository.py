@@ -1,11 +1,19 @@
 from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dto.drug_catalog_dto import CountryCode
+from src.config.settings import get_config
 from src.domain.entities.drug_catalog import DrugCatalog, TaskStatus
+from src.infrastructure.db.base import column_snapshot, from_snapshot
 from src.infrastructure.repositories.contract import (
     DrugCatalogRepositoryInterface,
     PagedItems,
 )
+from src.utils.cache import TTLCache
+
+
+# read on most drug and mapping requests, built once
+_SELECT_CENTRAL = select(DrugCatalog).where(DrugCatalog.is_central.is_(True))
 
 
 class IDrugCatalogRepository(DrugCatalogRepositoryInterface):
@@ -30,9 +38,16 @@ class IDrugCatalogRepository(DrugCatalogRepositoryInterface):
             stmt = stmt.values(is_central=False)
         await self.session.execute(stmt)
 
+    async def drug_count_update(self, drug_catalog_id: int, drug_count: int):
+        stmt = (
+            update(DrugCatalog)
+            .where(DrugCatalog._id == drug_catalog_id)
+            .values(drug_count=drug_count)
+        )
+        await self.session.execute(stmt)
+
     async def get_central(self):
-        stmt = select(DrugCatalog).where(DrugCatalog.is_central.is_(True))
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_SELECT_CENTRAL)
         return result.scalars().one_or_none()
 
     async def get_total_count(self, name_filter: str = None) -> int:
@@ -69,3 +84,74 @@ class IDrugCatalogRepository(DrugCatalogRepositoryInterface):
             current_page=page, page_size=page_size,
             total_count=total_count, items=items
         )
+
+
+# statuses a catalog leaves only through a write made in this process
+_SETTLED_STATUSES = ("completed", "failed")
+_NOT_CACHED = object()
+
+_catalog_cache: TTLCache[tuple, dict | None] | None = None
+
+
+def get_catalog_cache() -> TTLCache[tuple, dict | None]:
+    """Process-wide cache of catalog lookups shared by the cached repository."""
+    global _catalog_cache
+    if _catalog_cache is None:
+        _catalog_cache = TTLCache(ttl=get_config().CATALOG_CACHE_TTL)
+    return _catalog_cache
+
+
+class ICachedDrugCatalogRepository(IDrugCatalogRepository):
+    """Catalog repository keeping lookups by id, central and country in memory.
+
+    Only catalogs whose import has settled are cached, along with lookups
+    that found nothing, so a status the worker is still changing is always
+    read from the database. Every write through this repository clears the
+    cache, writes made by other processes are picked up once entries expire.
+
+    The cache holds column values, never the loaded instance: that one is
+    expired by a rollback of the session that loaded it. Every hit returns a
+    new transient catalog, belonging to no session.
+    """
+
+    def __init__(
+        self, session: AsyncSession,
+        cache: TTLCache[tuple, dict | None] | None = None,
+    ):
+        super().__init__(session)
+        self._cache = cache if cache is not None else get_catalog_cache()
+
+    async def _cached(self, key: tuple, load, *args):
+        snapshot = self._cache.get(key, _NOT_CACHED)
+        if snapshot is not _NOT_CACHED:
+            return snapshot and from_snapshot(DrugCatalog, snapshot)
+        catalog = await load(*args)
+        if catalog is None:
+            self._cache.set(key, None)
+        elif catalog.status in _SETTLED_STATUSES:
+            self._cache.set(key, column_snapshot(catalog))
+        return catalog
+
+    async def save(self, drug_catalog: DrugCatalog):
+        drug_catalog = await super().save(drug_catalog)
+        self._cache.clear()
+        return drug_catalog
+
+    async def status_update(self, drug_catalog_id: int, status: TaskStatus):
+        await super().status_update(drug_catalog_id, status)
+        self._cache.clear()
+
+    async def drug_count_update(self, drug_catalog_id: int, drug_count: int):
+        await super().drug_count_update(drug_catalog_id, drug_count)
+        self._cache.clear()
+
+    async def get_by_id(self, drug_catalog_id: int):
+        return await self._cached(
+            ("id", drug_catalog_id), super().get_by_id, drug_catalog_id)
+
+    async def get_central(self):
+        return await self._cached(("central",), super().get_central)
+
+    async def get_first_by_country(self, country: CountryCode):
+        return await self._cached(
+            ("country", country), super().get_first_by_country, country)
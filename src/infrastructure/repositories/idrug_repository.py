@@ -1,10 +1,24 @@
-from typing import Dict, List
-from sqlalchemy import delete, func
+from typing import Dict, List, Tuple
+from sqlalchemy import bindparam, case, delete, func
 from sqlalchemy.future import select
 
 from src.domain.entities import Drug
 from src.infrastructure.repositories.contract import DrugRepositoryInterface, PagedItems
 
+# hot lookups are built once, their cache key and compiled form are reused
+_SELECT_DRUG_BY_ID = select(Drug).where(Drug._id == bindparam("id"))
+
+# pg_trgm splits terms in three character chunks
+_TRIGRAM_MIN_LENGTH = 3
+
+
+def _name_or_code_like(name_or_code: str):
+    # same predicate everywhere so both trigram indexes serve every query
+    return (
+        Drug.drug_name.ilike(f"%{name_or_code}%")
+        | Drug.drug_code.ilike(f"%{name_or_code}%")
+    )
+
 
 class IDrugRepository(DrugRepositoryInterface):
     async def save(self, drug: Drug) -> Drug:
@@ -14,8 +28,7 @@ class IDrugRepository(DrugRepositoryInterface):
         return drug
 
     async def get_by_id(self, id: int):
-        query = select(Drug).where(Drug._id == id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(_SELECT_DRUG_BY_ID, {"id": id})
         drug = result.scalar_one_or_none()
         return drug
 
@@ -33,21 +46,54 @@ class IDrugRepository(DrugRepositoryInterface):
         result = await self.session.execute(stmt)
         return {drug_code: id for id, drug_code in result.all()}
 
-    async def get_all_like_code_or_name_by_catalog_id(
-        self, catalog_id: int, name_or_code: str
+    async def search_by_catalog_id(
+        self, catalog_id: int, name_or_code: str, limit: int
     ) -> List[Drug]:
-        query = (
+        stmt = (
             select(Drug)
             .where(Drug._catalog_id == catalog_id)
+            .limit(limit)
+        )
+        if not name_or_code:
+            result = await self.session.execute(stmt.order_by(Drug._id))
+            return result.scalars().all()
+
+        code_prefix = Drug.drug_code.ilike(f"{name_or_code}%")
+        name_prefix = Drug.drug_name.ilike(f"{name_or_code}%")
+        if len(name_or_code) < _TRIGRAM_MIN_LENGTH:
+            # shorter terms have no trigram to look up, prefixes only
+            stmt = stmt.where(code_prefix | name_prefix)
+        else:
+            stmt = stmt.where(_name_or_code_like(name_or_code))
+
+        # exact codes first, then code and name prefixes, then the rest
+        rank = case(
+            (Drug.drug_code.ilike(name_or_code), 0),
+            (code_prefix, 1),
+            (name_prefix, 2),
+            else_=3,
+        )
+        order_by = [rank]
+        if self.session.get_bind().dialect.name == "postgresql":
+            order_by.append(func.greatest(
+                func.similarity(Drug.drug_name, name_or_code),
+                func.similarity(Drug.drug_code, name_or_code),
+            ).desc())
+        stmt = stmt.order_by(*order_by, Drug._id)
+
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_search_entries_by_catalog_id(
+        self, catalog_id: int
+    ) -> List[Tuple[int, str, str]]:
+        stmt = (
+            select(Drug._id, Drug.drug_code, Drug.drug_name)
+            .where(Drug._catalog_id == catalog_id)
             .order_by(Drug._id)
-            .where(
-                (Drug.drug_name.ilike(f"%{name_or_code}%"))
-                | (Drug.drug_code.ilike(f"%{name_or_code}%"))
-            )
         )
-        result = await self.session.execute(query)
-        drugs = result.scalars().all()
-        return drugs
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
 
     async def get_total_count(
         self, drug_catalog_id: int, name_or_code_filter: str = None
@@ -57,9 +103,7 @@ class IDrugRepository(DrugRepositoryInterface):
         )
         if name_or_code_filter:
             count_statement = count_statement.where(
-                (Drug.drug_name.ilike(f"%{name_or_code_filter}%"))
-                | (Drug.drug_name.ilike(f"%{name_or_code_filter}%"))
-            )
+                _name_or_code_like(name_or_code_filter))
         return await self.session.scalar(count_statement)
 
     async def get_paginated_by_catalog_id(
@@ -68,27 +112,67 @@ class IDrugRepository(DrugRepositoryInterface):
         page_size: int,
         drug_catalog_id: int,
         name_or_code_filter: str = None,
+        with_total: bool = True,
     ):
         offset = (page - 1) * page_size
+        # one extra row tells whether a next page exists without counting
+        columns = [Drug]
+        if with_total:
+            # counted over the filtered rows before OFFSET/LIMIT apply, the
+            # predicate is evaluated once for both the page and the total
+            columns.append(func.count().over().label("total_count"))
         stmt = (
-            select(Drug)
+            select(*columns)
             .where(Drug._catalog_id == drug_catalog_id)
             .order_by(Drug._id)
             .offset(offset)
-            .limit(page_size)
+            .limit(page_size + 1)
         )
 
         if name_or_code_filter:
-            stmt = stmt.where(
-                (Drug.drug_name.ilike(f"%{name_or_code_filter}%"))
-                | (Drug.drug_code.ilike(f"%{name_or_code_filter}%"))
-            )
+            stmt = stmt.where(_name_or_code_like(name_or_code_filter))
 
         result = await self.session.execute(stmt)
-        items = result.scalars().all()
-
-        total_count = await self.get_total_count(drug_catalog_id, name_or_code_filter)
+        total_count = None
+        if not with_total:
+            items = result.scalars().all()
+        else:
+            rows = result.all()
+            items = [row[0] for row in rows]
+            if rows:
+                total_count = rows[0].total_count
+            elif offset:
+                # past the last page no row carries the window count
+                total_count = await self.get_total_count(
+                    drug_catalog_id, name_or_code_filter)
+            else:
+                total_count = 0
 
         return PagedItems[Drug](
-            current_page=page, page_size=page_size, total_count=total_count, items=items
+            current_page=page, page_size=page_size, total_count=total_count,
+            items=items[:page_size], has_next=len(items) > page_size
         )
+
+    async def get_page_after_id(
+        self,
+        after_id: int | None,
+        page_size: int,
+        drug_catalog_id: int,
+        name_or_code_filter: str = None,
+    ):
+        # keyset pagination, idx_drugs_catalog_id_id seeks straight to the
+        # cursor instead of skipping every previous row
+        stmt = (
+            select(Drug)
+            .where(Drug._catalog_id == drug_catalog_id)
+            .order_by(Drug._id)
+            .limit(page_size)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Drug._id > after_id)
+
+        if name_or_code_filter:
+            stmt = stmt.where(_name_or_code_like(name_or_code_filter))
+
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
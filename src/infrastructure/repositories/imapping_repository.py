@@ -1,17 +1,39 @@
-from typing import List
-from sqlalchemy import delete, func
+from typing import List, Set, Tuple
+from sqlalchemy import bindparam, delete, func, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 
 from src.domain.entities.drug import Drug
 from src.domain.entities.drug_catalog import DrugCatalog
-from src.domain.entities.drug_mapping import DrugMapping
+from src.domain.entities.drug_mapping import DrugMapping, MappingImportProgress
 from src.infrastructure.repositories.contract import (
     CentralDrugMapping,
     MappingRepositoryInterface,
 )
 
 
+# mappings shown with every central drug, built once
+_SELECT_MAPPINGS_BY_CENTRAL_DRUG_ID = (
+    select(
+        Drug._id.label("id"),
+        Drug.drug_code.label("drug_code"),
+        Drug.drug_name.label("drug_name"),
+        DrugCatalog.country.label("country"),
+        Drug.properties.label("properties"),
+    )
+    .select_from(DrugMapping)
+    .join(Drug, Drug._id == DrugMapping._related_drug_id)
+    .join(DrugCatalog, Drug._catalog_id == DrugCatalog._id)
+    .where(DrugMapping._drug_id == bindparam("central_drug_id"))
+)
+
+# asyncpg refuses statements with more bind parameters than this, every
+# inserted mapping takes three
+_MAX_BIND_PARAMS = 32767
+_ROWS_PER_INSERT = _MAX_BIND_PARAMS // 3
+
+
 class IMappingRepository(MappingRepositoryInterface):
     async def save(self, mapping: DrugMapping):
         try:
@@ -22,6 +44,38 @@ class IMappingRepository(MappingRepositoryInterface):
             await self.session.rollback()
             return False
 
+    async def save_many(
+        self, mappings: List[DrugMapping]
+    ) -> Set[Tuple[int, int]]:
+        if not mappings:
+            return set()
+
+        dialect = self.session.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        table = DrugMapping.__table__
+        created = set()
+        # large chunks are split into several statements, one transaction
+        for start in range(0, len(mappings), _ROWS_PER_INSERT):
+            stmt = (
+                insert(table)
+                .values([
+                    {
+                        "mapping_id": mapping._mapping_id,
+                        "drug_id": mapping._drug_id,
+                        "related_drug_id": mapping._related_drug_id,
+                    }
+                    for mapping in mappings[start:start + _ROWS_PER_INSERT]
+                ])
+                .on_conflict_do_nothing(
+                    index_elements=[table.c.drug_id, table.c.related_drug_id])
+                .returning(table.c.drug_id, table.c.related_drug_id)
+            )
+            result = await self.session.execute(stmt)
+            created.update(
+                (row.drug_id, row.related_drug_id) for row in result)
+        await self.session.commit()
+        return created
+
     async def get_total_count(self) -> int:
         count_statement = select(func.count(DrugMapping._drug_id))
         return await self.session.scalar(count_statement)
@@ -39,21 +93,9 @@ class IMappingRepository(MappingRepositoryInterface):
     async def get_mappings_by_central_drug_id(
         self, central_drug_id: int
     ) -> List[CentralDrugMapping]:
-        stmt = (
-            select(
-                Drug._id.label("id"),
-                Drug.drug_code.label("drug_code"),
-                Drug.drug_name.label("drug_name"),
-                DrugCatalog.country.label("country"),
-                Drug.properties.label("properties"),
-            )
-            .select_from(DrugMapping)
-            .join(Drug, Drug._id == DrugMapping._related_drug_id)
-            .join(DrugCatalog, Drug._catalog_id == DrugCatalog._id)
-            .where(DrugMapping._drug_id == central_drug_id)
-        )
-
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            _SELECT_MAPPINGS_BY_CENTRAL_DRUG_ID,
+            {"central_drug_id": central_drug_id})
         rows = result.fetchall()
         return [
             CentralDrugMapping(
@@ -71,3 +113,31 @@ class IMappingRepository(MappingRepositoryInterface):
             DrugMapping._mapping_id == mapping_id)
         await self.session.execute(query)
         await self.session.commit()
+
+    async def start_progress(self, mapping_id: int):
+        # a retried import starts counting again
+        await self.session.execute(delete(MappingImportProgress).where(
+            MappingImportProgress._mapping_id == mapping_id))
+        self.session.add(MappingImportProgress(mapping_id))
+        await self.session.commit()
+
+    async def chunk_done(self, mapping_id: int):
+        await self.session.execute(
+            update(MappingImportProgress)
+            .where(MappingImportProgress._mapping_id == mapping_id)
+            .values(chunks_done=MappingImportProgress.chunks_done + 1)
+        )
+        await self.session.commit()
+
+    async def get_chunks_done(self, mapping_id: int) -> int:
+        chunks_done = await self.session.scalar(
+            select(MappingImportProgress.chunks_done)
+            .where(MappingImportProgress._mapping_id == mapping_id))
+        # read again on the next call instead of from this transaction
+        await self.session.commit()
+        return chunks_done or 0
+
+    async def end_progress(self, mapping_id: int):
+        await self.session.execute(delete(MappingImportProgress).where(
+            MappingImportProgress._mapping_id == mapping_id))
+        await self.session.commit()
@@ -1,8 +1,17 @@
 from pydantic import EmailStr
+from sqlalchemy import bindparam
 from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.settings import get_config
 from src.domain.entities.user import User
+from src.infrastructure.db.base import column_snapshot, from_snapshot
 from src.infrastructure.repositories.contract import UserRepositoryInterface
+from src.utils.cache import TTLCache
+
+
+# looked up on every authenticated request, built once
+_SELECT_USER_BY_SUB = select(User).where(User.sub == bindparam("sub"))
 
 
 class IUserRepository(UserRepositoryInterface):
@@ -10,11 +19,12 @@ class IUserRepository(UserRepositoryInterface):
         self.session.add(user)
         await self.session.commit()
         await self.session.refresh(user)
+        # whatever repository wrote it, the cached copy is now stale
+        get_user_cache().pop(user.sub)
         return user
 
     async def get_by_sub(self, sub: int):
-        query = select(User).where(User.sub == sub)
-        result = await self.session.execute(query)
+        result = await self.session.execute(_SELECT_USER_BY_SUB, {"sub": sub})
         user = result.scalar_one_or_none()
         return user
 
@@ -23,3 +33,48 @@ class IUserRepository(UserRepositoryInterface):
         result = await self.session.execute(query)
         user = result.scalar_one_or_none()
         return user
+
+
+# what authenticated requests read of a user, the password hash stays out
+_CACHED_COLUMNS = ("sub", "name", "email")
+
+_user_cache: TTLCache[int, dict] | None = None
+
+
+def get_user_cache() -> TTLCache[int, dict]:
+    """Process-wide cache of authenticated users by `sub`."""
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = TTLCache(ttl=get_config().USER_CACHE_TTL)
+    return _user_cache
+
+
+class ICachedUserRepository(IUserRepository):
+    """User repository keeping users found by `sub` in memory.
+
+    Only the sub, name and email are kept, never the loaded instance, which
+    a rollback of its session expires. Hits return a new transient user
+    without a password hash. Saving a user drops its entry. Changes made by
+    other processes, removed users included, are seen once the entry
+    expires.
+    """
+
+    def __init__(
+        self, session: AsyncSession, cache: TTLCache[int, dict] | None = None
+    ):
+        super().__init__(session)
+        self._cache = cache if cache is not None else get_user_cache()
+
+    async def save(self, user: User) -> User:
+        user = await super().save(user)
+        self._cache.pop(user.sub)
+        return user
+
+    async def get_by_sub(self, sub: int):
+        snapshot = self._cache.get(sub)
+        if snapshot is not None:
+            return from_snapshot(User, snapshot)
+        user = await super().get_by_sub(sub)
+        if user is not None:
+            self._cache.set(sub, column_snapshot(user, _CACHED_COLUMNS))
+        return user
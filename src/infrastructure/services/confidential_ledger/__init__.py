@@ -1,5 +1,7 @@
 from typing import Literal
 
+from src.config.settings import Envs, get_config
+from src.utils.cache import TTLCache
 from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
 from src.infrastructure.services.confidential_ledger.iazure_ledger import AzureLedger
 from src.infrastructure.services.confidential_ledger.ifake_json_ledger import (
@@ -25,3 +27,46 @@ def ledger_builder(
         )
     else:
         return FakeJsonLedger()
+
+
+# one ledger per process, its client keeps the connection pool and the
+# credential keeps its access token cached between calls
+_ledger: LedgerInterface | None = None
+
+
+def startup_ledger(config: Envs) -> LedgerInterface:
+    """Builds the process-wide ledger, called from the app and worker startup."""
+    global _ledger
+    if _ledger is None:
+        _ledger = ledger_builder(
+            config.AZURE_LEDGER_URL,
+            config.AZURE_LEDGER_CERTIFICATE_PATH,
+            config.AZURE_CREDENTIAL_TENNANT_ID,
+            config.AZURE_CREDENTIAL_CLIENT_ID,
+            config.AZURE_CREDENTIAL_CERTIFICATE_PATH,
+            config.ENVIRONMENT
+        )
+    return _ledger
+
+
+async def shutdown_ledger():
+    global _ledger
+    if _ledger is not None:
+        await _ledger.close()
+        _ledger = None
+
+
+def get_ledger() -> LedgerInterface:
+    """Dependency returning the process-wide ledger, built on first use."""
+    return startup_ledger(get_config())
+
+
+_verification_cache: TTLCache[str, str | None] | None = None
+
+
+def get_verification_cache() -> TTLCache[str, str | None]:
+    """Dependency returning the process-wide cache of verified ledger hashes."""
+    global _verification_cache
+    if _verification_cache is None:
+        _verification_cache = TTLCache(get_config().LEDGER_VERIFY_CACHE_SIZE)
+    return _verification_cache
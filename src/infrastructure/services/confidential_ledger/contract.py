@@ -18,9 +18,12 @@ class TransactionInserted(BaseSchema):
 
 class LedgerInterface(ABC):
     @abstractmethod
-    def insert_transaction(self, data: dict) -> TransactionInserted:
+    async def insert_transaction(self, data: dict) -> TransactionInserted:
         pass
 
     @abstractmethod
-    def retrieve_transaction(self, transaction_id: str) -> TransactionInserted | None:
+    async def retrieve_transaction(self, transaction_id: str) -> TransactionInserted | None:
         pass
+
+    async def close(self) -> None:
+        """Releases the connections held by the ledger client, if any."""
@@ -1,9 +1,9 @@
 import json
 from typing import Dict, TypedDict
-from azure.identity import CertificateCredential
+from azure.identity.aio import CertificateCredential
 from azure.core.exceptions import HttpResponseError
 from azure.core.exceptions import ResourceNotFoundError
-from azure.confidentialledger import ConfidentialLedgerClient
+from azure.confidentialledger.aio import ConfidentialLedgerClient
 
 from src.utils.checksum import dict_hash
 from src.infrastructure.services.confidential_ledger.contract import (
@@ -14,7 +14,7 @@ from src.infrastructure.services.confidential_ledger.contract import (
 
 class LedgerEntry(TypedDict):
     transactionId: str
-    contents: str
+    collectionId: str
 
 
 class AzureLedger(LedgerInterface):
@@ -36,28 +36,30 @@ class AzureLedger(LedgerInterface):
             credential=credential,
             ledger_certificate_path=azure_ledger_certificate_path
         )
+        self.credential = credential
         self.ledger_client = ledger_client
 
-    def insert_transaction(self, data: Dict):
+    async def insert_transaction(self, data: Dict):
         sample_entry = {"contents": json.dumps({
             "data": data, "hash": dict_hash(data)
         })}
         print(f"Inserting transaction with data: \n {sample_entry}")
 
-        self.ledger_client.create_ledger_entry(entry=sample_entry)
-        latest_entry: LedgerEntry = self.ledger_client.get_current_ledger_entry()
-        transaction_id = latest_entry["transactionId"]
+        # the write response carries the id of its own transaction
+        created_entry: LedgerEntry = await self.ledger_client.create_ledger_entry(
+            entry=sample_entry)
+        transaction_id = created_entry["transactionId"]
 
         return TransactionInserted(
             status="processing",
             transaction_id=transaction_id,
         )
 
-    def retrieve_transaction(self, transaction_id: str):
+    async def retrieve_transaction(self, transaction_id: str):
         try:
-            poller = self.ledger_client.begin_get_ledger_entry(
+            poller = await self.ledger_client.begin_get_ledger_entry(
                 str(transaction_id))
-            entry = poller.result()
+            entry = await poller.result()
 
             data = TransactionInserted(
                 transaction_id=transaction_id, status="processing"
@@ -70,3 +72,7 @@ class AzureLedger(LedgerInterface):
             return None
         except HttpResponseError:
             return None
+
+    async def close(self):
+        await self.ledger_client.close()
+        await self.credential.close()
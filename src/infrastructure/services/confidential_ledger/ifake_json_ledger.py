@@ -1,4 +1,7 @@
+import os
 import json
+import asyncio
+import threading
 from uuid import uuid4
 from pathlib import Path
 
@@ -9,41 +12,100 @@ from src.infrastructure.services.confidential_ledger.contract import (
 from src.utils.checksum import dict_hash
 
 
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(f) -> None:
+        # a lock on the first byte stands for the whole file, appends still
+        # go to the end
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f) -> None:
+        fcntl.flock(f, fcntl.LOCK_EX)
+
+    def _unlock_file(f) -> None:
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
 class FakeJsonLedger(LedgerInterface):
+    """Local stand-in for the confidential ledger.
+
+    Entries are appended to a JSON-lines file and indexed in memory by their
+    transaction id, the file is loaded when the ledger is built. Appends hold
+    an exclusive file lock so several processes can share the file, lookups of
+    unknown ids first read the lines other processes appended since.
+    """
+
     _instance = None
-    _db_file = Path("fake_ledger_db.json")
+    _db_file = Path("fake_ledger_db.jsonl")
+    # the file is read and appended to from worker threads
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super(FakeJsonLedger, cls).__new__(cls)
+            cls._instance._index = {}
+            cls._instance._offset = 0
+            with cls._lock:
+                cls._instance._read_new_lines()
         return cls._instance
 
-    def _read_db(self) -> dict:
+    def _read_new_lines(self) -> None:
         if not self._db_file.exists():
-            self._db_file.write_text("{}")
-        with self._db_file.open("r") as f:
-            return json.load(f)
+            return
+        with self._db_file.open("rb") as f:
+            f.seek(self._offset)
+            for line in f:
+                # another process is still writing this line
+                if not line.endswith(b"\n"):
+                    break
+                transaction = json.loads(line)
+                self._index[transaction["transaction_id"]] = transaction
+                self._offset += len(line)
+
+    def _insert(self, transaction: dict) -> None:
+        line = (json.dumps(transaction, default=str) + "\n").encode()
+        with self._lock:
+            with self._db_file.open("ab") as f:
+                _lock_file(f)
+                try:
+                    start = f.seek(0, os.SEEK_END)
+                    f.write(line)
+                    f.flush()
+                finally:
+                    _unlock_file(f)
+            self._index[transaction["transaction_id"]] = transaction
+            # skip our own line on the next read, unless lines of another
+            # process came before it
+            if start == self._offset:
+                self._offset += len(line)
 
-    def _write_db(self, data: dict) -> None:
-        with self._db_file.open("w") as f:
-            json.dump(data, f, default=str, indent=2)
+    def _retrieve(self, transaction_id: str) -> dict | None:
+        with self._lock:
+            if transaction_id not in self._index:
+                self._read_new_lines()
+            return self._index.get(transaction_id, None)
 
-    def insert_transaction(self, data: dict) -> TransactionInserted:
+    async def insert_transaction(self, data: dict) -> TransactionInserted:
         transaction_id = str(uuid4())
         transaction = {
             "transaction_id": transaction_id,
             "status": "ready",
             "transaction_data": {"data": data, "hash": dict_hash(data)},
         }
-        db = self._read_db()
-        db[str(transaction_id)] = transaction
-        self._write_db(db)
+        await asyncio.to_thread(self._insert, transaction)
 
         return TransactionInserted(**transaction)
 
-    def retrieve_transaction(self, transaction_id: str) -> TransactionInserted | None:
-        db = self._read_db()
-        transaction = db.get(str(transaction_id), None)
+    async def retrieve_transaction(self, transaction_id: str) -> TransactionInserted | None:
+        transaction = await asyncio.to_thread(self._retrieve, str(transaction_id))
         if transaction:
             return TransactionInserted(**transaction)
         return None
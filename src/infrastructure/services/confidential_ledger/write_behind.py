@@ -0,0 +1,62 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Tuple
+
+from src.infrastructure.services.confidential_ledger.contract import (
+    LedgerInterface,
+    TransactionInserted,
+)
+
+AfterWrite = Callable[[TransactionInserted], Awaitable[None]]
+
+
+class LedgerWriteBehind:
+    """Writes ledger entries in the background, in submission order.
+
+    `submit` returns once the entry is queued, so the caller keeps working
+    while the ledger round-trips run. Each entry is written after the
+    previous one is done, including its `after` callback (e.g. polling until
+    it is ready). At most `max_pending` entries are left unwritten, `submit`
+    waits for the oldest ones beyond that.
+
+    Azure Confidential Ledger has no multi-entry write, so entries are never
+    merged: every entry gets its own transaction id, collected by `written`.
+    """
+
+    def __init__(self, ledger_service: LedgerInterface, max_pending: int = 2):
+        self._ledger_service = ledger_service
+        self._max_pending = max_pending
+        self._pending: Deque[Tuple[dict, asyncio.Task]] = deque()
+
+    async def _write(self, previous: asyncio.Task | None, data: dict,
+                     after: AfterWrite | None) -> TransactionInserted:
+        if previous is not None:
+            # keeps the ledger order, whether or not the previous write failed
+            await asyncio.wait([previous])
+        transaction = await self._ledger_service.insert_transaction(data)
+        if after is not None:
+            await after(transaction)
+        return transaction
+
+    async def submit(self, data: dict, after: AfterWrite | None = None):
+        unwritten = [task for _, task in self._pending if not task.done()]
+        if len(unwritten) >= self._max_pending:
+            await asyncio.wait(unwritten[:len(unwritten) - self._max_pending + 1])
+        previous = self._pending[-1][1] if self._pending else None
+        task = asyncio.create_task(self._write(previous, data, after))
+        self._pending.append((data, task))
+
+    async def written(
+        self, wait: bool = False
+    ) -> AsyncIterator[Tuple[dict, TransactionInserted]]:
+        """Yields the written entries with their transactions, oldest first.
+
+        Stops at the first entry still being written unless `wait` is set. A
+        failed write raises when it is reached, the entries after it stay
+        queued for the next call.
+        """
+        while self._pending and (wait or self._pending[0][1].done()):
+            data, task = self._pending[0]
+            await asyncio.wait([task])
+            self._pending.popleft()
+            yield data, task.result()
@@ -0,0 +1,199 @@
+import sys
+import heapq
+import asyncio
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Awaitable, Callable, Dict, Iterable, List, Set, Tuple
+
+from src.config.settings import get_config
+from src.domain.entities.drug_catalog import DrugCatalog
+
+
+logger = logging.getLogger(__name__)
+
+# (drug id, drug code, drug name)
+SearchEntry = Tuple[int, str, str]
+
+# same split as pg_trgm, shorter terms only match prefixes
+_TRIGRAM_MIN_LENGTH = 3
+
+
+def _trigrams(value: str) -> Set[str]:
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def _prefix_range(keys: List[str], prefix: str) -> Tuple[int, int]:
+    # every key starting with `prefix` sorts between it and prefix + U+10FFFF
+    return (bisect_left(keys, prefix),
+            bisect_left(keys, prefix + chr(sys.maxunicode)))
+
+
+class CatalogSearchIndex:
+    """Drug codes and names of one catalog, searchable in memory.
+
+    Matches and ranks like `IDrugRepository.search_by_catalog_id`: exact
+    codes, then code prefixes, then name prefixes, then the rest by id.
+    Prefixes are looked up by bisecting the sorted keys, longer terms through
+    a trigram posting list per code and name trigram. There is no similarity
+    ordering among the remaining matches.
+    """
+
+    def __init__(self, entries: Iterable[SearchEntry]):
+        # positions follow the drug id, ranking ties resolve by position
+        self._entries = sorted(entries)
+        self._codes = [code.lower() for _, code, _ in self._entries]
+        self._names = [name.lower() for _, _, name in self._entries]
+
+        by_code = sorted(zip(self._codes, range(len(self._codes))))
+        by_name = sorted(zip(self._names, range(len(self._names))))
+        self._code_keys = [key for key, _ in by_code]
+        self._code_positions = array("I", (pos for _, pos in by_code))
+        self._name_keys = [key for key, _ in by_name]
+        self._name_positions = array("I", (pos for _, pos in by_name))
+
+        postings: Dict[str, array] = {}
+        for pos, (code, name) in enumerate(zip(self._codes, self._names)):
+            for trigram in _trigrams(code) | _trigrams(name):
+                postings.setdefault(trigram, array("I")).append(pos)
+        self._postings = postings
+        self.memory_bytes = self._memory_bytes()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _memory_bytes(self) -> int:
+        size = sum(map(sys.getsizeof, (
+            self._entries, self._codes, self._names, self._code_keys,
+            self._code_positions, self._name_keys, self._name_positions,
+            self._postings)))
+        for entry in self._entries:
+            size += sum(map(sys.getsizeof, entry)) + sys.getsizeof(entry)
+        # the sorted keys share the lowered strings
+        size += sum(map(sys.getsizeof, self._codes))
+        size += sum(map(sys.getsizeof, self._names))
+        size += sum(sys.getsizeof(trigram) + sys.getsizeof(positions)
+                    for trigram, positions in self._postings.items())
+        return size
+
+    def _prefixed(self, keys: List[str], positions: array, prefix: str):
+        start, end = _prefix_range(keys, prefix)
+        return positions[start:end]
+
+    def _rank(self, pos: int, term: str) -> int:
+        code = self._codes[pos]
+        if code == term:
+            return 0
+        if code.startswith(term):
+            return 1
+        if self._names[pos].startswith(term):
+            return 2
+        return 3
+
+    def search(self, name_or_code: str, limit: int) -> List[SearchEntry]:
+        if not name_or_code:
+            return self._entries[:limit]
+
+        term = name_or_code.lower()
+        if len(term) < _TRIGRAM_MIN_LENGTH:
+            candidates = set(self._prefixed(
+                self._code_keys, self._code_positions, term))
+            candidates.update(self._prefixed(
+                self._name_keys, self._name_positions, term))
+        else:
+            postings = sorted(
+                (self._postings.get(trigram, ()) for trigram in _trigrams(term)),
+                key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            candidates = [
+                pos for pos in candidates
+                if term in self._codes[pos] or term in self._names[pos]
+            ]
+
+        ranked = heapq.nsmallest(
+            limit, candidates, key=lambda pos: (self._rank(pos, term), pos))
+        return [self._entries[pos] for pos in ranked]
+
+
+class DrugAutocomplete:
+    """Per-process search indexes of completed catalogs.
+
+    A catalog is indexed by the first search that finds it completed, which
+    loads its codes and names once through `load`. The index is dropped as
+    soon as the catalog status or drug count differ from the indexed ones,
+    which a re-import changes. Catalogs larger than `max_rows`, unfinished
+    ones and those still being indexed are left to the database: `search`
+    returns None for them.
+    """
+
+    def __init__(self, max_rows: int = 500_000):
+        self._max_rows = max_rows
+        self._indexes: Dict[int, Tuple[tuple, CatalogSearchIndex]] = {}
+        self._building: Set[int] = set()
+
+    @staticmethod
+    def _version(catalog: DrugCatalog) -> tuple:
+        return (catalog.status, catalog.drug_count)
+
+    def invalidate(self, catalog_id: int):
+        self._indexes.pop(catalog_id, None)
+
+    def memory_usage(self) -> Dict[int, Tuple[int, int]]:
+        """Indexed drugs and approximate bytes used, by catalog id."""
+        return {
+            catalog_id: (len(index), index.memory_bytes)
+            for catalog_id, (_, index) in self._indexes.items()
+        }
+
+    async def search(
+        self,
+        catalog: DrugCatalog,
+        name_or_code: str,
+        limit: int,
+        load: Callable[[int], Awaitable[List[SearchEntry]]],
+    ) -> List[SearchEntry] | None:
+        catalog_id, version = catalog._id, self._version(catalog)
+        indexed = self._indexes.get(catalog_id)
+        if indexed is not None and indexed[0] == version:
+            return indexed[1].search(name_or_code, limit)
+
+        self.invalidate(catalog_id)
+        if (
+            catalog.status != "completed"
+            or catalog.drug_count is None
+            or catalog.drug_count > self._max_rows
+            or catalog_id in self._building
+        ):
+            return None
+
+        self._building.add(catalog_id)
+        try:
+            entries = await load(catalog_id)
+            index = await asyncio.to_thread(CatalogSearchIndex, entries)
+        except Exception as err:
+            # the index only speeds searches up, the database still answers
+            logger.error(
+                f"Could not index catalog {catalog_id} for autocomplete: {err}",
+                exc_info=True)
+            return None
+        finally:
+            self._building.discard(catalog_id)
+        self._indexes[catalog_id] = (version, index)
+        logger.info(
+            f"Indexed {len(index)} drugs of catalog {catalog_id} for "
+            f"autocomplete, {index.memory_bytes / 1024 / 1024:.1f} MiB")
+        return index.search(name_or_code, limit)
+
+
+_autocomplete: DrugAutocomplete | None = None
+
+
+def get_drug_autocomplete() -> DrugAutocomplete | None:
+    """Dependency returning the process-wide indexes, None when disabled."""
+    global _autocomplete
+    config = get_config()
+    if not config.DRUG_AUTOCOMPLETE_INDEX:
+        return None
+    if _autocomplete is None:
+        _autocomplete = DrugAutocomplete(config.DRUG_AUTOCOMPLETE_MAX_ROWS)
+    return _autocomplete
@@ -0,0 +1,81 @@
+import json
+import time
+import pandas as pd
+from typing import List, Tuple
+from dataclasses import dataclass
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.config.settings.imports import IngestionEngine
+from src.domain.entities.drug import Drug
+from src.infrastructure.db.base import generate_snowflake_ids
+
+
+DRUG_COLUMNS = ["id", "catalog_id", "drug_code", "drug_name", "properties"]
+
+
+@dataclass
+class IngestionReport:
+    engine: IngestionEngine
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds <= 0:
+            return float(self.rows)
+        return self.rows / self.seconds
+
+
+class BulkDrugWriter:
+    """Streams parsed drug rows into the drugs table.
+
+    Snowflake ids are generated per batch. PostgreSQL receives the rows through
+    COPY on the asyncpg driver connection, any other dialect (SQLite in tests)
+    falls back to a multi-row executemany INSERT.
+    """
+
+    def __init__(
+        self, session: AsyncSession, catalog_id: int, batch_size: int = 5000
+    ):
+        self._session = session
+        self._catalog_id = catalog_id
+        self._batch_size = batch_size
+
+    def _records(self, df: pd.DataFrame) -> List[Tuple]:
+        ids = generate_snowflake_ids(len(df))
+        return list(
+            zip(
+                ids,
+                [self._catalog_id] * len(df),
+                df["drug_code"].astype(str).tolist(),
+                df["drug_name"].astype(str).tolist(),
+                df["properties"].tolist(),
+            )
+        )
+
+    async def _copy(self, connection: AsyncConnection, records: List[Tuple]):
+        raw_connection = await connection.get_raw_connection()
+        # the asyncpg json codec installed by sqlalchemy expects text
+        rows = [(*record[:4], json.dumps(record[4])) for record in records]
+        await raw_connection.driver_connection.copy_records_to_table(
+            Drug.__tablename__, records=rows, columns=DRUG_COLUMNS
+        )
+
+    async def _insert(self, connection: AsyncConnection, records: List[Tuple]):
+        rows = [dict(zip(DRUG_COLUMNS, record)) for record in records]
+        await connection.execute(insert(Drug.__table__), rows)
+
+    async def write(self, df: pd.DataFrame) -> IngestionReport:
+        started = time.perf_counter()
+        for start in range(0, len(df), self._batch_size):
+            records = self._records(df.iloc[start : start + self._batch_size])
+            connection = await self._session.connection()
+            if connection.dialect.name == "postgresql":
+                await self._copy(connection, records)
+            else:
+                await self._insert(connection, records)
+            await self._session.commit()
+        return IngestionReport(
+            engine="BULK", rows=len(df), seconds=time.perf_counter() - started
+        )
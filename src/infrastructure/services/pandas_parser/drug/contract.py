@@ -1,11 +1,22 @@
 import io
+import time
+import asyncio
+import itertools
+import logging
 import traceback
+import numpy as np
 import pandas as pd
-from typing import List, NoReturn
+from typing import Callable, Iterator, List, NoReturn
 from abc import ABC, abstractmethod
+from lxml import etree
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.settings.imports import IngestionEngine
 from src.domain.entities.drug import Drug
+from src.infrastructure.services.pandas_parser.drug.bulk import (
+    BulkDrugWriter,
+    IngestionReport,
+)
 from src.infrastructure.services.pandas_parser.drug.exc import (
     InvalidFileFormat,
     InvalidParsedData,
@@ -13,14 +24,23 @@ from src.infrastructure.services.pandas_parser.drug.exc import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class PandasParser(ABC):
-    def __init__(self, source: io.BytesIO | str):
+    def __init__(self, source: io.BytesIO | str, chunksize: int | None = None):
         self._file = source
+        self._chunksize = chunksize
         self._df: pd.DataFrame | None = None
+        # chunked mode: remaining chunks, raw rows of the current chunk and
+        # raw rows of every chunk already persisted
+        self._chunks: Iterator[pd.DataFrame] | None = None
+        self._chunk_rows = 0
+        self._row_offset = 0
         self._open_and_validate()
 
     @abstractmethod
-    def _open(self) -> pd.DataFrame:
+    def _open(self) -> pd.DataFrame | Iterator[pd.DataFrame]:
         raise NotImplementedError("This is an abstract method")
 
     @abstractmethod
@@ -33,7 +53,13 @@ class PandasParser(ABC):
 
     def _open_and_validate(self):
         try:
-            self._df = self._open()
+            opened = self._open()
+            if isinstance(opened, pd.DataFrame):
+                self._df = opened
+            else:
+                self._chunks = iter(opened)
+                self._df = next(self._chunks)
+            self._chunk_rows = len(self._df)
         except Exception as err:
             print(f"Error opening file: {err}")
             print(traceback.format_exc())
@@ -45,7 +71,110 @@ class PandasParser(ABC):
         if missing:
             raise InvalidFileFormat(f"Missing required columns: {missing}")
 
-    async def save_all(self, session: AsyncSession, catalog_id: int):
+    def _read_csv(self, **kwargs) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        """`pd.read_csv` over the source with missing values set to None.
+
+        When the parser was built with a `chunksize` the file is read lazily
+        and an iterator of DataFrames is returned instead. The first chunk is
+        read right away so encoding and format errors still surface on open.
+        """
+        if self._chunksize is None:
+            return pd.read_csv(self._file, **kwargs).where(pd.notnull, None)
+
+        reader = pd.read_csv(self._file, chunksize=self._chunksize, **kwargs)
+        first = next(reader)
+        return (
+            chunk.where(pd.notnull, None)
+            for chunk in itertools.chain([first], reader)
+        )
+
+    def _iter_xml_records(
+        self, tag: str, to_record: Callable[[etree._Element], dict]
+    ) -> Iterator[dict]:
+        for _, element in etree.iterparse(
+            self._file, events=("end",), tag=tag,
+            remove_comments=True, remove_pis=True,
+        ):
+            yield to_record(element)
+            # drop the consumed element and its already parsed siblings so
+            # the tree never grows past a single record
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _read_xml(
+        self, tag: str, to_record: Callable[[etree._Element], dict]
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        """Streams every `tag` element of the source through `to_record`.
+
+        The XML is read with lxml iterparse, no element tree is kept around.
+        Without a `chunksize` the records are returned as a single DataFrame,
+        otherwise as DataFrames of `chunksize` records each.
+        """
+        records = self._iter_xml_records(tag, to_record)
+        if self._chunksize is None:
+            return pd.DataFrame(list(records))
+
+        def batches():
+            while batch := list(itertools.islice(records, self._chunksize)):
+                yield pd.DataFrame(batch)
+
+        chunks = batches()
+        first = next(chunks, pd.DataFrame())
+        return itertools.chain([first], chunks)
+
+    @staticmethod
+    def _map_chunks(
+        opened: pd.DataFrame | Iterator[pd.DataFrame],
+        fn: Callable[[pd.DataFrame], pd.DataFrame],
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        if isinstance(opened, pd.DataFrame):
+            return fn(opened)
+        return (fn(chunk) for chunk in opened)
+
+    def _next_chunk(self) -> bool:
+        """Loads the next raw chunk into `_df`, False once the file is over."""
+        if self._chunks is None:
+            return False
+        self._row_offset += self._chunk_rows
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._chunks = None
+            return False
+        # record based chunks only hold the fields seen in their own rows
+        for column in self._required_columns():
+            if column not in chunk.columns:
+                chunk[column] = None
+        self._df = chunk
+        self._chunk_rows = len(chunk)
+        return True
+
+    def _build_properties(
+            self, exclude: List[str], dropna: bool = True) -> List[dict]:
+        """Builds the per-row properties dicts from every column but `exclude`.
+
+        Equivalent to `df.apply(lambda row: row.drop(exclude).dropna()
+        .to_dict(), axis=1)` without materializing a Series per row: the
+        records are converted in bulk and missing values are removed column by
+        column.
+        """
+        data = self._df.drop(columns=exclude)
+        if data.columns.empty:
+            return [{} for _ in range(len(data))]
+        # apply(axis=1) hands out rows upcast to the frame's common dtype
+        common_dtype = self._df.iloc[:0].to_numpy().dtype
+        if common_dtype != object:
+            data = data.astype(common_dtype)
+
+        records = data.to_dict(orient="records")
+        if dropna:
+            missing = data.isna()
+            for column in missing.columns[missing.any()]:
+                for idx in np.flatnonzero(missing[column].to_numpy()):
+                    del records[idx][column]
+        return records
+
+    def _validate_parsed(self):
         if self._df is None:
             raise MissingPreExecutionError(
                 "parse() must be called before insert()")
@@ -71,6 +200,9 @@ class PandasParser(ABC):
         ):
             raise InvalidParsedData("Invalid data types in dataframe")
 
+    async def _save_orm(
+            self, session: AsyncSession, catalog_id: int) -> IngestionReport:
+        started = time.perf_counter()
         for idx, (_, row) in enumerate(self._df.iterrows(), start=1):
             drug = Drug(
                 catalog_id=catalog_id,
@@ -85,3 +217,44 @@ class PandasParser(ABC):
         # Commit the remaining rows
         if len(self._df) % 100 != 0:
             await session.commit()
+        return IngestionReport(
+            engine="ORM", rows=len(self._df),
+            seconds=time.perf_counter() - started)
+
+    async def _save_parsed(
+        self, session: AsyncSession, catalog_id: int, engine: IngestionEngine
+    ) -> IngestionReport:
+        self._validate_parsed()
+        if engine == "BULK":
+            writer = BulkDrugWriter(session, catalog_id)
+            return await writer.write(self._df)
+        return await self._save_orm(session, catalog_id)
+
+    async def save_all(
+        self,
+        session: AsyncSession,
+        catalog_id: int,
+        engine: IngestionEngine = "ORM",
+    ) -> IngestionReport:
+        """Persists the parsed rows.
+
+        In chunked mode only the first chunk has been parsed at this point,
+        the remaining ones are read, parsed and persisted one at a time.
+        """
+        started = time.perf_counter()
+        report = await self._save_parsed(session, catalog_id, engine)
+        rows = report.rows
+        # reading and parsing the next chunk is blocking, keep it off the loop
+        while await asyncio.to_thread(self._next_chunk):
+            await asyncio.to_thread(self.parse)
+            report = await self._save_parsed(session, catalog_id, engine)
+            rows += report.rows
+        report = IngestionReport(
+            engine=report.engine, rows=rows,
+            seconds=time.perf_counter() - started)
+
+        logger.info(
+            f"Catalog {catalog_id}: {report.rows} drugs saved with "
+            f"{report.engine} engine in {report.seconds:.2f}s "
+            f"({report.rows_per_second:.0f} rows/s)")
+        return report
@@ -18,9 +18,7 @@ class AT_Parser(PandasParser):
         # Strip whitespace from column names
         self._df.columns = self._df.columns.str.strip()
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["Name"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["Name"])
 
         # Generate ID column
         self._df["ID"] = [f"AT_{i + 1}" for i in range(len(self._df))]
@@ -1,5 +1,3 @@
-import pandas as pd
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 from src.utils.file import detect_file_encoding
 
@@ -7,9 +5,9 @@ from src.utils.file import detect_file_encoding
 class BE_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        return pd.read_csv(
-            self._file, delimiter=";", encoding=encoding, on_bad_lines="skip"
-        ).where(pd.notnull, None)
+        return self._read_csv(
+            delimiter=";", encoding=encoding, on_bad_lines="skip", dtype=str
+        )
 
     def _required_columns(self):
         return ["CTI Extended", "Name"]
@@ -18,8 +16,8 @@ class BE_Parser(PandasParser):
         # Strip whitespace from column names
         self._df.columns = self._df.columns.str.strip()
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["CTI Extended", "Name"]).dropna().to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["CTI Extended", "Name"]
         )
 
         # Select relevant columns
@@ -17,8 +17,8 @@ class BG_Parser(PandasParser):
         if self._df.columns[0].startswith("Unnamed"):
             self._df = self._df.drop(self._df.columns[0], axis=1)
         
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "Търговско име"]).dropna().to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["ID", "Търговско име"]
         )
 
         # Select relevant columns
@@ -22,8 +22,8 @@ class CA_Parser(PandasParser):
             inplace=True,
         )
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["drug_code", "drug_name"]).to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["drug_code", "drug_name"], dropna=False
         )
 
         self._df = self._df[["drug_code", "drug_name", "properties"]]
@@ -18,9 +18,7 @@ class CA_PillcheckParser(PandasParser):
 
         self._df["ID"] = [f"CAPC_{i + 1}" for i in range(len(self._df))]
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "Generic Name"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["ID", "Generic Name"])
 
         self._df = self._df[["ID", "Generic Name", "properties"]]
         self._df.rename(
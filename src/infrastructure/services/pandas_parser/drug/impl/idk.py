@@ -14,9 +14,7 @@ class DK_Parser(PandasParser):
         
         self._df = self._df.dropna(thresh=3)
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["Drugid", "Navn"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["Drugid", "Navn"])
 
         # Select relevant columns
         self._df = self._df[["Drugid", "Navn", "properties"]]
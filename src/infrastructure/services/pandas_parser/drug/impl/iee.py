@@ -1,5 +1,3 @@
-import pandas as pd
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 from src.utils.file import detect_file_encoding
 
@@ -7,21 +5,21 @@ from src.utils.file import detect_file_encoding
 class EE_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        return pd.read_csv(
-            self._file, delimiter=";", header=1, encoding=encoding, on_bad_lines="skip"
-        ).where(pd.notnull, None)
+        return self._read_csv(
+            delimiter=";", header=1, encoding=encoding, on_bad_lines="skip",
+            dtype=str
+        )
 
     def _required_columns(self):
         return ["Name of medicinal product"]
 
     def parse(self):
-        self._df["ID"] = [f"EE_{i + 1}" for i in range(len(self._df))]
+        self._df["ID"] = [
+            f"EE_{self._row_offset + i + 1}" for i in range(len(self._df))
+        ]
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "Name of medicinal product"])
-            .dropna()
-            .to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["ID", "Name of medicinal product"]
         )
 
         # Select relevant columns
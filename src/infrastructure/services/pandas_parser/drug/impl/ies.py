@@ -11,9 +11,8 @@ class ES_Parser(PandasParser):
         return ["Nº Registro", "Medicamento"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["Nº Registro", "Medicamento"]).dropna().to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["Nº Registro", "Medicamento"]
         )
 
         # Select relevant columns
@@ -15,11 +15,8 @@ class EU_Parser(PandasParser):
         self._df = self._df[self._df["Category"] != "Veterinary"]
 
         # Convert to JSON-like format for properties
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(
-                ["EMA product number", "Name of medicine"]
-            ).dropna().to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["EMA product number", "Name of medicine"]
         )
 
         # Select relevant columns
@@ -1,33 +1,28 @@
-import pandas as pd
-import xml.etree.ElementTree as ET
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 
 
 class FI_Parser(PandasParser):
     def _open(self):
-        tree = ET.parse(self._file)
-        root = tree.getroot()
-        records = []
-        for product in root.findall(".//Laakevalmiste"):
-            record = {}
-            record["id"] = product.attrib.get("id")
-            for child in product:
-                tag = child.tag
-                if tag == "ATC-koodi":
-                    record["ATC-koodi"] = child.attrib.get("id")
-                elif tag == "Laakemuoto":
-                    record["Laakemuoto"] = child.attrib.get("value")
-                elif tag == "Myyntilupa":
-                    myyntilupa = {}
-                    for subchild in child:
-                        myyntilupa[subchild.tag] = subchild.text
-                    record["Myyntilupa"] = myyntilupa
-                else:
-                    record[tag] = child.text
-            records.append(record)
-
-        return pd.DataFrame(records)
+        return self._read_xml("Laakevalmiste", self._record)
+
+    @staticmethod
+    def _record(product) -> dict:
+        record = {}
+        record["id"] = product.attrib.get("id")
+        for child in product:
+            tag = child.tag
+            if tag == "ATC-koodi":
+                record["ATC-koodi"] = child.attrib.get("id")
+            elif tag == "Laakemuoto":
+                record["Laakemuoto"] = child.attrib.get("value")
+            elif tag == "Myyntilupa":
+                myyntilupa = {}
+                for subchild in child:
+                    myyntilupa[subchild.tag] = subchild.text
+                record["Myyntilupa"] = myyntilupa
+            else:
+                record[tag] = child.text
+        return record
 
     def _required_columns(self):
         return ["id", "Kauppanimi"]
@@ -35,12 +30,11 @@ class FI_Parser(PandasParser):
     def parse(self):
 
         # Convert to Dict format for properties
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["id", "Kauppanimi"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["id", "Kauppanimi"])
 
-        # Select relevant columns
-        self._df = self._df[["id", "Kauppanimi", "properties"]]
+        # Select relevant columns, copied so the rename below never writes
+        # through to a slice of the previous frame
+        self._df = self._df[["id", "Kauppanimi", "properties"]].copy()
         self._df.rename(
             columns={
                 "id": "drug_code",
@@ -7,15 +7,17 @@ from src.utils.file import detect_file_encoding
 class FR_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        df = pd.read_csv(
-            self._file,
+        opened = self._read_csv(
             delimiter="\t",
             encoding=encoding,
             on_bad_lines="skip",
             header=None,
             dtype=str,
-        ).where(pd.notnull, None)
+        )
+        return self._map_chunks(opened, self._name_columns)
 
+    @staticmethod
+    def _name_columns(df: pd.DataFrame) -> pd.DataFrame:
         # Reset the index
         df = df.reset_index(drop=True)
 
@@ -33,9 +35,8 @@ class FR_Parser(PandasParser):
 
     def parse(self):
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["CIS code", "Drug name"]).dropna().to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["CIS code", "Drug name"]
         )
 
         # Select relevant columns
@@ -11,8 +11,8 @@ class GR_Parser(PandasParser):
         return ["Code", "Name / Strength"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["Code", "Name / Strength"]).dropna().to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["Code", "Name / Strength"]
         )
 
         # Select relevant columns
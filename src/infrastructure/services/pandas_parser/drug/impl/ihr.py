@@ -13,9 +13,7 @@ class HR_Parser(PandasParser):
     def parse(self):
         self._df["ID"] = [f"HR_{i + 1}" for i in range(len(self._df))]
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "Naziv"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["ID", "Naziv"])
 
         self._df = self._df[["ID", "Naziv", "properties"]]
         self._df.rename(
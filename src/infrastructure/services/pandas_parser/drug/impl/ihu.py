@@ -1,5 +1,3 @@
-import pandas as pd
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 from src.utils.file import detect_file_encoding
 
@@ -7,22 +5,22 @@ from src.utils.file import detect_file_encoding
 class HU_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        return pd.read_csv(
-            self._file, delimiter=";", encoding=encoding, 
+        return self._read_csv(
+            delimiter=";", encoding=encoding, 
             on_bad_lines="skip", dtype=str
-        ).where(pd.notnull, None)
+        )
 
     def _required_columns(self):
         return [" Név"]
 
     def parse(self):
-        self._df["ID"] = [f"HU_{i + 1}" for i in range(len(self._df))]
+        self._df["ID"] = [
+            f"HU_{self._row_offset + i + 1}" for i in range(len(self._df))
+        ]
 
         self._df.columns = self._df.columns.str.strip()
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "Név"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["ID", "Név"])
 
         # Select relevant columns
         self._df = self._df[["ID", "Név", "properties"]]
@@ -11,8 +11,8 @@ class LU_Parser(PandasParser):
         return ["Nr. AMM", "Dénomination"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["Nr. AMM", "Dénomination"]).dropna().to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["Nr. AMM", "Dénomination"]
         )
 
         self._df = self._df[["Nr. AMM", "Dénomination", "properties"]]
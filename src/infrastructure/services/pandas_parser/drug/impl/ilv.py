@@ -15,10 +15,8 @@ class LV_Parser(PandasParser):
         return ["product_id", "original_name"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(
-                ["product_id", "original_name"]).dropna().to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["product_id", "original_name"]
         )
 
         # Select relevant columns
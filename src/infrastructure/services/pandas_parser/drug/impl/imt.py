@@ -13,8 +13,8 @@ class MT_Parser(PandasParser):
     def parse(self):
         self._df["ID"] = [f"MT_{i + 1}" for i in range(len(self._df))]
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "[Medicine Name]"]).dropna().to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["ID", "[Medicine Name]"]
         )
 
         self._df = self._df[["ID", "[Medicine Name]", "properties"]]
@@ -1,37 +1,32 @@
-import pandas as pd
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
-from src.utils.file import detect_file_encoding
+from src.utils.file import decodes_with, detect_file_encoding
 
 
 class NL_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        try:
-            return pd.read_csv(
-                self._file, 
-                delimiter="|", 
-                encoding=encoding, 
-                on_bad_lines="skip"
-            ).where(pd.notnull, None)
-        except UnicodeDecodeError:
+        # the encoding is detected on a sample, check the whole file before
+        # reading it, a chunked read would only fail once earlier chunks
+        # are saved
+        if not decodes_with(self._file, encoding):
             # Fallback to ISO-8859-1 if the detected encoding fails
-            return pd.read_csv(
-                self._file, 
-                delimiter="|", 
-                encoding="ISO-8859-1", 
-                on_bad_lines="skip"
-            ).where(pd.notnull, None)
+            encoding = "ISO-8859-1"
+        return self._read_csv(
+            delimiter="|", 
+            encoding=encoding, 
+            on_bad_lines="skip",
+            dtype=str
+        )
 
     def _required_columns(self):
         return ["PRODUCTNAAM"]
 
     def parse(self):
-        self._df["ID"] = [f"NL_{i + 1}" for i in range(len(self._df))]
+        self._df["ID"] = [
+            f"NL_{self._row_offset + i + 1}" for i in range(len(self._df))
+        ]
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "PRODUCTNAAM"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["ID", "PRODUCTNAAM"])
 
         # Select relevant columns
         self._df = self._df[["ID", "PRODUCTNAAM", "properties"]]
@@ -1,5 +1,3 @@
-import pandas as pd
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 from src.utils.file import detect_file_encoding
 
@@ -7,9 +5,9 @@ from src.utils.file import detect_file_encoding
 class PL_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        return pd.read_csv(
-            self._file, delimiter=";", encoding=encoding, on_bad_lines="skip", dtype=str
-        ).where(pd.notnull, None)
+        return self._read_csv(
+            delimiter=";", encoding=encoding, on_bad_lines="skip", dtype=str
+        )
 
     def _required_columns(self):
         return ["Identyfikator Produktu Leczniczego", "Nazwa Produktu Leczniczego"]
@@ -21,13 +19,8 @@ class PL_Parser(PandasParser):
             "Nazwa Produktu Leczniczego": "drug_name",
         }
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(
-                ["Identyfikator Produktu Leczniczego", "Nazwa Produktu Leczniczego"]
-            )
-            .dropna()
-            .to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["Identyfikator Produktu Leczniczego", "Nazwa Produktu Leczniczego"]
         )
 
         # Rename the DataFrame columns
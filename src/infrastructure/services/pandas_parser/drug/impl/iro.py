@@ -13,9 +13,8 @@ class RO_Parser(PandasParser):
     def parse(self):
         self._df["ID"] = [f"RO_{i + 1}" for i in range(len(self._df))]
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ID", "Denumire comerciala"]).dropna().to_dict(),
-            axis=1,
+        self._df["properties"] = self._build_properties(
+            ["ID", "Denumire comerciala"]
         )
 
         # Select relevant columns
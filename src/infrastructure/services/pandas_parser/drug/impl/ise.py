@@ -11,9 +11,7 @@ class SE_Parser(PandasParser):
         return ["NPL-id", "Namn"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["NPL-id", "Namn"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["NPL-id", "Namn"])
 
         # Select relevant columns
         self._df = self._df[["NPL-id", "Namn", "properties"]]
@@ -1,5 +1,3 @@
-import pandas as pd
-
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 from src.utils.file import detect_file_encoding
 
@@ -7,12 +5,12 @@ from src.utils.file import detect_file_encoding
 class SI_Parser(PandasParser):
     def _open(self):
         encoding = detect_file_encoding(self._file)
-        return pd.read_csv(
-            self._file, delimiter=";", 
+        return self._read_csv(
+            delimiter=";", 
             encoding=encoding, 
             on_bad_lines="skip",
             dtype=str
-        ).where(pd.notnull, None)
+        )
 
     def _required_columns(self):
         return ["Nacionalna šifra ", "Poimenovanje zdravila"]
@@ -21,8 +19,8 @@ class SI_Parser(PandasParser):
 
         self._df.columns = self._df.columns.str.strip()
 
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["Nacionalna šifra", "Poimenovanje zdravila"]).dropna().to_dict(), axis=1
+        self._df["properties"] = self._build_properties(
+            ["Nacionalna šifra", "Poimenovanje zdravila"]
         )
 
         # Select relevant columns
@@ -11,9 +11,7 @@ class SK_Parser(PandasParser):
         return ["ŠÚKL kód", "Názov"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["ŠÚKL kód", "Názov"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["ŠÚKL kód", "Názov"])
 
         # Select relevant columns
         self._df = self._df[["ŠÚKL kód", "Názov", "properties"]]
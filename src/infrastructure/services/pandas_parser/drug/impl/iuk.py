@@ -13,9 +13,7 @@ class UK_Parser(PandasParser):
         return ["VMP ID", "Name"]
 
     def parse(self):
-        self._df["properties"] = self._df.apply(
-            lambda row: row.drop(["VMP ID", "Name"]).dropna().to_dict(), axis=1
-        )
+        self._df["properties"] = self._build_properties(["VMP ID", "Name"])
 
         self._df = self._df[["VMP ID", "Name", "properties"]]
         self._df.rename(
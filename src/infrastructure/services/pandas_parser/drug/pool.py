@@ -0,0 +1,67 @@
+import asyncio
+import multiprocessing
+from typing import Type
+from concurrent.futures import ProcessPoolExecutor
+
+from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_parser_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawned, not forked: the worker process holds an event loop, broker
+        # connections and threads that must not be copied into the children
+        _pool = ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_parser_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _open_and_parse(
+    parser_class: Type[PandasParser], source: str, chunksize: int | None
+) -> PandasParser:
+    parser = parser_class(source, chunksize=chunksize)
+    parser.parse()
+    return parser
+
+
+class ParserLoader:
+    """Opens and parses a catalog file without blocking the event loop.
+
+    Whole files are opened and parsed in the process pool and the parser,
+    parsed frame included, is handed back pickled. Chunked parsers hold an
+    open reader that cannot leave the process, they are loaded in a thread
+    and keep reading their next chunks from `save_all`.
+    """
+
+    def __init__(
+        self,
+        parser_class: Type[PandasParser],
+        source: str,
+        chunksize: int | None = None,
+        pool_size: int = 0,
+    ):
+        self._parser_class = parser_class
+        self._source = source
+        self._chunksize = chunksize
+        self._pool_size = pool_size
+
+    async def load(self) -> PandasParser:
+        if self._chunksize is not None or self._pool_size < 1:
+            return await asyncio.to_thread(
+                _open_and_parse, self._parser_class, self._source,
+                self._chunksize)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_parser_pool(self._pool_size), _open_and_parse,
+            self._parser_class, self._source, None)
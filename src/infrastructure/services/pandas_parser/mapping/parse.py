@@ -1,7 +1,10 @@
 import io
+import json
+import asyncio
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
-from typing import List
+from typing import BinaryIO, Iterator, List, Tuple
 
 from src.infrastructure.services.pandas_parser.drug.exc import InvalidFileFormat
 
@@ -11,14 +14,40 @@ class DrugMappingParse(BaseModel):
     related_drug_code: str
 
 
+# serialized size of a mapping without its codes, separator included
+_ROW_OVERHEAD = len(json.dumps(
+    DrugMappingParse(drug_code="", related_drug_code="").model_dump())) + 2
+
+
+REQUIRED_COLUMNS = ["drug_code", "related_drug_code"]
+
+
 class MappingParser:
-    def __init__(self, file_bytes: bytes):
-        self._file = io.BytesIO(file_bytes)
+    def __init__(self, source: bytes | str):
+        self._file = io.BytesIO(source) if isinstance(source, bytes) else source
         self._df: pd.DataFrame | None = None
         self._open_and_validate()
 
+    @staticmethod
+    def validate_header(source: BinaryIO):
+        """Checks the required columns reading the header only.
+
+        The stream is rewound afterwards so it can still be stored as is.
+        """
+        try:
+            columns = pd.read_csv(
+                source, delimiter=",", dtype=str, nrows=0).columns
+        except Exception:
+            raise InvalidFileFormat(
+                "Invalid file format or missing required columns")
+        finally:
+            source.seek(0)
+        if not all([col in columns for col in REQUIRED_COLUMNS]):
+            raise InvalidFileFormat(
+                "Invalid file format or missing required columns")
+
     def _required_columns(self) -> List[str]:
-        return ["drug_code", "related_drug_code"]
+        return REQUIRED_COLUMNS
 
     def _open_and_validate(self):
         try:
@@ -30,10 +59,53 @@ class MappingParser:
         except Exception:
             raise InvalidFileFormat("Invalid file format or missing required columns")
 
-    def parse(self, chunk_size: int = 100):
-        for i in range(0, len(self._df), chunk_size):
-            chunk = self._df.iloc[i : i + chunk_size][
+    def _chunk_bounds(
+        self, chunk_size: int, max_bytes: int | None
+    ) -> Iterator[Tuple[int, int]]:
+        total = len(self._df)
+        if max_bytes is None:
+            for start in range(0, total, chunk_size):
+                yield start, min(start + chunk_size, total)
+            return
+
+        # approximate payload size of each row once serialized
+        row_bytes = _ROW_OVERHEAD + sum(
+            self._df[column].fillna("").str.len()
+            for column in self._required_columns()
+        )
+        cumulative = np.cumsum(row_bytes.to_numpy())
+        start = 0
+        while start < total:
+            consumed = cumulative[start - 1] if start else 0
+            end = int(np.searchsorted(
+                cumulative, consumed + max_bytes, side="right"))
+            end = min(max(end, start + 1), start + chunk_size, total)
+            yield start, end
+            start = end
+
+    def parse(self, chunk_size: int = 100, max_bytes: int | None = None):
+        """Yields the mappings in chunks of at most `chunk_size` rows.
+
+        With `max_bytes` a chunk is also closed before its serialized payload
+        grows past that size (a single larger row still gets its own chunk).
+        """
+        for start, end in self._chunk_bounds(chunk_size, max_bytes):
+            chunk = self._df.iloc[start:end][
                 ["drug_code", "related_drug_code"]
             ]
             records = chunk.to_dict(orient="records")
             yield [DrugMappingParse(**record) for record in records]
+
+
+class MappingParserLoader:
+    """Opens a mapping file without blocking the event loop.
+
+    The file is read and validated in a thread, an invalid file raises
+    `InvalidFileFormat` from `load`.
+    """
+
+    def __init__(self, source: bytes | str):
+        self._source = source
+
+    async def load(self) -> MappingParser:
+        return await asyncio.to_thread(MappingParser, self._source)
@@ -1,23 +1,59 @@
+import logging
+
+from taskiq import TaskiqEvents, TaskiqMiddleware, TaskiqState
 from taskiq_aio_pika import AioPikaBroker
 from taskiq_dependencies import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.settings import get_config
-from src.infrastructure.db.engine import get_session
+from src.infrastructure.db.engine import get_session, pool_status
+from src.infrastructure.services.confidential_ledger import (
+    get_ledger, shutdown_ledger, startup_ledger)
+from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
+from src.infrastructure.services.pandas_parser.drug.pool import (
+    shutdown_parser_pool)
 from src.infrastructure.taskiq.catalog_import import (
     ParseTaskData, task as catalog_import)
 from src.infrastructure.taskiq.mapping_import import (
     MappingsTaskData, task as mapping_import)
 
 
-broker = AioPikaBroker(get_config().RABBITMQ_URL, qos=4)
+logger = logging.getLogger(__name__)
+
+
+class PoolStatusMiddleware(TaskiqMiddleware):
+    """Logs the database pool occupancy of the worker after every task."""
+
+    def post_execute(self, message, result):
+        status = pool_status()
+        if status["overflow"]:
+            logger.warning(f"Database pool overflowing after {message.task_name}: {status}")
+        else:
+            logger.debug(f"Database pool after {message.task_name}: {status}")
+
+
+broker = AioPikaBroker(get_config().RABBITMQ_URL, qos=4).with_middlewares(
+    PoolStatusMiddleware())
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def startup(state: TaskiqState):
+    startup_ledger(get_config())
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def shutdown(state: TaskiqState):
+    shutdown_parser_pool()
+    await shutdown_ledger()
 
 
 @broker.task
 async def catalog_import_taskiq(
-        data: dict, session: AsyncSession = Depends(get_session)):
+        data: dict,
+        session: AsyncSession = Depends(get_session),
+        ledger_service: LedgerInterface = Depends(get_ledger)):
     data: ParseTaskData = ParseTaskData.model_validate(data)
-    await catalog_import(session, data, get_config())
+    await catalog_import(session, data, get_config(), ledger_service)
 
 
 @broker.task
@@ -25,3 +61,16 @@ async def mapping_import_taskiq(
         data: dict, session: AsyncSession = Depends(get_session)):
     data: MappingsTaskData = MappingsTaskData.model_validate(data)
     await mapping_import(session, data)
+
+
+@broker.task
+async def mapping_file_import_taskiq(
+        data: dict,
+        session: AsyncSession = Depends(get_session),
+        ledger_service: LedgerInterface = Depends(get_ledger)):
+    # imported here since the fan-out use case enqueues mapping_import_taskiq
+    from src.infrastructure.taskiq.mapping_file_import import (
+        MappingFileTaskData, task as mapping_file_import)
+
+    data: MappingFileTaskData = MappingFileTaskData.model_validate(data)
+    await mapping_file_import(session, data, get_config(), ledger_service)
@@ -4,35 +4,36 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.dto.drug_catalog_dto import CountryCode
 from src.application.use_cases.drug_catalog.import_task import CatalogImportUseCase
 from src.config.settings import Envs
+from src.config.settings.imports import IngestionEngine
 from src.infrastructure.repositories.icatalog_transaction_repository import ICatalogTransactionRepository
 from src.infrastructure.repositories.idrug_catalog_repository import IDrugCatalogRepository
 from src.infrastructure.repositories.idrug_repository import IDrugRepository
 from src.infrastructure.services.blob_storage import get_file
-from src.infrastructure.services.confidential_ledger import ledger_builder
+from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
 from src.infrastructure.services.pandas_parser.drug.impl import drug_parser_factory
+from src.infrastructure.services.pandas_parser.drug.pool import ParserLoader
 
 
 class ParseTaskData(BaseModel):
     catalog_id: int
     filename: str
     parser: CountryCode
+    # overrides DRUG_INGESTION_ENGINE for this import only
+    ingestion_engine: IngestionEngine | None = None
 
 
-async def task(session: AsyncSession, data: ParseTaskData, config: Envs):
+async def task(
+    session: AsyncSession,
+    data: ParseTaskData,
+    config: Envs,
+    ledger_service: LedgerInterface,
+):
     file_path = await get_file(data.filename, config)
 
     FileParser = drug_parser_factory(data.parser)
     drug_catalog_repository = IDrugCatalogRepository(session)
     transaction_repository = ICatalogTransactionRepository(session)
     drug_repository = IDrugRepository(session)
-    ledger_service = ledger_builder(
-        config.AZURE_LEDGER_URL, 
-        config.AZURE_LEDGER_CERTIFICATE_PATH,
-        config.AZURE_CREDENTIAL_TENNANT_ID,
-        config.AZURE_CREDENTIAL_CLIENT_ID,
-        config.AZURE_CREDENTIAL_CERTIFICATE_PATH,
-        config.ENVIRONMENT
-    )
 
     use_case = CatalogImportUseCase(
         drug_catalog_repository=drug_catalog_repository,
@@ -40,8 +41,15 @@ async def task(session: AsyncSession, data: ParseTaskData, config: Envs):
         drug_repository=drug_repository,
         ledger_service=ledger_service,
         catalog_id=data.catalog_id,
-        parser=FileParser(file_path),
+        parser=ParserLoader(
+            FileParser,
+            file_path,
+            chunksize=config.PARSER_CHUNK_SIZE,
+            pool_size=config.PARSER_PROCESS_POOL_SIZE,
+        ),
         session=session,
+        ingestion_engine=data.ingestion_engine or config.DRUG_INGESTION_ENGINE,
+        ledger_ready_timeout=config.LEDGER_READY_TIMEOUT,
     )
     await use_case.prepare_transaction_data(data.filename, file_path)
     await use_case.execute()
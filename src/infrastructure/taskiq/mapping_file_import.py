@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.mapping.import_task import MappingImportUseCase
+from src.config.settings import Envs
+from src.infrastructure.repositories.imapping_repository import IMappingRepository
+from src.infrastructure.repositories.imapping_transaction_repository import IMappingTransactionRepository
+from src.infrastructure.services.blob_storage import get_file
+from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
+from src.infrastructure.services.pandas_parser.mapping.parse import MappingParserLoader
+
+
+class MappingFileTaskData(BaseModel):
+    mapping_id: int
+    central_catalog_id: int
+    related_catalog_id: int
+    filename: str
+    # name of the uploaded file, as recorded in the ledger
+    source_filename: str
+
+
+async def task(
+    session: AsyncSession,
+    data: MappingFileTaskData,
+    config: Envs,
+    ledger_service: LedgerInterface,
+):
+    file_path = await get_file(data.filename, config)
+
+    transaction_repository = IMappingTransactionRepository(session)
+
+    use_case = MappingImportUseCase(
+        transaction_repository=transaction_repository,
+        ledger_service=ledger_service,
+        mapping_parser=MappingParserLoader(file_path),
+        mapping_id=data.mapping_id,
+        central_catalog_id=data.central_catalog_id,
+        related_catalog_id=data.related_catalog_id,
+        chunk_rows=config.MAPPING_CHUNK_ROWS,
+        chunk_bytes=config.MAPPING_CHUNK_BYTES,
+        mapping_repository=IMappingRepository(session),
+        max_in_flight=config.MAPPING_MAX_IN_FLIGHT,
+        in_flight_timeout=config.MAPPING_IN_FLIGHT_TIMEOUT,
+    )
+    await use_case.prepare_task(data.source_filename, file_path)
+    await use_case.execute()
@@ -14,10 +14,23 @@ class MappingsTaskData(BaseSchema):
     central_catalog_id: int
     related_catalog_id: int
     mapping_id: int
+    # the file import counts processed chunks to cap those in flight
+    counted: bool = False
 
 
 async def task(session: AsyncSession, data: MappingsTaskData,
                logger: Logger = getLogger(__name__)):
+    try:
+        await _import_chunk(session, data, logger)
+    finally:
+        if data.counted:
+            # a failed chunk is counted too, on a clean transaction
+            await session.rollback()
+            await IMappingRepository(session).chunk_done(data.mapping_id)
+
+
+async def _import_chunk(session: AsyncSession, data: MappingsTaskData,
+                        logger: Logger):
     def loginfo(msg: str): logger.info(f"{data.mapping_id} > {msg}")
     def logwarn(msg: str): logger.warning(f"{data.mapping_id} > {msg}")
     drug_repository = IDrugRepository(session)
@@ -39,26 +52,37 @@ async def task(session: AsyncSession, data: MappingsTaskData,
         data.related_catalog_id, related_drug_codes)
 
     loginfo("Importing mappins")
+    found = []
     for mapping in data.mappings:
         cid = central_drug_codes.get(mapping.drug_code)
         rid = related_drug_codes.get(mapping.related_drug_code)
-
         if cid and rid:
-            db_mapping = DrugMapping(
+            found.append((mapping, cid, rid))
+
+    created = set()
+    if found:
+        created = await mapping_repository.save_many([
+            DrugMapping(
                 mapping_id=data.mapping_id,
                 drug_id=cid,
                 related_drug_id=rid,
             )
-            saved = await mapping_repository.save(db_mapping)
+            for _, cid, rid in found
+        ])
+
+    for mapping, cid, rid in found:
+        # a pair repeated inside the chunk is only created once
+        saved = (cid, rid) in created
+        created.discard((cid, rid))
 
-            log_message = ' '.join([
-                f"Mapping between, central '{mapping.drug_code}' to",
-                f"related '{mapping.related_drug_code}'",
-                "created." if saved else "already exists."
-            ])
-            if saved:
-                loginfo(log_message)
-            else:
-                logwarn(log_message)
+        log_message = ' '.join([
+            f"Mapping between, central '{mapping.drug_code}' to",
+            f"related '{mapping.related_drug_code}'",
+            "created." if saved else "already exists."
+        ])
+        if saved:
+            loginfo(log_message)
+        else:
+            logwarn(log_message)
 
     loginfo("Mapping chunk import completed")
@@ -6,16 +6,20 @@ from src.application.dto.drug_dto import DrugDto, DrugMappingsCount, DrugPaginat
 from src.application.use_cases.drug.get_all_by_country import DrugCountry, GetDrugsByCountryUseCase
 from src.application.use_cases.drug.get_by_id import GetDrugByIdUseCase
 from src.application.use_cases.drug.get_paginated import GetPaginatedDrugsUseCase
+from src.config.settings import get_config
+from src.config.settings.base import CountStrategy
 from src.domain.entities.user import User
 from src.domain.services.auth_service import manager
 from src.infrastructure.db.base import IdInt
 from src.infrastructure.db.engine import get_session
 from src.infrastructure.repositories.idrug_catalog_repository import (
-    IDrugCatalogRepository,
+    ICachedDrugCatalogRepository,
 )
 from src.infrastructure.repositories.idrug_repository import IDrugRepository
 from src.infrastructure.repositories.imapping_repository import IMappingRepository
-from src.utils.exc import ResourceNotFound
+from src.infrastructure.services.drug_autocomplete import (
+    DrugAutocomplete, get_drug_autocomplete)
+from src.utils.exc import BadRequest, ResourceNotFound
 
 
 drug_router = APIRouter()
@@ -49,7 +53,7 @@ async def get_drug_by_id(
     "/drugs/country/{country}",
     status_code=status.HTTP_200_OK,
     response_model=List[DrugMappingsCount],
-    summary="Get all drugs filtered by name or code",
+    summary="Search drugs by name or code",
 )
 async def get_all_by_name_or_code(
     session: Annotated[AsyncSession, Depends(get_session)],
@@ -57,15 +61,21 @@ async def get_all_by_name_or_code(
     drugnc: Annotated[
         str, Query(description="Filter by 'drug name' or 'drud code'")
     ] = "",
+    limit: Annotated[
+        int, Query(gt=0, le=100, description="Maximum number of drugs, "
+                   "best matches first")
+    ] = 20,
+    autocomplete: Annotated[
+        DrugAutocomplete | None, Depends(get_drug_autocomplete)] = None,
 ):
     # Prepare the repository
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
     drug_repository = IDrugRepository(session)
 
     # Fetch the drug by ID
     use_case = GetDrugsByCountryUseCase(
-        drug_catalog_repository, drug_repository)
-    return await use_case.execute(country, drugnc)
+        drug_catalog_repository, drug_repository, autocomplete)
+    return await use_case.execute(country, drugnc, limit)
 
 
 @drug_router.get(
@@ -84,15 +94,29 @@ async def get_drugs(
     page: Annotated[int, Query(gt=0, example=1)] = 1,
     psize: Annotated[int, Query(gt=0, le=100, example=10)] = 10,
     catalog: Annotated[IdInt, Query(...)] = None,
+    after: Annotated[
+        str | None, Query(
+            description="Cursor of the page to fetch, taken from 'next'. "
+            "Empty for the first page. Ignores 'page' and skips 'total'")
+    ] = None,
+    count: Annotated[
+        CountStrategy | None, Query(
+            description="How 'total' is computed: EXACT, ESTIMATED from the "
+            "import counter (unfiltered lists only) or NONE")
+    ] = None,
 ):
     # Prepare the repository
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
     drug_repository = IDrugRepository(session)
 
     # Fetch paginated drugs
     try:
         use_case = GetPaginatedDrugsUseCase(
             drug_catalog_repository, drug_repository)
-        return await use_case.execute(page, psize, drugnc, catalog)
+        return await use_case.execute(
+            page, psize, drugnc, catalog, after,
+            count or get_config().DRUG_COUNT_STRATEGY)
     except ResourceNotFound as err:
         return err.as_response(status.HTTP_404_NOT_FOUND)
+    except BadRequest as err:
+        return err.as_response(status.HTTP_400_BAD_REQUEST)
@@ -20,9 +20,10 @@ from src.domain.services.auth_service import manager
 from src.infrastructure.db.base import IdInt
 from src.infrastructure.db.engine import get_session
 from src.infrastructure.repositories.idrug_catalog_repository import (
-    IDrugCatalogRepository,
+    ICachedDrugCatalogRepository,
 )
 from src.application.use_cases.drug_catalog.create import DrugCatalogCreateUseCase
+from src.config.settings.imports import IngestionEngine
 from src.infrastructure.services.blob_storage import upload_file
 from src.infrastructure.taskiq.broker import catalog_import_taskiq
 from src.infrastructure.taskiq.catalog_import import ParseTaskData
@@ -43,7 +44,7 @@ async def get_catalog_by_id(
     user: Annotated[User, Depends(manager)],
 ):
     # Prepare the repository
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
 
     # Fetch the catalog by ID
     use_case = GetDrugCatalogByIdUseCase(drug_catalog_repository)
@@ -69,7 +70,7 @@ async def get_catalogs(
     name: Annotated[str, Query(...)] = "",
 ):
     # Prepare the repository
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
 
     # Fetch paginated catalogs
     use_case = GetPaginatedDrugCatalogUseCase(drug_catalog_repository)
@@ -94,9 +95,10 @@ async def create_catalog(
     version: Annotated[str, Form(examples=["1.0"])],
     is_central: Annotated[bool, Form(...)] = False,
     notes: Annotated[str, Form(examples=["Initial release"])] = "",
+    ingestion_engine: Annotated[IngestionEngine | None, Form(...)] = None,
 ):
     # Prepare the dependencies for the create catalog use case
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
     try:
         # Create a new drug catalog entry in the database
         data = DrugCatalogCreateDto(
@@ -123,6 +125,7 @@ async def create_catalog(
         catalog_id=int(result.id),
         filename=filename,
         parser=country,
+        ingestion_engine=ingestion_engine,
     )
     await catalog_import_taskiq.kiq(data.model_dump())
 
@@ -1,30 +1,26 @@
 import uuid
 from typing import Annotated
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dto.mapping import CentralDrugMappingDto
 from src.application.use_cases.mapping.create import MappingCheckUseCase
-from src.application.use_cases.mapping.import_task import MappingImportUseCase
 from src.application.use_cases.mapping.mappings_by_drug_id import DrugMappingsUseCase
-from src.config.settings import get_config
 from src.domain.entities.user import User
 from src.domain.services.auth_service import manager
 from src.infrastructure.db.base import IdInt
 from src.infrastructure.db.engine import get_session
 from src.infrastructure.repositories.idrug_catalog_repository import (
-    IDrugCatalogRepository,
+    ICachedDrugCatalogRepository,
 )
 from src.infrastructure.repositories.idrug_repository import IDrugRepository
 from src.infrastructure.repositories.imapping_repository import IMappingRepository
-from src.infrastructure.repositories.imapping_transaction_repository import (
-    IMappingTransactionRepository,
-)
 from src.infrastructure.services.blob_storage import upload_file
-from src.infrastructure.services.confidential_ledger import ledger_builder
 from src.infrastructure.services.pandas_parser.drug.exc import InvalidFileFormat
 from src.infrastructure.services.pandas_parser.mapping.parse import MappingParser
+from src.infrastructure.taskiq.broker import mapping_file_import_taskiq
+from src.infrastructure.taskiq.mapping_file_import import MappingFileTaskData
 from src.utils.exc import ResourceNotFound
 
 
@@ -40,7 +36,7 @@ async def get_mappings(
     drug_id: IdInt, session: Annotated[AsyncSession, Depends(get_session)]
 ):
     # Prepare the repository and service for the use case
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
     drug_repository = IDrugRepository(session)
     mapping_repository = IMappingRepository(session)
 
@@ -53,13 +49,8 @@ async def get_mappings(
         return err.as_response(status_code=status.HTTP_404_NOT_FOUND)
 
 
-async def mapping_import_bgtask(use_case: MappingImportUseCase):
-    await use_case.execute()
-
-
 @mapping_router.post("/mappings", summary="Import drug mappings from a mapping file")
 async def mapping_upload(
-    background_tasks: BackgroundTasks,
     user: Annotated[User, Depends(manager)],
     session: Annotated[AsyncSession, Depends(get_session)],
     # http form data
@@ -67,7 +58,7 @@ async def mapping_upload(
     catalog_to_id: Annotated[IdInt, Query(examples=["1.0"])],
 ):
     # Prepare the repository and service for the mapping use case
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
 
     # check if the requirements to import the mapping file is valid
     try:
@@ -75,10 +66,9 @@ async def mapping_upload(
         result = await mapping_use_case.execute(catalog_to_id)
     except ResourceNotFound as err:
         return err.as_response(status_code=status.HTTP_400_BAD_REQUEST)
-    # prepare the parser for the mapping file and check if the file is valid
+    # check the mapping file header, the rows are parsed by the worker
     try:
-        file_bytes = await file.read()
-        parser = MappingParser(file_bytes)
+        MappingParser.validate_header(file.file)
     except InvalidFileFormat as err:
         return err.as_response(status_code=status.HTTP_400_BAD_REQUEST)
 
@@ -87,28 +77,15 @@ async def mapping_upload(
     # Upload file to the appropriate storage strategy
     await upload_file(filename, file)
 
-    # Prepare other dependencies for the import task use case
-    transaction_repository = IMappingTransactionRepository(session)
-    ledger_service = ledger_builder(
-        get_config().AZURE_LEDGER_URL, 
-        get_config().AZURE_LEDGER_CERTIFICATE_PATH,
-        get_config().AZURE_CREDENTIAL_TENNANT_ID,
-        get_config().AZURE_CREDENTIAL_CLIENT_ID,
-        get_config().AZURE_CREDENTIAL_CERTIFICATE_PATH,
-        get_config().ENVIRONMENT
-    )
-
-    use_case = MappingImportUseCase(
-        transaction_repository=transaction_repository,
-        ledger_service=ledger_service,
-        mapping_parser=parser,
+    # Parsing and chunk fan-out happen in the worker
+    data = MappingFileTaskData(
         mapping_id=result.mapping_id,
         central_catalog_id=result.central_catalog_id,
         related_catalog_id=catalog_to_id,
+        filename=filename,
+        source_filename=file.filename,
     )
-    await use_case.prepare_task(file)
-    # Add task to be processed in the background tasks
-    background_tasks.add_task(mapping_import_bgtask, use_case=use_case)
+    await mapping_file_import_taskiq.kiq(data.model_dump())
 
     return JSONResponse(
         status_code=201, content={"detail": "mapping created successfully"}
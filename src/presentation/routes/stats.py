@@ -1,16 +1,25 @@
-from typing import Annotated
+from typing import Annotated, List
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.use_cases.stats.get_admin_stats import GetAdminStatsUseCase
 from src.domain.entities.user import User
 from src.domain.services.auth_service import manager
-from src.application.dto.stats_dto import AdminStatsDto, StatsKind
-from src.infrastructure.db.engine import get_session
+from src.application.dto.stats_dto import (
+    AdminStatsDto, AutocompleteIndexStatsDto, CacheStatsDto,
+    DatabasePoolStatsDto, StatsKind)
+from src.config.settings import get_config
+from src.infrastructure.db.engine import get_session, pool_status
 from src.infrastructure.repositories.idrug_catalog_repository import (
-    IDrugCatalogRepository,
+    ICachedDrugCatalogRepository,
+    get_catalog_cache,
 )
+from src.infrastructure.repositories.iuser_repository import get_user_cache
 from src.infrastructure.repositories.imapping_repository import IMappingRepository
+from src.infrastructure.services.confidential_ledger import (
+    get_verification_cache)
+from src.infrastructure.services.drug_autocomplete import (
+    DrugAutocomplete, get_drug_autocomplete)
 
 
 stats_router = APIRouter()
@@ -24,8 +33,56 @@ async def get_stats(
     session: Annotated[AsyncSession, Depends(get_session)],
     kind: Annotated[StatsKind, Query(...)] = "all",
 ):
-    drug_catalog_repository = IDrugCatalogRepository(session)
+    drug_catalog_repository = ICachedDrugCatalogRepository(session)
     mapping_repository = IMappingRepository(session)
 
     usecase = GetAdminStatsUseCase(drug_catalog_repository, mapping_repository)
     return await usecase.execute(kind)
+
+
+@stats_router.get(
+    "/admin/stats/autocomplete",
+    response_model=List[AutocompleteIndexStatsDto],
+    summary="Get memory used by the drug autocomplete indexes of this process",
+)
+async def get_autocomplete_stats(
+    user: Annotated[User, Depends(manager)],
+    autocomplete: Annotated[
+        DrugAutocomplete | None, Depends(get_drug_autocomplete)],
+):
+    if autocomplete is None:
+        return []
+    return [
+        AutocompleteIndexStatsDto(
+            catalog_id=catalog_id, drugs=drugs, memory_bytes=memory_bytes)
+        for catalog_id, (drugs, memory_bytes)
+        in autocomplete.memory_usage().items()
+    ]
+
+
+@stats_router.get(
+    "/admin/stats/caches",
+    response_model=List[CacheStatsDto],
+    summary="Get the hit ratio of the in-memory caches of this process",
+)
+async def get_cache_stats(user: Annotated[User, Depends(manager)]):
+    caches = {
+        "users": get_user_cache(),
+        "catalogs": get_catalog_cache(),
+        "ledger_verification": get_verification_cache(),
+    }
+    return [
+        CacheStatsDto(
+            name=name, size=len(cache), hits=cache.hits,
+            misses=cache.misses, hit_ratio=cache.hit_ratio)
+        for name, cache in caches.items()
+    ]
+
+
+@stats_router.get(
+    "/admin/stats/database",
+    response_model=DatabasePoolStatsDto,
+    summary="Get the database connection pool occupancy of this process",
+)
+async def get_database_stats(user: Annotated[User, Depends(manager)]):
+    return DatabasePoolStatsDto(runner=get_config().RUNNER, **pool_status())
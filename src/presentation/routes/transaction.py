@@ -5,11 +5,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.use_cases.transaction.verify_transaction import (
     VerifyTransactionUseCase,
 )
+from src.application.use_cases.transaction.verify_catalog_transactions import (
+    VerifyCatalogTransactionsUseCase,
+)
 from src.config.settings import get_config
 from src.domain.entities.user import User
 from src.infrastructure.db.base import IdInt
 from src.domain.services.auth_service import manager
 from src.application.dto.transaction import CatalogTransactionDto, TransactionDto
+from src.application.dto.transaction import TransactionVerificationDto
 from src.application.dto.transaction import MappingTransactionDto
 from src.infrastructure.db.engine import get_session
 from src.infrastructure.repositories.icatalog_transaction_repository import (
@@ -27,7 +31,10 @@ from src.application.use_cases.transaction.get_mapping_transaction import (
 from src.infrastructure.repositories.itransaction_repository import (
     ITransactionRepository,
 )
-from src.infrastructure.services.confidential_ledger import ledger_builder
+from src.infrastructure.services.confidential_ledger import (
+    get_ledger, get_verification_cache)
+from src.infrastructure.services.confidential_ledger.contract import LedgerInterface
+from src.utils.cache import TTLCache
 
 
 transaction_router = APIRouter()
@@ -66,16 +73,30 @@ async def get_catalog_mappings_transactions(
 async def ledger_transaction_verification(
     transaction_id: str,
     session: Annotated[AsyncSession, Depends(get_session)],
+    ledger_service: Annotated[LedgerInterface, Depends(get_ledger)],
+    cache: Annotated[TTLCache, Depends(get_verification_cache)],
     user: Annotated[User, Depends(manager)],
 ):
-    ledger_service = ledger_builder(
-        get_config().AZURE_LEDGER_URL, 
-        get_config().AZURE_LEDGER_CERTIFICATE_PATH,
-        get_config().AZURE_CREDENTIAL_TENNANT_ID,
-        get_config().AZURE_CREDENTIAL_CLIENT_ID,
-        get_config().AZURE_CREDENTIAL_CERTIFICATE_PATH,
-        get_config().ENVIRONMENT
-    )
     ct_repository = ITransactionRepository(session)
-    use_case = VerifyTransactionUseCase(ct_repository, ledger_service)
+    use_case = VerifyTransactionUseCase(
+        ct_repository, ledger_service, cache,
+        get_config().LEDGER_VERIFY_PENDING_TTL)
     return await use_case.execute(transaction_id)
+
+
+@transaction_router.get(
+    "/transactions/catalogs/{catalog_id}/verify",
+    response_model=List[TransactionVerificationDto],
+)
+async def catalog_transactions_verification(
+    catalog_id: IdInt,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    ledger_service: Annotated[LedgerInterface, Depends(get_ledger)],
+    cache: Annotated[TTLCache, Depends(get_verification_cache)],
+    user: Annotated[User, Depends(manager)],
+):
+    ct_repository = ICatalogTransactionRepository(session)
+    use_case = VerifyCatalogTransactionsUseCase(
+        ct_repository, ledger_service, cache,
+        get_config().LEDGER_VERIFY_PENDING_TTL)
+    return await use_case.execute(catalog_id)
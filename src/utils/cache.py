@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """In-process LRU cache whose entries can expire.
+
+    Entries are kept for `ttl` seconds, or until evicted when `ttl` is None.
+    Once `maxsize` entries are stored the least recently used one is dropped.
+    Not shared between processes, every worker keeps its own copy. Lookups
+    through `get` are counted in `hits` and `misses`.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, Tuple[V, float | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self._get(key, _MISSING) is not _MISSING
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def _get(self, key: K, default):
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def get(self, key: K, default=None):
+        value = self._get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = _MISSING):
+        """Stores `value`, `ttl` overrides the cache default for this entry."""
+        ttl = self._ttl if ttl is _MISSING else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default=None):
+        value = self._get(key, default)
+        self._data.pop(key, None)
+        return value
+
+    def clear(self):
+        self._data.clear()
@@ -0,0 +1,21 @@
+import base64
+import binascii
+
+from src.utils.exc import BadRequest, ErrorCodes
+
+
+def encode_cursor(last_id: int) -> str:
+    """Opaque cursor pointing right after the row with id `last_id`."""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Id encoded in `cursor`, a BIGINT id as the ones it is compared with."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeError, ValueError):
+        raise BadRequest("Invalid pagination cursor", ErrorCodes.INVALID_CURSOR)
+    if not 0 <= last_id < 2**63:
+        raise BadRequest("Invalid pagination cursor", ErrorCodes.INVALID_CURSOR)
+    return last_id
@@ -12,6 +12,7 @@ class ErrorCodes(str, Enum):
     CENTRAL_CATALOG_ALREADY_EXISTS = "CENTRAL_CATALOG_ALREADY_EXISTS"
     RESOURCE_STILL_PROCESSING = "RESOURCE_STILL_PROCESSING"
     LEDGER_ERROR = "LEDGER_ERROR"
+    INVALID_CURSOR = "INVALID_CURSOR"
 
 
 class BaseSystemException(Exception):
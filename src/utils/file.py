@@ -1,3 +1,4 @@
+import codecs
 import chardet
 from io import BytesIO
 from pathlib import Path
@@ -49,3 +50,40 @@ def detect_file_encoding(
         # Log error here if needed
         # Example fallback
         return "utf-8"  # fallback to utf-8
+
+
+def decodes_with(
+        source: BytesIO | str, encoding: str, block_size: int = 1 << 20) -> bool:
+    """
+    Checks that a whole file or byte stream decodes with an encoding.
+
+    The source is read in blocks, so large files are checked without being
+    loaded at once. A stream is rewound afterwards.
+
+    Args:
+        source (BytesIO | str): File path or BytesIO stream.
+        encoding (str): Encoding to decode with.
+        block_size (int): Number of bytes decoded at a time.
+
+    Returns:
+        bool: False if a byte sequence does not decode or the encoding is
+        unknown.
+    """
+    def decode_all(file) -> bool:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        while block := file.read(block_size):
+            decoder.decode(block)
+        decoder.decode(b"", final=True)
+        return True
+
+    try:
+        if isinstance(source, BytesIO):
+            source.seek(0)
+            try:
+                return decode_all(source)
+            finally:
+                source.seek(0)
+        with open(source, "rb") as file:
+            return decode_all(file)
+    except (UnicodeDecodeError, LookupError):
+        return False
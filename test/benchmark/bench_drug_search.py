@@ -0,0 +1,108 @@
+"""Latency of the ranked drug search behind /drugs/country/{country}.
+
+Needs the Postgres database of DATABASE_URL migrated to head, pg_trgm
+included. A throwaway catalog is filled with generated drugs, every kind of
+term is searched repeatedly and p50/p95 are compared with the target. The
+catalog and its drugs are deleted afterwards.
+
+Usage: python -m test.benchmark.bench_drug_search [rows] [p95 target ms]
+"""
+import sys
+import time
+import random
+import asyncio
+import statistics
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.config.settings import get_config
+from src.domain.entities.drug import Drug
+from src.domain.entities.drug_catalog import DrugCatalog
+from src.infrastructure.repositories.idrug_repository import IDrugRepository
+
+
+LIMIT = 20
+RUNS = 200
+WORDS = ["amoxi", "parace", "ibupro", "cillin", "tamol", "metfor", "predni",
+         "losar", "atorva", "omepra", "sertra", "levoth", "cetiri", "diclo"]
+
+
+def drug_name(i: int) -> str:
+    rng = random.Random(i)
+    return f"{rng.choice(WORDS)}{rng.choice(WORDS)} {rng.randint(1, 1000)} mg"
+
+
+# (label, term generator)
+TERMS = [
+    ("empty", lambda rng, rows: ""),
+    ("exact code", lambda rng, rows: f"BC{rng.randrange(rows):07d}"),
+    ("code prefix", lambda rng, rows: f"BC{rng.randrange(rows // 1000):04d}"),
+    ("short", lambda rng, rows: rng.choice(WORDS)[:2]),
+    ("name", lambda rng, rows: rng.choice(WORDS)),
+    ("no match", lambda rng, rows: "zzzzqq"),
+]
+
+
+async def prepare_catalog(session, rows: int) -> int:
+    catalog = DrugCatalog(
+        name="Search benchmark", country="XX", version="0",
+        notes="bench_drug_search, safe to delete")
+    catalog.status = "completed"
+    session.add(catalog)
+    await session.commit()
+
+    for start in range(0, rows, 10_000):
+        await session.execute(insert(Drug.__table__), [
+            {"catalog_id": catalog._id, "drug_code": f"BC{i:07d}",
+             "drug_name": drug_name(i), "properties": {}}
+            for i in range(start, min(start + 10_000, rows))
+        ])
+    await session.commit()
+    await session.execute(text("ANALYZE drugs"))
+    return catalog._id
+
+
+async def main(rows: int, target_ms: float) -> bool:
+    engine = create_async_engine(get_config().DATABASE_URL)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    rng = random.Random(0)
+
+    async with sessionmaker() as session:
+        catalog_id = await prepare_catalog(session, rows)
+    try:
+        print(f"rows: {rows}, limit: {LIMIT}, p95 target: {target_ms:.0f}ms")
+        failed = False
+        for label, term in TERMS:
+            timings = []
+            async with sessionmaker() as session:
+                repository = IDrugRepository(session)
+                for run in range(RUNS + 10):
+                    started = time.perf_counter()
+                    await repository.search_by_catalog_id(
+                        catalog_id, term(rng, rows), LIMIT)
+                    # the first runs only warm the connection and caches
+                    if run >= 10:
+                        timings.append((time.perf_counter() - started) * 1000)
+            p50 = statistics.median(timings)
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            failed |= p95 > target_ms
+            print(f"{label:<12} p50={p50:7.2f}ms p95={p95:7.2f}ms "
+                  f"{'ok' if p95 <= target_ms else 'SLOW'}")
+    finally:
+        async with sessionmaker() as session:
+            await session.execute(
+                delete(Drug).where(Drug._catalog_id == catalog_id))
+            await session.execute(
+                delete(DrugCatalog).where(DrugCatalog._id == catalog_id))
+            await session.commit()
+        await engine.dispose()
+    return not failed
+
+
+if __name__ == "__main__":
+    passed = asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 50.0,
+    ))
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,118 @@
+"""Latency of other requests while a storm of logins checks passwords.
+
+Logins run the real UserLoginUseCase against an in-memory user hashed with
+BCRYPT_ROUNDS. They arrive at a fixed rate, next to a stream of cheap
+requests on the same event loop that lasts until every login is answered.
+The "inline" run checks passwords on the event loop, as logins used to,
+the "executor" run goes through password_service. Cheap requests are timed
+from when they were due, their p99 shows how long the loop was held.
+
+Usage: python -m test.benchmark.bench_login_storm [logins] [logins per second]
+"""
+import os
+import sys
+import time
+import asyncio
+import statistics
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("ENVIRONMENT", "TEST")
+
+from fastapi import FastAPI  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.application.dto.auth_dto import AuthDto  # noqa: E402
+from src.application.use_cases.auth.user_login import (  # noqa: E402
+    UserLoginUseCase)
+from src.config.settings import get_config  # noqa: E402
+from src.domain.entities.user import User  # noqa: E402
+from src.domain.services.password_service import (  # noqa: E402
+    shutdown_password_executor)
+from src.utils.exc import UnauthorizedAccessError  # noqa: E402
+
+
+PING_INTERVAL = 0.005
+
+
+def build_app(user: User) -> FastAPI:
+    app = FastAPI()
+    user_repository = AsyncMock(get_user_by_email=AsyncMock(return_value=user))
+    token_service = MagicMock(generate_token=MagicMock(return_value="token"))
+
+    @app.post("/login")
+    async def login(data: AuthDto):
+        use_case = UserLoginUseCase(
+            user_repository, token_service, token_service)
+        try:
+            return await use_case.execute(data)
+        except UnauthorizedAccessError:
+            return {}
+
+    @app.get("/ping")
+    async def ping():
+        return {}
+
+    return app
+
+
+async def inline_verify(user: User, raw_password: str) -> bool:
+    return user.verify_password(raw_password)
+
+
+async def storm(client, logins: int, rate: float):
+    timings = []
+    done = asyncio.Event()
+
+    async def login(i: int):
+        await asyncio.sleep(i / rate)
+        await client.post(
+            "/login", json={"username": "a@b.com", "password": "secret"})
+
+    async def all_logins():
+        await asyncio.gather(*[login(i) for i in range(logins)])
+        done.set()
+
+    async def pings():
+        while not done.is_set():
+            # a ping is due once the sleep is over, a blocked loop delays it
+            due = time.perf_counter() + PING_INTERVAL
+            await asyncio.sleep(PING_INTERVAL)
+            await client.get("/ping")
+            timings.append((time.perf_counter() - due) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(pings(), all_logins())
+    return time.perf_counter() - started, timings
+
+
+async def main(logins: int, rate: float):
+    config = get_config()
+    user = User(name="Bench", email="a@b.com", password="secret")
+    app = build_app(user)
+    print(f"logins: {logins}, arriving at {rate:.0f}/s, "
+          f"bcrypt rounds: {config.BCRYPT_ROUNDS}, "
+          f"hash workers: {config.PASSWORD_HASH_WORKERS}")
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        for label in ("inline", "executor"):
+            target = ("src.application.use_cases.auth.user_login"
+                      ".verify_password")
+            if label == "inline":
+                with patch(target, inline_verify):
+                    seconds, timings = await storm(client, logins, rate)
+            else:
+                seconds, timings = await storm(client, logins, rate)
+            p50 = statistics.median(timings)
+            p99 = statistics.quantiles(timings, n=100)[-1]
+            print(f"{label:<9} ping p50={p50:8.2f}ms p99={p99:8.2f}ms "
+                  f"logins/s={logins / seconds:6.1f}")
+    shutdown_password_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 20.0,
+    ))
@@ -0,0 +1,139 @@
+"""End to end mapping import for several chunk settings on an in-memory broker.
+
+Every configuration parses the same mapping file, fans it out through
+MappingImportUseCase to an InMemoryBroker whose task runs the real
+mapping_import task against a SQLite database, and waits for every chunk.
+
+Usage: python -m test.benchmark.bench_mapping_chunks [rows]
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("ENVIRONMENT", "TEST")
+
+import pandas as pd  # noqa: E402
+from sqlalchemy import delete, func, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    async_sessionmaker, create_async_engine)
+from taskiq import InMemoryBroker  # noqa: E402
+
+from src.application.use_cases.mapping.import_task import (  # noqa: E402
+    MappingImportUseCase)
+from src.domain.entities.drug import Drug  # noqa: E402
+from src.domain.entities.drug_catalog import DrugCatalog  # noqa: E402
+from src.domain.entities.drug_mapping import (  # noqa: E402
+    DrugMapping, MappingImportProgress)
+from src.infrastructure.db.base import Base  # noqa: E402
+from src.infrastructure.repositories.imapping_repository import (  # noqa: E402
+    IMappingRepository)
+from src.infrastructure.services.pandas_parser.mapping.parse import (  # noqa: E402
+    MappingParserLoader)
+from src.infrastructure.taskiq.mapping_import import (  # noqa: E402
+    MappingsTaskData, task as mapping_import)
+
+
+CENTRAL_CATALOG_ID, RELATED_CATALOG_ID = 1, 2
+# (rows per chunk, target bytes per message, chunks in flight)
+SETTINGS = [
+    (100, None, None),
+    (1_000, None, None),
+    (5_000, None, None),
+    (5_000, 64 * 1024, None),
+    (1_000, None, 4),
+]
+
+
+async def prepare_database(engine, rows: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            DrugCatalog.__table__, Drug.__table__, DrugMapping.__table__,
+            MappingImportProgress.__table__])
+        await conn.execute(insert(Drug.__table__), [
+            {"id": catalog_id * 10_000_000 + i, "catalog_id": catalog_id,
+             "drug_code": f"{prefix}{i}", "drug_name": f"Drug {i}",
+             "properties": {}}
+            for catalog_id, prefix in ((CENTRAL_CATALOG_ID, "C"),
+                                       (RELATED_CATALOG_ID, "R"))
+            for i in range(rows)
+        ])
+
+
+def mapping_file(rows: int) -> bytes:
+    return pd.DataFrame({
+        "drug_code": [f"C{i}" for i in range(rows)],
+        "related_drug_code": [f"R{i}" for i in range(rows)],
+    }).to_csv(index=False).encode()
+
+
+async def run(broker, sessionmaker, file_bytes, chunk_rows, chunk_bytes,
+              max_in_flight):
+    async with sessionmaker() as session:
+        await session.execute(delete(DrugMapping))
+        await session.commit()
+
+    started = time.perf_counter()
+    async with sessionmaker() as session:
+        use_case = MappingImportUseCase(
+            AsyncMock(), MagicMock(), MappingParserLoader(file_bytes), 1,
+            CENTRAL_CATALOG_ID, RELATED_CATALOG_ID,
+            chunk_rows=chunk_rows, chunk_bytes=chunk_bytes,
+            mapping_repository=IMappingRepository(session),
+            max_in_flight=max_in_flight,
+        )
+        use_case._update_status = AsyncMock()
+        await use_case.execute()
+    await broker.wait_all()
+    seconds = time.perf_counter() - started
+
+    async with sessionmaker() as session:
+        saved = await session.scalar(select(func.count()).select_from(DrugMapping))
+    return seconds, saved
+
+
+async def main(rows: int):
+    logging.getLogger("src.infrastructure.taskiq.mapping_import").setLevel(
+        logging.WARNING)
+    with tempfile.TemporaryDirectory() as folder:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{folder}/bench.db",
+            connect_args={"timeout": 60})
+        sessionmaker = async_sessionmaker(engine)
+        await prepare_database(engine, rows)
+
+        broker = InMemoryBroker()
+        messages = []
+
+        @broker.task
+        async def mapping_import_taskiq(data: dict):
+            messages.append(data)
+            async with sessionmaker() as session:
+                await mapping_import(
+                    session, MappingsTaskData.model_validate(data))
+
+        file_bytes = mapping_file(rows)
+        print(f"rows: {rows}")
+        with patch(
+            "src.application.use_cases.mapping.import_task"
+            ".mapping_import_taskiq", mapping_import_taskiq
+        ):
+            for chunk_rows, chunk_bytes, max_in_flight in SETTINGS:
+                messages.clear()
+                seconds, saved = await run(
+                    broker, sessionmaker, file_bytes, chunk_rows, chunk_bytes,
+                    max_in_flight)
+                print(
+                    f"rows/chunk={chunk_rows:<6} bytes/chunk={chunk_bytes!s:<6} "
+                    f"in-flight={max_in_flight!s:<5} "
+                    f"messages={len(messages):<6} "
+                    f"saved={saved:<8} {seconds:6.2f}s "
+                    f"({rows / seconds:,.0f} mappings/s)")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
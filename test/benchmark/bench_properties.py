@@ -0,0 +1,68 @@
+"""Compares the row-wise properties builder with PandasParser._build_properties.
+
+Usage: python -m test.benchmark.bench_properties [rows]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from src.infrastructure.services.pandas_parser.drug.contract import (
+    PandasParser)
+
+
+class SyntheticParser(PandasParser):
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    def _open(self):
+        return self._df
+
+    def _required_columns(self):
+        return []
+
+    def parse(self):
+        pass
+
+
+def synthetic_catalog(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "ID": [f"XX_{i + 1}" for i in range(rows)],
+        "Name": [f"Drug {i}" for i in range(rows)],
+    })
+    for col in range(8):
+        values = rng.choice(["tablet", "capsule", "syrup", None], rows)
+        df[f"text_{col}"] = values
+    for col in range(4):
+        values = rng.random(rows)
+        values[rng.random(rows) < 0.3] = np.nan
+        df[f"number_{col}"] = values
+    return df
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main(rows: int):
+    df = synthetic_catalog(rows)
+    parser = SyntheticParser(df)
+
+    expected, apply_seconds = timed(lambda: df.apply(
+        lambda row: row.drop(["ID", "Name"]).dropna().to_dict(), axis=1
+    ).tolist())
+    result, builder_seconds = timed(
+        lambda: parser._build_properties(["ID", "Name"]))
+
+    assert repr(result) == repr(expected), "outputs differ"
+    print(f"rows:               {rows}")
+    print(f"apply(axis=1):      {apply_seconds:.2f}s")
+    print(f"_build_properties:  {builder_seconds:.2f}s")
+    print(f"speedup:            {apply_seconds / builder_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
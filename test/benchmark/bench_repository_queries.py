@@ -0,0 +1,129 @@
+"""Hot repository lookups with statements built per call vs built once.
+
+Every lookup runs against an in-memory SQLite database, first with its
+statement constructed on each call as the repositories used to, then
+through the repository and its module-level statement. The difference is
+the Python time spent building the statement and its cache key.
+
+Usage: python -m test.benchmark.bench_repository_queries [calls]
+"""
+import os
+import sys
+import time
+import asyncio
+
+os.environ.setdefault("ENVIRONMENT", "TEST")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    async_sessionmaker, create_async_engine)
+
+from src.domain.entities.drug import Drug  # noqa: E402
+from src.domain.entities.drug_catalog import DrugCatalog  # noqa: E402
+from src.domain.entities.drug_mapping import DrugMapping  # noqa: E402
+from src.domain.entities.user import User  # noqa: E402
+from src.infrastructure.db.base import Base  # noqa: E402
+from src.infrastructure.repositories.idrug_catalog_repository import (  # noqa: E402
+    IDrugCatalogRepository)
+from src.infrastructure.repositories.idrug_repository import (  # noqa: E402
+    IDrugRepository)
+from src.infrastructure.repositories.imapping_repository import (  # noqa: E402
+    IMappingRepository)
+from src.infrastructure.repositories.iuser_repository import (  # noqa: E402
+    IUserRepository)
+
+
+async def prepare(session) -> int:
+    central = DrugCatalog._mock(1, status="completed")
+    central.is_central = True
+    session.add_all([central, DrugCatalog._mock(2, status="completed")])
+    session.add_all([Drug._mock(1), Drug._mock(2), Drug._mock(3)])
+    await session.flush()
+    session.add_all([DrugMapping(9, 1, 2), DrugMapping(9, 1, 3)])
+    user = User(name="Bench", email="bench@example.com", password="bench")
+    session.add(user)
+    sub = user.sub
+    await session.commit()
+    return sub
+
+
+def per_call_lookups(session, sub: int):
+    # the statements as the repositories built them on every call
+    async def drug_by_id():
+        result = await session.execute(select(Drug).where(Drug._id == 1))
+        return result.scalar_one_or_none()
+
+    async def mappings_by_central_drug_id():
+        result = await session.execute(
+            select(
+                Drug._id.label("id"),
+                Drug.drug_code.label("drug_code"),
+                Drug.drug_name.label("drug_name"),
+                DrugCatalog.country.label("country"),
+                Drug.properties.label("properties"),
+            )
+            .select_from(DrugMapping)
+            .join(Drug, Drug._id == DrugMapping._related_drug_id)
+            .join(DrugCatalog, Drug._catalog_id == DrugCatalog._id)
+            .where(DrugMapping._drug_id == 1))
+        return result.fetchall()
+
+    async def user_by_sub():
+        result = await session.execute(select(User).where(User.sub == sub))
+        return result.scalar_one_or_none()
+
+    async def central_catalog():
+        result = await session.execute(
+            select(DrugCatalog).where(DrugCatalog.is_central.is_(True)))
+        return result.scalars().one_or_none()
+
+    return {
+        "drug get_by_id": drug_by_id,
+        "mappings by central drug": mappings_by_central_drug_id,
+        "user get_by_sub": user_by_sub,
+        "catalog get_central": central_catalog,
+    }
+
+
+def repository_lookups(session, sub: int):
+    return {
+        "drug get_by_id": lambda: IDrugRepository(session).get_by_id(1),
+        "mappings by central drug": lambda: IMappingRepository(
+            session).get_mappings_by_central_drug_id(1),
+        "user get_by_sub": lambda: IUserRepository(session).get_by_sub(sub),
+        "catalog get_central": lambda: IDrugCatalogRepository(
+            session).get_central(),
+    }
+
+
+async def timed(lookup, calls: int) -> float:
+    for _ in range(100):
+        await lookup()
+    started = time.perf_counter()
+    for _ in range(calls):
+        await lookup()
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+async def main(calls: int):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            DrugCatalog.__table__, Drug.__table__, DrugMapping.__table__,
+            User.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        sub = await prepare(session)
+        per_call = per_call_lookups(session, sub)
+        prebuilt = repository_lookups(session, sub)
+        print(f"calls: {calls}")
+        for name in per_call:
+            before = await timed(per_call[name], calls)
+            after = await timed(prebuilt[name], calls)
+            print(f"{name:<25} per call={before:7.1f}us "
+                  f"prebuilt={after:7.1f}us ({before / after:4.2f}x)")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000))
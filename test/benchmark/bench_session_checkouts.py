@@ -0,0 +1,143 @@
+"""Pool checkouts per authenticated request, shared vs separate sessions.
+
+Two routes mirror an authenticated handler: an auth dependency reading the
+user through `get_session`, then the handler querying through it as well.
+The shared route relies on FastAPI's per-request dependency cache, as the
+API does. The separate route opts out of it with `use_cache=False`, which
+gives two sessions per request. Both are driven at a fixed concurrency
+against a file SQLite database whose pool is smaller than that concurrency.
+With separate sessions every connection can end up held by an auth session
+waiting for a second one, those requests fail on the pool timeout.
+
+Usage: python -m test.benchmark.bench_session_checkouts [requests] [concurrency]
+"""
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import statistics
+
+os.environ.setdefault("ENVIRONMENT", "TEST")
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    async_sessionmaker, create_async_engine)
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # noqa: E402
+
+from src.infrastructure.db.engine import get_session  # noqa: E402
+
+
+POOL_SIZE = 5
+POOL_TIMEOUT = 2
+
+
+class PoolStats:
+    def __init__(self, engine):
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak = 0
+        event.listen(engine.sync_engine, "checkout", self._checkout)
+        event.listen(engine.sync_engine, "checkin", self._checkin)
+
+    def _checkout(self, *_):
+        self.checkouts += 1
+        self.checked_out += 1
+        self.peak = max(self.peak, self.checked_out)
+
+    def _checkin(self, *_):
+        self.checked_out -= 1
+
+    def reset(self):
+        self.checkouts = self.peak = 0
+
+
+async def auth(session=Depends(get_session)):
+    # stands in for the user lookup of `manager`
+    await session.execute(text("SELECT 1"))
+    return session
+
+
+def build_app(sessionmaker) -> FastAPI:
+    app = FastAPI()
+
+    async def session_override():
+        async with sessionmaker() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = session_override
+
+    @app.get("/shared")
+    async def shared(user=Depends(auth), session=Depends(get_session)):
+        await session.execute(text("SELECT 1"))
+        await asyncio.sleep(0.005)
+        return {}
+
+    @app.get("/separate")
+    async def separate(
+        user=Depends(auth), session=Depends(get_session, use_cache=False)
+    ):
+        await session.execute(text("SELECT 1"))
+        await asyncio.sleep(0.005)
+        return {}
+
+    return app
+
+
+async def run(client, path: str, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    timings, errors = [], []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                response.raise_for_status()
+            except Exception as err:
+                errors.append(err)
+                return
+            timings.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(requests)])
+    return time.perf_counter() - started, timings, errors
+
+
+async def main(requests: int, concurrency: int):
+    with tempfile.TemporaryDirectory() as folder:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{folder}/bench.db",
+            poolclass=AsyncAdaptedQueuePool, pool_size=POOL_SIZE,
+            max_overflow=0, pool_timeout=POOL_TIMEOUT)
+        stats = PoolStats(engine)
+        app = build_app(async_sessionmaker(engine))
+
+        print(f"requests: {requests}, concurrency: {concurrency}, "
+              f"pool size: {POOL_SIZE}")
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            for path in ("/separate", "/shared"):
+                await run(client, path, concurrency, concurrency)
+                stats.reset()
+                seconds, timings, errors = await run(
+                    client, path, requests, concurrency)
+                p95 = (statistics.quantiles(timings, n=20)[-1]
+                       if len(timings) > 1 else float("nan"))
+                print(
+                    f"{path:<10} checkouts/request="
+                    f"{stats.checkouts / requests:.2f} "
+                    f"peak checked out={stats.peak} "
+                    f"failed={len(errors)} "
+                    f"p95={p95:7.2f}ms {requests / seconds:8,.0f} req/s")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    ))
@@ -0,0 +1,54 @@
+"""Peak memory of the FI XML parser, whole file vs streamed in chunks.
+
+Usage: python -m test.benchmark.bench_xml_parse [products] [chunksize]
+"""
+import io
+import sys
+import time
+import tracemalloc
+
+from src.infrastructure.services.pandas_parser.drug.impl.ifi import FI_Parser
+
+
+def synthetic_catalog(products: int) -> bytes:
+    items = "".join(
+        f'<Laakevalmiste id="{i}">'
+        f"<Kauppanimi>Drug {i}</Kauppanimi>"
+        f'<ATC-koodi id="N02BE{i % 100:02d}"/>'
+        '<Laakemuoto value="Tabletti"/>'
+        "<Myyntilupa><Myontipaiva>2020-01-01</Myontipaiva>"
+        "<LuvanHaltija>Pharma Oy</LuvanHaltija></Myyntilupa>"
+        "</Laakevalmiste>"
+        for i in range(products)
+    )
+    return f"<Root><Laakevalmisteet>{items}</Laakevalmisteet></Root>".encode()
+
+
+def measure(data: bytes, chunksize: int | None):
+    tracemalloc.start()
+    started = time.perf_counter()
+    parser = FI_Parser(io.BytesIO(data), chunksize=chunksize)
+    parser.parse()
+    rows = len(parser._df)
+    while parser._next_chunk():
+        parser.parse()
+        rows += len(parser._df)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, seconds, peak / 2**20
+
+
+def main(products: int, chunksize: int):
+    data = synthetic_catalog(products)
+    print(f"products: {products} ({len(data) / 2**20:.1f} MiB of XML)")
+    for label, size in (("whole file", None), (f"chunks of {chunksize}", chunksize)):
+        rows, seconds, peak = measure(data, size)
+        print(f"{label:>16}: {rows} rows in {seconds:.2f}s, peak {peak:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5_000,
+    )
@@ -1,10 +1,13 @@
 import pytest
-from fastapi import HTTPException, status
+from httpx import ASGITransport, AsyncClient
+from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.security import SecurityScopes
+from sqlalchemy.ext.asyncio import AsyncSession
 from unittest.mock import AsyncMock, MagicMock
 
 from src.utils.exc import UnauthorizedAccessError
 from src.domain.services.auth_service import manager
+from src.infrastructure.db.engine import get_session
 
 @pytest.mark.asyncio
 async def test_manager_success():
@@ -19,7 +22,7 @@ async def test_manager_success():
 
     # Mock dependencies
     with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("src.domain.services.auth_service.IUserRepository", lambda _: mock_user_repository)
+        mp.setattr("src.domain.services.auth_service.ICachedUserRepository", lambda _: mock_user_repository)
         mp.setattr("src.domain.services.auth_service.IAccessTokenService", lambda _: mock_access_token_service)
         mp.setattr("src.domain.services.auth_service.ApiAuthorizationUseCase", lambda *_: mock_api_auth)
 
@@ -43,7 +46,7 @@ async def test_manager_unauthorized_access_error():
 
     # Mock dependencies
     with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("src.domain.services.auth_service.IUserRepository", lambda _: mock_user_repository)
+        mp.setattr("src.domain.services.auth_service.ICachedUserRepository", lambda _: mock_user_repository)
         mp.setattr("src.domain.services.auth_service.IAccessTokenService", lambda _: mock_access_token_service)
         mp.setattr("src.domain.services.auth_service.ApiAuthorizationUseCase", lambda *_: mock_api_auth)
 
@@ -53,3 +56,38 @@ async def test_manager_unauthorized_access_error():
             
         assert exc_info.value.detail == "Unauthorized"
         mock_api_auth.execute.assert_called_once_with(mock_token, mock_security_scopes)
+
+
+@pytest.mark.asyncio
+async def test_manager_shares_the_route_session():
+    # Arrange
+    app = FastAPI()
+    sessions = []
+
+    async def fake_session():
+        session = AsyncMock(spec=AsyncSession)
+        sessions.append(session)
+        yield session
+
+    @app.get("/")
+    async def route(user=Depends(manager), session=Depends(get_session)):
+        return {"shared": user is session}
+
+    app.dependency_overrides[get_session] = fake_session
+
+    def fake_api_auth(user_repository, _):
+        # the "user" is the session the repository was built with
+        return MagicMock(execute=AsyncMock(return_value=user_repository.session))
+
+    # Act
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.domain.services.auth_service.ApiAuthorizationUseCase", fake_api_auth)
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/", headers={"Authorization": "Bearer token"})
+
+    # Assert
+    assert response.json() == {"shared": True}
+    assert len(sessions) == 1
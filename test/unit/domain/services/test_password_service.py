@@ -0,0 +1,47 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.services import password_service
+
+
+@pytest.fixture(autouse=True)
+def executor():
+    yield
+    password_service.shutdown_password_executor()
+
+
+@pytest.mark.asyncio
+async def test_verify_password_runs_off_the_event_loop():
+    # Arrange
+    threads = []
+    user = MagicMock()
+    user.verify_password.side_effect = lambda raw: (
+        threads.append(threading.current_thread().name) or raw == "secret")
+
+    # Act
+    valid = await password_service.verify_password(user, "secret")
+    invalid = await password_service.verify_password(user, "wrong")
+
+    # Assert
+    assert (valid, invalid) == (True, False)
+    assert all(name.startswith("bcrypt") for name in threads)
+    assert threading.current_thread().name not in threads
+
+
+@pytest.mark.asyncio
+async def test_verify_password_checks_the_bcrypt_hash(monkeypatch):
+    # Arrange
+    config = MagicMock(BCRYPT_ROUNDS=4)
+    monkeypatch.setattr("src.domain.entities.user.get_config", lambda: config)
+    user = User(name="Test", email="test@example.com", password="secret")
+
+    # Act
+    valid = await password_service.verify_password(user, "secret")
+    invalid = await password_service.verify_password(user, "wrong")
+
+    # Assert
+    assert user.password.startswith("$2b$04$")
+    assert (valid, invalid) == (True, False)
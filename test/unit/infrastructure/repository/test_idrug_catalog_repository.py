@@ -1,11 +1,15 @@
 import pytest
 from unittest.mock import AsyncMock
 from sqlalchemy import Result
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine)
 
 from src.domain.entities.drug_catalog import DrugCatalog
+from src.infrastructure.db.base import Base, column_snapshot
 from src.infrastructure.repositories.contract import PagedItems
-from src.infrastructure.repositories.idrug_catalog_repository import IDrugCatalogRepository
+from src.infrastructure.repositories.idrug_catalog_repository import (
+    ICachedDrugCatalogRepository, IDrugCatalogRepository)
+from src.utils.cache import TTLCache
 
 drug_catalog = DrugCatalog(
     name="Test Catalog", country="PA", version="1.0", 
@@ -85,6 +89,21 @@ async def test_status_update_failed():
     mock_session.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_drug_count_update():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    repository = IDrugCatalogRepository(mock_session)
+
+    # Act
+    await repository.drug_count_update(1, 500)
+
+    # Assert
+    mock_session.execute.assert_called_once()
+    params = mock_session.execute.call_args.args[0].compile().params
+    assert params["drug_count"] == 500
+
+
 @pytest.mark.asyncio
 async def test_get_total_count():
     # Arrange
@@ -151,3 +170,115 @@ async def test_get_paginated():
     assert result.total_count == 10
     assert len(result.items) == 1
     assert result.items[0] == drug_catalog
+
+
+def _cached_repository(mock_session, catalog):
+    mock_execute_result = AsyncMock(spec=Result)
+    mock_execute_result.scalars.return_value.one_or_none.return_value = catalog
+    mock_execute_result.scalars.return_value.first.return_value = catalog
+    mock_session.execute.return_value = mock_execute_result
+    return ICachedDrugCatalogRepository(mock_session, TTLCache())
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_reads_settled_catalogs_once():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    catalog = DrugCatalog._mock(1, status="completed")
+    repository = _cached_repository(mock_session, catalog)
+
+    # Act
+    results = [
+        await repository.get_by_id(1), await repository.get_by_id(1),
+        await repository.get_central(), await repository.get_central(),
+        await repository.get_first_by_country("CA"),
+        await repository.get_first_by_country("CA"),
+    ]
+
+    # Assert
+    assert results[::2] == [catalog] * 3
+    # hits are copies, never the instance the session loaded
+    assert all(cached is not catalog for cached in results[1::2])
+    assert all(column_snapshot(cached) == column_snapshot(catalog)
+               for cached in results)
+    assert mock_session.execute.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_caches_missing_catalogs():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    repository = _cached_repository(mock_session, None)
+
+    # Act
+    first = await repository.get_central()
+    second = await repository.get_central()
+
+    # Assert
+    assert first is None and second is None
+    mock_session.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_skips_importing_catalogs():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    repository = _cached_repository(
+        mock_session, DrugCatalog._mock(1, status="processing"))
+
+    # Act
+    await repository.get_by_id(1)
+    await repository.get_by_id(1)
+
+    # Assert
+    assert mock_session.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_writes_clear_the_cache():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    repository = _cached_repository(
+        mock_session, DrugCatalog._mock(1, status="completed"))
+
+    # Act
+    await repository.get_central()
+    await repository.save(DrugCatalog._mock(2))
+    await repository.get_central()
+    await repository.status_update(1, "failed")
+    await repository.get_central()
+    await repository.drug_count_update(1, 10)
+    await repository.get_central()
+
+    # Assert
+    # four lookups and two UPDATE statements, no lookup hit the cache
+    assert mock_session.execute.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_survives_a_rollback_of_the_loading_session():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[DrugCatalog.__table__])
+    sessionmaker = async_sessionmaker(engine)
+    async with sessionmaker() as session:
+        session.add(DrugCatalog._mock(1, status="completed"))
+        await session.commit()
+    cache = TTLCache()
+
+    # Act
+    async with sessionmaker() as failing_request:
+        loaded = await ICachedDrugCatalogRepository(
+            failing_request, cache).get_by_id(1)
+        await failing_request.rollback()
+    async with sessionmaker() as next_request:
+        cached = await ICachedDrugCatalogRepository(
+            next_request, cache).get_by_id(1)
+    await engine.dispose()
+
+    # Assert
+    assert cached is not loaded
+    assert (cached._id, cached.status) == (1, "completed")
+    assert cache.hits == 1
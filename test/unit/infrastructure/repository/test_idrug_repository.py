@@ -1,8 +1,11 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy import Result
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine)
 from src.domain.entities import Drug
+from src.domain.entities.drug_catalog import DrugCatalog
+from src.infrastructure.db.base import Base
 from src.infrastructure.repositories.idrug_repository import IDrugRepository
 from src.infrastructure.repositories.contract import PagedItems
 
@@ -50,27 +53,6 @@ async def test_get_by_id():
     assert result == drug
 
 
-@pytest.mark.asyncio
-async def test_get_all_like_code_or_name_by_catalog_id():
-    # Arrange
-    drugs = [drug, drug]
-    mock_execute_result = AsyncMock(spec=Result)
-    mock_execute_result.scalars.return_value.all.return_value = drugs
-
-    mock_session = AsyncMock(spec=AsyncSession)
-    mock_session.execute.return_value = mock_execute_result
-
-    repository = IDrugRepository(mock_session)
-
-    # Act
-    result = await repository.get_all_like_code_or_name_by_catalog_id(123, "Test")
-
-    # Assert
-    mock_session.execute.assert_called_once()
-    assert len(result) == 2
-    assert result == drugs
-
-
 @pytest.mark.asyncio
 async def test_get_total_count():
     # Arrange
@@ -90,8 +72,10 @@ async def test_get_total_count():
 @pytest.mark.asyncio
 async def test_get_paginated_by_catalog_id():
     # Arrange
+    row = MagicMock(total_count=10)
+    row.__getitem__.return_value = drug
     mock_execute_result = AsyncMock(spec=Result)
-    mock_execute_result.scalars.return_value.all.return_value = [drug]
+    mock_execute_result.all.return_value = [row]
 
     mock_session = AsyncMock(spec=AsyncSession)
     mock_session.execute.return_value = mock_execute_result
@@ -108,7 +92,7 @@ async def test_get_paginated_by_catalog_id():
 
     # Assert
     mock_session.execute.assert_called_once()
-    mock_execute_result.scalars.assert_called_once()
+    mock_get_total_count.assert_not_called()
     assert isinstance(result, PagedItems)
     assert result.current_page == 1
     assert result.page_size == 2
@@ -117,6 +101,32 @@ async def test_get_paginated_by_catalog_id():
     assert result.items == [drug]
 
 
+@pytest.mark.asyncio
+async def test_get_paginated_by_catalog_id_without_total():
+    # Arrange
+    mock_execute_result = AsyncMock(spec=Result)
+    # page_size + 1 rows came back, so there is a next page
+    mock_execute_result.scalars.return_value.all.return_value = [
+        drug, drug, drug]
+
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.execute.return_value = mock_execute_result
+
+    repository = IDrugRepository(mock_session)
+    repository.get_total_count = AsyncMock()
+
+    # Act
+    result = await repository.get_paginated_by_catalog_id(
+        page=1, page_size=2, drug_catalog_id=1, with_total=False
+    )
+
+    # Assert
+    repository.get_total_count.assert_not_awaited()
+    assert result.total_count is None
+    assert result.has_next is True
+    assert len(result.items) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_drug_map_by_catalog_id_found():
     # Arrange
@@ -189,3 +199,133 @@ async def test_delete_all_by_catalog_id_no_commits_if_no_matches():
     # Assert
     mock_session.execute.assert_called_once()
     mock_session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_page_after_id_walks_the_catalog_on_sqlite():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[DrugCatalog.__table__, Drug.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        for n in range(7):
+            session.add(Drug(catalog_id=1, drug_code=f"C{n}",
+                             drug_name=f"Drug {n}", properties={}))
+            session.add(Drug(catalog_id=2, drug_code=f"O{n}",
+                             drug_name=f"Other {n}", properties={}))
+        await session.commit()
+        repository = IDrugRepository(session)
+
+        # Act
+        pages, after_id = [], None
+        while page := await repository.get_page_after_id(after_id, 3, 1):
+            pages.append([d.drug_code for d in page])
+            after_id = page[-1]._id
+        filtered = await repository.get_page_after_id(None, 3, 1, "Drug 5")
+    await engine.dispose()
+
+    # Assert
+    assert pages == [["C0", "C1", "C2"], ["C3", "C4", "C5"], ["C6"]]
+    assert [d.drug_code for d in filtered] == ["C5"]
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_by_catalog_id_counts_name_or_code_on_sqlite():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[DrugCatalog.__table__, Drug.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        for n in range(5):
+            session.add(Drug(catalog_id=1, drug_code=f"ABC{n}",
+                             drug_name=f"Drug {n}", properties={}))
+        session.add(Drug(catalog_id=1, drug_code="X1",
+                         drug_name="Abcdrug", properties={}))
+        session.add(Drug(catalog_id=1, drug_code="X2",
+                         drug_name="Other", properties={}))
+        await session.commit()
+        repository = IDrugRepository(session)
+
+        # Act
+        first = await repository.get_paginated_by_catalog_id(1, 4, 1, "abc")
+        last = await repository.get_paginated_by_catalog_id(2, 4, 1, "abc")
+        past = await repository.get_paginated_by_catalog_id(3, 4, 1, "abc")
+        count = await repository.get_total_count(1, "abc")
+        none = await repository.get_paginated_by_catalog_id(1, 4, 1, "zzz")
+    await engine.dispose()
+
+    # Assert
+    assert count == 6
+    assert [d.drug_code for d in first.items] == ["ABC0", "ABC1", "ABC2", "ABC3"]
+    assert (first.total_count, first.has_next) == (6, True)
+    assert [d.drug_code for d in last.items] == ["ABC4", "X1"]
+    assert (last.total_count, last.has_next) == (6, False)
+    assert (past.items, past.total_count) == ([], 6)
+    assert (none.items, none.total_count) == ([], 0)
+
+
+@pytest.mark.asyncio
+async def test_search_by_catalog_id_ranks_and_limits_on_sqlite():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[DrugCatalog.__table__, Drug.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        for code, name in [
+            ("X1", "Paracetamol"), ("PAR10", "Other"), ("X2", "Apar"),
+            ("par1", "Another"), ("X3", "Parox"), ("Y1", "Unrelated"),
+        ]:
+            session.add(Drug(catalog_id=1, drug_code=code,
+                             drug_name=name, properties={}))
+        session.add(Drug(catalog_id=2, drug_code="PAR1",
+                         drug_name="Elsewhere", properties={}))
+        await session.commit()
+        repository = IDrugRepository(session)
+
+        # Act
+        ranked = await repository.search_by_catalog_id(1, "PAR1", 10)
+        contains = await repository.search_by_catalog_id(1, "par", 10)
+        limited = await repository.search_by_catalog_id(1, "par", 2)
+        short = await repository.search_by_catalog_id(1, "a", 10)
+        empty = await repository.search_by_catalog_id(1, "", 3)
+    await engine.dispose()
+
+    # Assert
+    assert [d.drug_code for d in ranked] == ["par1", "PAR10"]
+    assert [d.drug_code for d in contains] == [
+        "PAR10", "par1", "X1", "X3", "X2"]
+    assert [d.drug_code for d in limited] == ["PAR10", "par1"]
+    # below three characters only prefixes match, "Apar" but not "Paracetamol"
+    assert [d.drug_code for d in short] == ["X2", "par1"]
+    assert [d.drug_code for d in empty] == ["X1", "PAR10", "X2"]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_binds_the_id_on_sqlite():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[DrugCatalog.__table__, Drug.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        session.add_all([Drug._mock(1), Drug._mock(2)])
+        await session.commit()
+        repository = IDrugRepository(session)
+
+        # Act
+        found = [await repository.get_by_id(n) for n in (2, 1, 3)]
+    await engine.dispose()
+
+    # Assert
+    assert [d and d.drug_code for d in found] == ["A2", "A1", None]
@@ -1,7 +1,11 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
-from src.domain.entities.drug_mapping import DrugMapping
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine)
+from src.domain.entities.drug import Drug
+from src.domain.entities.drug_catalog import DrugCatalog
+from src.domain.entities.drug_mapping import DrugMapping, MappingImportProgress
+from src.infrastructure.db.base import Base
 from src.infrastructure.repositories.imapping_repository import IMappingRepository
 from sqlalchemy.exc import IntegrityError
 
@@ -120,4 +124,133 @@ async def test_delete_all_by_mapping_id():
 
     # Assert
     mock_session.execute.assert_called_once()
-    mock_session.commit.assert_called_once()
\ No newline at end of file
+    mock_session.commit.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_save_many_skips_existing_mappings():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[DrugMapping.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        repository = IMappingRepository(session)
+        await repository.save_many([DrugMapping(3, 1, 2)])
+
+        # Act
+        created = await repository.save_many([
+            DrugMapping(3, 1, 2),
+            DrugMapping(3, 1, 4),
+            DrugMapping(3, 5, 2),
+        ])
+        total = await repository.get_total_count()
+    await engine.dispose()
+
+    # Assert
+    assert created == {(1, 4), (5, 2)}
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_save_many_splits_large_chunks():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[DrugMapping.__table__])
+    # more mappings than asyncpg takes bind parameters for in one statement
+    rows = 32767 // 3 + 5
+    statements = []
+
+    async with async_sessionmaker(engine)() as session:
+        repository = IMappingRepository(session)
+        execute = session.execute
+        session.execute = lambda stmt, *args, **kwargs: (
+            statements.append(stmt) or execute(stmt, *args, **kwargs))
+
+        # Act
+        created = await repository.save_many(
+            [DrugMapping(3, n, n) for n in range(rows)]
+            # repeats a pair of the first statement in the second one
+            + [DrugMapping(3, 0, 0)])
+        session.execute = execute
+        total = await repository.get_total_count()
+    await engine.dispose()
+
+    # Assert
+    assert len(statements) == 2
+    assert len(created) == total == rows
+
+
+@pytest.mark.asyncio
+async def test_import_progress_counts_chunks_while_started():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[MappingImportProgress.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        repository = IMappingRepository(session)
+        await repository.chunk_done(3)
+        await repository.start_progress(3)
+
+        # Act
+        await repository.chunk_done(3)
+        await repository.chunk_done(3)
+        counted = await repository.get_chunks_done(3)
+        await repository.end_progress(3)
+        await repository.chunk_done(3)
+        ended = await repository.get_chunks_done(3)
+    await engine.dispose()
+
+    # Assert
+    assert counted == 2
+    assert ended == 0
+
+
+@pytest.mark.asyncio
+async def test_save_many_without_mappings():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    repository = IMappingRepository(mock_session)
+
+    # Act
+    created = await repository.save_many([])
+
+    # Assert
+    assert created == set()
+    mock_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_mappings_by_central_drug_id_on_sqlite():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            DrugCatalog.__table__, Drug.__table__, DrugMapping.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        central = DrugCatalog._mock(1, status="completed")
+        related = DrugCatalog._mock(2, status="completed")
+        related.country = "PT"
+        session.add_all([central, related])
+        drugs = [Drug._mock(n) for n in (1, 2, 3)]
+        drugs[1]._catalog_id = drugs[2]._catalog_id = 2
+        session.add_all(drugs)
+        await session.flush()
+        session.add_all([DrugMapping(9, 1, 2), DrugMapping(9, 1, 3)])
+        await session.commit()
+        repository = IMappingRepository(session)
+
+        # Act
+        mappings = await repository.get_mappings_by_central_drug_id(1)
+        unmapped = await repository.get_mappings_by_central_drug_id(2)
+    await engine.dispose()
+
+    # Assert
+    assert sorted((m.id, m.drug_code, m.country) for m in mappings) == [
+        (2, "A2", "PT"), (3, "A3", "PT")]
+    assert unmapped == []
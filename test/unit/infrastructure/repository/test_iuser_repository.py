@@ -1,9 +1,14 @@
 import pytest
 from unittest.mock import AsyncMock
 from sqlalchemy import Result
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine)
 from src.domain.entities.user import User
-from src.infrastructure.repositories.iuser_repository import IUserRepository
+from src.infrastructure.db.base import Base
+from src.infrastructure.repositories import iuser_repository
+from src.infrastructure.repositories.iuser_repository import (
+    ICachedUserRepository, IUserRepository)
+from src.utils.cache import TTLCache
 
 password = "password123"
 user = User(email="test@example.com", name="Test User", password=password)
@@ -70,3 +75,101 @@ async def test_get_user_by_email():
     # Assert
     mock_session.execute.assert_called_once()
     assert result == user
+
+
+@pytest.mark.asyncio
+async def test_cached_get_by_sub_reads_the_user_once():
+    # Arrange
+    mock_execute_result = AsyncMock(spec=Result)
+    mock_execute_result.scalar_one_or_none.return_value = user
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.execute.return_value = mock_execute_result
+    cache = TTLCache()
+    repository = ICachedUserRepository(mock_session, cache)
+
+    # Act
+    first = await repository.get_by_sub(user.sub)
+    second = await repository.get_by_sub(user.sub)
+
+    # Assert
+    assert first is user and second is not user
+    assert (second.sub, second.name, second.email) \
+        == (user.sub, user.name, user.email)
+    assert second.password is None
+    mock_session.execute.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_get_by_sub_does_not_cache_unknown_users():
+    # Arrange
+    mock_execute_result = AsyncMock(spec=Result)
+    mock_execute_result.scalar_one_or_none.return_value = None
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.execute.return_value = mock_execute_result
+    repository = ICachedUserRepository(mock_session, TTLCache())
+
+    # Act
+    await repository.get_by_sub(1)
+    result = await repository.get_by_sub(1)
+
+    # Assert
+    assert result is None
+    assert mock_session.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_save_drops_the_user():
+    # Arrange
+    mock_session = AsyncMock(spec=AsyncSession)
+    cache = TTLCache()
+    cache.set(user.sub, {"sub": user.sub})
+    repository = ICachedUserRepository(mock_session, cache)
+
+    # Act
+    await repository.save(user)
+
+    # Assert
+    assert user.sub not in cache
+
+
+@pytest.mark.asyncio
+async def test_save_drops_the_user_from_the_process_cache(monkeypatch):
+    # Arrange
+    cache = TTLCache()
+    cache.set(user.sub, {"sub": user.sub})
+    monkeypatch.setattr(iuser_repository, "_user_cache", cache)
+
+    # Act
+    await IUserRepository(AsyncMock(spec=AsyncSession)).save(user)
+
+    # Assert
+    assert user.sub not in cache
+
+
+@pytest.mark.asyncio
+async def test_cached_get_by_sub_survives_a_rollback_of_the_loading_session():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[User.__table__])
+    sessionmaker = async_sessionmaker(engine)
+    async with sessionmaker() as session:
+        session.add(User._mock(7))
+        await session.commit()
+    cache = TTLCache()
+
+    # Act
+    async with sessionmaker() as failing_request:
+        loaded = await ICachedUserRepository(
+            failing_request, cache).get_by_sub(7)
+        await failing_request.rollback()
+    async with sessionmaker() as next_request:
+        cached = await ICachedUserRepository(
+            next_request, cache).get_by_sub(7)
+    await engine.dispose()
+
+    # Assert
+    assert cached is not loaded
+    assert (cached.sub, cached.name) == (7, "Test User 7")
+    assert cache.hits == 1
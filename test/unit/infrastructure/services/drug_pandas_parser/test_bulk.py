@@ -0,0 +1,85 @@
+import json
+import pytest
+import pandas as pd
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.domain.entities.drug import Drug
+from src.domain.entities.drug_catalog import DrugCatalog
+from src.infrastructure.db.base import Base, generate_snowflake_ids
+from src.infrastructure.services.pandas_parser.drug.bulk import (
+    DRUG_COLUMNS, BulkDrugWriter)
+
+
+parsed = pd.DataFrame({
+    "drug_name": ["Aspirin", "Ibuprofen", "Paracetamol"],
+    "drug_code": ["ASP123", "IBU456", "PAR789"],
+    "properties": [{"type": "tablet"}, {"type": "capsule"}, {}],
+})
+
+
+def test_generate_snowflake_ids_are_unique():
+    # Act
+    ids = generate_snowflake_ids(10_000)
+
+    # Assert
+    assert len(ids) == 10_000
+    assert len(set(ids)) == 10_000
+    assert None not in ids
+
+
+@pytest.mark.asyncio
+async def test_write_inserts_rows_on_sqlite():
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[DrugCatalog.__table__, Drug.__table__])
+
+    # Act
+    async with async_sessionmaker(engine)() as session:
+        report = await BulkDrugWriter(session, 7, batch_size=2).write(parsed)
+        result = await session.execute(
+            select(Drug._catalog_id, Drug.drug_code, Drug.properties)
+            .order_by(Drug.drug_code))
+        rows = result.all()
+    await engine.dispose()
+
+    # Assert
+    assert report.engine == "BULK"
+    assert report.rows == 3
+    assert report.rows_per_second > 0
+    assert rows == [
+        (7, "ASP123", {"type": "tablet"}),
+        (7, "IBU456", {"type": "capsule"}),
+        (7, "PAR789", {}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_uses_copy_on_postgresql():
+    # Arrange
+    driver_connection = MagicMock(copy_records_to_table=AsyncMock())
+    connection = MagicMock()
+    connection.dialect.name = "postgresql"
+    connection.get_raw_connection = AsyncMock(
+        return_value=MagicMock(driver_connection=driver_connection))
+    session = AsyncMock()
+    session.connection.return_value = connection
+
+    # Act
+    report = await BulkDrugWriter(session, 7, batch_size=2).write(parsed)
+
+    # Assert
+    assert report.rows == 3
+    assert driver_connection.copy_records_to_table.await_count == 2
+    assert session.commit.await_count == 2
+    first_call = driver_connection.copy_records_to_table.await_args_list[0]
+    assert first_call.args == ("drugs",)
+    assert first_call.kwargs["columns"] == DRUG_COLUMNS
+    _, catalog_id, drug_code, drug_name, properties = \
+        first_call.kwargs["records"][0]
+    assert (catalog_id, drug_code, drug_name) == (7, "ASP123", "Aspirin")
+    assert json.loads(properties) == {"type": "tablet"}
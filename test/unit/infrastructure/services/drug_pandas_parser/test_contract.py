@@ -6,6 +6,9 @@ from unittest.mock import AsyncMock, Mock
 from src.infrastructure.services.pandas_parser.drug.contract import PandasParser
 from src.infrastructure.services.pandas_parser.drug.exc import (
     InvalidFileFormat, InvalidParsedData, MissingPreExecutionError)
+from src.infrastructure.services.pandas_parser.drug.impl.ibe import BE_Parser
+from src.infrastructure.services.pandas_parser.drug.impl.iee import EE_Parser
+from src.infrastructure.services.pandas_parser.drug.impl.inl import NL_Parser
 
 
 class DummyInvalidFileParser(PandasParser):
@@ -155,3 +158,80 @@ async def test_save_all_with_missing_pre_execution():
     # Act & Assert
     with pytest.raises(MissingPreExecutionError):
         await parser.save_all(mock_session, catalog_id)
+
+# ----------------------------------------------------------------------
+
+
+class DummyPropertiesParser(PandasParser):
+    def _open(self):
+        return pd.DataFrame({
+            "ID": ["A1", "B2", "C3"],
+            "Name": ["Aspirin", "Ibuprofen", None],
+            "Form": ["tablet", None, "syrup"],
+            "Strength": [500.0, float("nan"), 2.5],
+            "Pack": [10, 20, 30],
+        })
+
+    def _required_columns(self):
+        return []
+
+    def parse(self):
+        pass
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+def test_build_properties_matches_row_apply(dropna):
+    # Arrange
+    parser = DummyPropertiesParser(b"dummy content")
+
+    def per_row(row):
+        row = row.drop(["ID", "Name"])
+        return (row.dropna() if dropna else row).to_dict()
+
+    expected = parser._df.apply(per_row, axis=1).tolist()
+
+    # Act
+    properties = parser._build_properties(["ID", "Name"], dropna=dropna)
+
+    # Assert
+    assert repr(properties) == repr(expected)
+    assert list(properties[1]) == (
+        ["Pack"] if dropna else ["Form", "Strength", "Pack"])
+
+
+# numeric looking values first, text further down the same columns
+MIXED_ROWS = [("0123", "10", "1"), ("0456", "20", "2"),
+              ("A7", "Drug", "x"), ("0789", "30.5", "")]
+
+
+@pytest.mark.parametrize("parser_class, lines", [
+    (BE_Parser, ["CTI Extended;Name;Extra"]
+     + [";".join(row) for row in MIXED_ROWS]),
+    (EE_Parser, ["Medicinal products", "Name of medicinal product;Extra"]
+     + [f"{name};{extra}" for _, name, extra in MIXED_ROWS]),
+    (NL_Parser, ["PRODUCTNAAM|Extra"]
+     + [f"{name}|{extra}" for _, name, extra in MIXED_ROWS]),
+])
+def test_chunked_parse_matches_whole_file(parser_class, lines):
+    # Arrange
+    data = "\n".join(lines).encode()
+
+    def parsed(chunksize):
+        parser = parser_class(BytesIO(data), chunksize=chunksize)
+        parser.parse()
+        chunks = [parser._df]
+        while parser._next_chunk():
+            parser.parse()
+            chunks.append(parser._df)
+        return pd.concat(chunks, ignore_index=True)
+
+    # Act
+    whole = parsed(None)
+    chunked = parsed(2)
+
+    # Assert
+    for column in ["drug_code", "drug_name", "properties"]:
+        assert chunked[column].tolist() == whole[column].tolist()
+    assert whole["drug_name"].tolist()[:2] == ["10", "20"]
+    assert whole["properties"].tolist()[:3] == [
+        {"Extra": "1"}, {"Extra": "2"}, {"Extra": "x"}]
@@ -77,3 +77,36 @@ def test_fi_parse_valid_data():
             'Myontipaiva': '2020-01-01'
         }
     }
+
+
+@pytest.mark.filterwarnings("error::pandas.errors.SettingWithCopyWarning")
+def test_fi_chunked_parse_streams_products():
+    # Arrange
+    products = "".join(
+        f'<Laakevalmiste id="{i}"><Kauppanimi>Drug {i}</Kauppanimi>'
+        + ('<Laakemuoto value="Tabletti"/>' if i < 2 else "")
+        + "</Laakevalmiste>"
+        for i in range(5)
+    )
+    mock_file = io.BytesIO(
+        b"<Root><Laakevalmisteet>"
+        + products.encode()
+        + b"</Laakevalmisteet></Root>"
+    )
+    chunks = []
+
+    # Act
+    parser = FI_Parser(mock_file, chunksize=2)
+    parser.parse()
+    chunks.append(parser._df)
+    while parser._next_chunk():
+        parser.parse()
+        chunks.append(parser._df)
+
+    # Assert
+    drugs = pd.concat(chunks)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert drugs["drug_code"].tolist() == [str(i) for i in range(5)]
+    assert drugs["drug_name"].tolist() == [f"Drug {i}" for i in range(5)]
+    assert drugs["properties"].tolist() == (
+        [{"Laakemuoto": "Tabletti"}] * 2 + [{}] * 3)
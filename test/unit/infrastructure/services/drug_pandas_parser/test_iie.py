@@ -58,3 +58,34 @@ def test_ie_parse_valid_data():
     assert parser._df.iloc[0]["drug_code"] == "IE_1"
     assert parser._df.iloc[0]["drug_name"] == "Attack 2"
     assert parser._df.iloc[0]["properties"] == {"Extra": "android"}
+
+
+@pytest.mark.filterwarnings("error::pandas.errors.SettingWithCopyWarning")
+def test_ie_chunked_parse_streams_products():
+    # Arrange
+    products = "".join(
+        f"<h:Product><h:ProductName>Drug {i}</h:ProductName>"
+        + ("<h:Extra>android</h:Extra>" if i < 2 else "")
+        + "</h:Product>"
+        for i in range(5)
+    )
+    mock_file = io.BytesIO(
+        b'<h:Products xmlns:h="https://assets.hpra.ie/products//xml/Human">'
+        + products.encode()
+        + b"</h:Products>"
+    )
+    chunks = []
+
+    # Act
+    parser = IE_Parser(mock_file, chunksize=2)
+    parser.parse()
+    chunks.append(parser._df)
+    while parser._next_chunk():
+        parser.parse()
+        chunks.append(parser._df)
+
+    # Assert
+    drugs = pd.concat(chunks)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert drugs["drug_code"].tolist() == [f"IE_{i}" for i in range(1, 6)]
+    assert drugs["properties"].tolist() == [{"Extra": "android"}] * 2 + [{}] * 3
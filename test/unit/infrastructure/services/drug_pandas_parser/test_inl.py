@@ -46,3 +46,22 @@ def test_nl_parse_valid_data():
     assert parser._df.iloc[0]["drug_code"] == "NL_1"
     assert parser._df.iloc[0]["drug_name"] == "Attack 2"
     assert parser._df.iloc[0]["properties"] == {"Extra": "android"}
+
+
+def test_nl_chunked_falls_back_on_bytes_past_the_encoding_sample():
+    # Arrange
+    rows = [f"Drug {i}".encode() for i in range(2_000)]
+    mock_file = io.BytesIO(b"\n".join(
+        [b"PRODUCTNAAM|Extra"] + [row + b"|x" for row in rows]
+        + ["Caf\xe9".encode("ISO-8859-1") + b"|x"]
+    ))
+
+    # Act
+    parser = NL_Parser(mock_file, chunksize=500)
+    names = list(parser._df["PRODUCTNAAM"])
+    while parser._next_chunk():
+        names += list(parser._df["PRODUCTNAAM"])
+
+    # Assert
+    assert len(names) == 2_001
+    assert names[-1] == "Café"
@@ -1,6 +1,7 @@
 import io
 import pytest
 import pandas as pd
+from unittest.mock import AsyncMock, MagicMock
 
 from src.infrastructure.services.pandas_parser.drug.impl.ius import US_Parser
 from src.infrastructure.services.pandas_parser.drug.exc import (
@@ -46,3 +47,33 @@ def test_us_parse_valid_data():
     assert parser._df.iloc[0]["drug_code"] == "US_1"
     assert parser._df.iloc[0]["drug_name"] == "Attack 2"
     assert parser._df.iloc[0]["properties"] == {"Extra": "android"}
+
+
+@pytest.mark.asyncio
+async def test_us_chunked_save_all_keeps_sequential_ids():
+    # Arrange
+    mock_file = io.BytesIO()
+    valid_data = pd.DataFrame(
+        [["DrugName", "Extra"]]
+        + [[f"Drug {i}", "android"] for i in range(5)])
+    valid_data.to_csv(mock_file, sep="\t", index=False, header=False)
+    mock_file.seek(0)
+    saved = []
+
+    async def save_orm(session, catalog_id):
+        saved.append(parser._df.copy())
+        return MagicMock(rows=len(parser._df))
+
+    # Act
+    parser = US_Parser(mock_file, chunksize=2)
+    parser.parse()
+    parser._save_orm = save_orm
+    report = await parser.save_all(AsyncMock(), 1)
+
+    # Assert
+    assert [len(chunk) for chunk in saved] == [2, 2, 1]
+    assert report.rows == 5
+    drugs = pd.concat(saved)
+    assert drugs["drug_code"].tolist() == [f"US_{i}" for i in range(1, 6)]
+    assert drugs["drug_name"].tolist() == [f"Drug {i}" for i in range(5)]
+    assert drugs["properties"].tolist() == [{"Extra": "android"}] * 5
@@ -0,0 +1,61 @@
+import pytest
+
+from src.infrastructure.services.pandas_parser.drug.impl.ius import US_Parser
+from src.infrastructure.services.pandas_parser.drug.exc import (
+    InvalidFileFormat)
+from src.infrastructure.services.pandas_parser.drug.pool import (
+    ParserLoader, shutdown_parser_pool)
+
+
+@pytest.fixture
+def us_file(tmp_path):
+    path = tmp_path / "us.tsv"
+    path.write_text("DrugName\tExtra\nAttack 2\tandroid\n2 Mo. Battle\tios\n")
+    return str(path)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pool_size", [0, 1])
+async def test_load_returns_parsed_parser(us_file, pool_size):
+    # Arrange
+    loader = ParserLoader(US_Parser, us_file, pool_size=pool_size)
+
+    # Act
+    try:
+        parser = await loader.load()
+    finally:
+        shutdown_parser_pool()
+
+    # Assert
+    assert isinstance(parser, US_Parser)
+    assert parser._df["drug_name"].tolist() == ["Attack 2", "2 Mo. Battle"]
+    assert parser._df["properties"].tolist() == [
+        {"Extra": "android"}, {"Extra": "ios"}]
+
+
+@pytest.mark.asyncio
+async def test_load_chunked_stays_in_process(us_file):
+    # Arrange
+    loader = ParserLoader(US_Parser, us_file, chunksize=1, pool_size=1)
+
+    # Act
+    parser = await loader.load()
+
+    # Assert
+    assert parser._chunks is not None
+    assert parser._df["drug_name"].tolist() == ["Attack 2"]
+
+
+@pytest.mark.asyncio
+async def test_load_raises_open_errors(tmp_path):
+    # Arrange
+    path = tmp_path / "us.tsv"
+    path.write_text("Wrong\tExtra\nAttack 2\tandroid\n")
+    loader = ParserLoader(US_Parser, str(path), pool_size=1)
+
+    # Act & Assert
+    try:
+        with pytest.raises(InvalidFileFormat, match="Missing required"):
+            await loader.load()
+    finally:
+        shutdown_parser_pool()
@@ -0,0 +1,153 @@
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.domain.entities.drug import Drug
+from src.domain.entities.drug_catalog import DrugCatalog
+from src.infrastructure.db.base import Base
+from src.infrastructure.repositories.idrug_repository import IDrugRepository
+from src.infrastructure.services.drug_autocomplete import (
+    CatalogSearchIndex, DrugAutocomplete)
+
+
+DRUGS = [
+    (1, "X1", "Paracetamol"), (2, "PAR10", "Other"), (3, "X2", "Apar"),
+    (4, "par1", "Another"), (5, "X3", "Parox"), (6, "Y1", "Unrelated"),
+]
+
+
+def completed_catalog(drug_count: int = len(DRUGS)) -> DrugCatalog:
+    catalog = DrugCatalog._mock(1, status="completed")
+    catalog.drug_count = drug_count
+    return catalog
+
+
+@pytest.mark.parametrize("term", ["PAR1", "par", "a", "", "tamol", "zzz"])
+@pytest.mark.parametrize("limit", [2, 10])
+@pytest.mark.asyncio
+async def test_index_matches_the_database_search(term, limit):
+    # Arrange
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[DrugCatalog.__table__, Drug.__table__])
+
+    async with async_sessionmaker(engine)() as session:
+        for _, code, name in DRUGS:
+            session.add(Drug(catalog_id=1, drug_code=code,
+                             drug_name=name, properties={}))
+        await session.commit()
+        repository = IDrugRepository(session)
+        entries = await repository.get_search_entries_by_catalog_id(1)
+
+        # Act
+        expected = await repository.search_by_catalog_id(1, term, limit)
+        result = CatalogSearchIndex(entries).search(term, limit)
+    await engine.dispose()
+
+    # Assert
+    assert [entry[1:] for entry in entries] == [d[1:] for d in DRUGS]
+    assert result == [(d._id, d.drug_code, d.drug_name) for d in expected]
+
+
+def test_index_reports_its_size():
+    # Arrange
+    small = CatalogSearchIndex(DRUGS[:1])
+
+    # Act
+    large = CatalogSearchIndex(DRUGS)
+
+    # Assert
+    assert len(large) == len(DRUGS)
+    assert 0 < small.memory_bytes < large.memory_bytes
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_builds_the_index_once():
+    # Arrange
+    load = AsyncMock(return_value=DRUGS)
+    autocomplete = DrugAutocomplete()
+    catalog = completed_catalog()
+
+    # Act
+    first = await autocomplete.search(catalog, "par", 2, load)
+    second = await autocomplete.search(catalog, "unrel", 2, load)
+
+    # Assert
+    load.assert_awaited_once_with(1)
+    assert first == [(2, "PAR10", "Other"), (4, "par1", "Another")]
+    assert second == [(6, "Y1", "Unrelated")]
+    assert list(autocomplete.memory_usage()) == [1]
+    assert autocomplete.memory_usage()[1][0] == len(DRUGS)
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_drops_the_index_when_the_catalog_changes():
+    # Arrange
+    load = AsyncMock(return_value=DRUGS)
+    autocomplete = DrugAutocomplete()
+    await autocomplete.search(completed_catalog(), "par", 2, load)
+    reimporting = completed_catalog()
+    reimporting.status = "processing"
+
+    # Act
+    during = await autocomplete.search(reimporting, "par", 2, load)
+    after = await autocomplete.search(completed_catalog(7), "par", 2, load)
+
+    # Assert
+    assert during is None
+    assert after is not None
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_leaves_large_catalogs_to_the_database():
+    # Arrange
+    load = AsyncMock(return_value=DRUGS)
+    autocomplete = DrugAutocomplete(max_rows=5)
+
+    # Act
+    result = await autocomplete.search(completed_catalog(), "par", 2, load)
+
+    # Assert
+    assert result is None
+    load.assert_not_awaited()
+    assert autocomplete.memory_usage() == {}
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_leaves_the_search_to_the_database_when_loading_fails():
+    # Arrange
+    load = AsyncMock(side_effect=[ConnectionError("database gone"), DRUGS])
+    autocomplete = DrugAutocomplete()
+
+    # Act
+    failed = await autocomplete.search(completed_catalog(), "par", 2, load)
+    retried = await autocomplete.search(completed_catalog(), "par", 2, load)
+
+    # Assert
+    assert failed is None
+    assert retried == [(2, "PAR10", "Other"), (4, "par1", "Another")]
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_leaves_the_search_to_the_database_when_indexing_fails(
+        monkeypatch):
+    # Arrange
+    def broken_index(entries):
+        raise MemoryError()
+
+    monkeypatch.setattr(
+        "src.infrastructure.services.drug_autocomplete.CatalogSearchIndex",
+        broken_index)
+    autocomplete = DrugAutocomplete()
+
+    # Act
+    result = await autocomplete.search(
+        completed_catalog(), "par", 2, AsyncMock(return_value=DRUGS))
+
+    # Assert
+    assert result is None
+    assert autocomplete.memory_usage() == {}
@@ -1,6 +1,6 @@
 import pytest
 from typing import Any, Generator, TypedDict
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
 
 from src.infrastructure.services.confidential_ledger.iazure_ledger import AzureLedger
@@ -9,7 +9,8 @@ from src.infrastructure.services.confidential_ledger.contract import Transaction
 
 class AzureLedgerFixture(TypedDict):
     ledger: AzureLedger
-    mock_ledger_client: MagicMock
+    mock_ledger_client: AsyncMock
+    mock_credential: AsyncMock
 
 
 @pytest.fixture
@@ -20,8 +21,8 @@ def azure_ledger_fixture() -> Generator[AzureLedgerFixture, Any, None]:
     azure_credentials_client_id = "123e4567-e89b-12d3-a456-426614174001",
     azure_credentials_certificate_path = "/path/to/certificate"
 
-    mock_credential = MagicMock()
-    mock_ledger_client = MagicMock()
+    mock_credential = AsyncMock()
+    mock_ledger_client = AsyncMock()
 
     with patch("src.infrastructure.services.confidential_ledger.iazure_ledger.CertificateCredential", return_value=mock_credential):
         with patch("src.infrastructure.services.confidential_ledger.iazure_ledger.ConfidentialLedgerClient", return_value=mock_ledger_client):
@@ -34,47 +35,53 @@ def azure_ledger_fixture() -> Generator[AzureLedgerFixture, Any, None]:
             )
             yield {
                 "ledger": ledger,
-                "mock_ledger_client": mock_ledger_client
+                "mock_ledger_client": mock_ledger_client,
+                "mock_credential": mock_credential,
             }
 
 
-def test_insert_transaction(azure_ledger_fixture):
+@pytest.mark.asyncio
+async def test_insert_transaction(azure_ledger_fixture):
     # Arrange
     ledger = azure_ledger_fixture["ledger"]
     mock_ledger_client = azure_ledger_fixture["mock_ledger_client"]
 
-    mock_ledger_client.get_current_ledger_entry.return_value = {
+    mock_ledger_client.create_ledger_entry.return_value = {
         "transactionId": "123e4567-e89b-12d3-a456-426614174000",
-        "contents": '{"key": "value"}'
+        "collectionId": "subledger:0"
     }
 
     # Act
     data = {"key": "value"}
-    result = ledger.insert_transaction(data)
+    result = await ledger.insert_transaction(data)
 
     # Assert
-    mock_ledger_client.create_ledger_entry.assert_called_once()
+    mock_ledger_client.create_ledger_entry.assert_awaited_once()
+    mock_ledger_client.get_current_ledger_entry.assert_not_called()
     assert isinstance(result, TransactionInserted)
     assert result.status == "processing"
     assert result.transaction_id == "123e4567-e89b-12d3-a456-426614174000"
 
 
-def test_retrieve_transaction_success(azure_ledger_fixture):
+@pytest.mark.asyncio
+async def test_retrieve_transaction_success(azure_ledger_fixture):
     # Arrange
     ledger = azure_ledger_fixture["ledger"]
     mock_ledger_client = azure_ledger_fixture["mock_ledger_client"]
 
-    mock_ledger_client.begin_get_ledger_entry.return_value.result.return_value = {
+    mock_poller = MagicMock()
+    mock_poller.result = AsyncMock(return_value={
         "state": "Ready",
         "entry": {"contents": '{"key": "value"}'}
-    }
+    })
+    mock_ledger_client.begin_get_ledger_entry.return_value = mock_poller
 
     # Act
     transaction_id = "123e4567-e89b-12d3-a456-426614174000"
-    result = ledger.retrieve_transaction(transaction_id)
+    result = await ledger.retrieve_transaction(transaction_id)
 
     # Assert
-    mock_ledger_client.begin_get_ledger_entry.assert_called_once_with(
+    mock_ledger_client.begin_get_ledger_entry.assert_awaited_once_with(
         str(transaction_id))
     assert isinstance(result, TransactionInserted)
     assert result.status == "ready"
@@ -82,7 +89,8 @@ def test_retrieve_transaction_success(azure_ledger_fixture):
     assert result.transaction_data == {"key": "value"}
 
 
-def test_retrieve_transaction_not_found(azure_ledger_fixture):
+@pytest.mark.asyncio
+async def test_retrieve_transaction_not_found(azure_ledger_fixture):
     # Arrange
     ledger = azure_ledger_fixture["ledger"]
     mock_ledger_client = azure_ledger_fixture["mock_ledger_client"]
@@ -91,15 +99,16 @@ def test_retrieve_transaction_not_found(azure_ledger_fixture):
 
     # Act
     transaction_id = "123e4567-e89b-12d3-a456-426614174000"
-    result = ledger.retrieve_transaction(transaction_id)
+    result = await ledger.retrieve_transaction(transaction_id)
 
     # Assert
-    mock_ledger_client.begin_get_ledger_entry.assert_called_once_with(
+    mock_ledger_client.begin_get_ledger_entry.assert_awaited_once_with(
         str(transaction_id))
     assert result is None
 
 
-def test_retrieve_transaction_http_error(azure_ledger_fixture):
+@pytest.mark.asyncio
+async def test_retrieve_transaction_http_error(azure_ledger_fixture):
     # Arrange
     ledger = azure_ledger_fixture["ledger"]
     mock_ledger_client = azure_ledger_fixture["mock_ledger_client"]
@@ -108,9 +117,22 @@ def test_retrieve_transaction_http_error(azure_ledger_fixture):
 
     # Act
     transaction_id = "123e4567-e89b-12d3-a456-426614174000"
-    result = ledger.retrieve_transaction(transaction_id)
+    result = await ledger.retrieve_transaction(transaction_id)
 
     # Assert
-    mock_ledger_client.begin_get_ledger_entry.assert_called_once_with(
+    mock_ledger_client.begin_get_ledger_entry.assert_awaited_once_with(
         str(transaction_id))
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_close_releases_client_and_credential(azure_ledger_fixture):
+    # Arrange
+    ledger = azure_ledger_fixture["ledger"]
+
+    # Act
+    await ledger.close()
+
+    # Assert
+    azure_ledger_fixture["mock_ledger_client"].close.assert_awaited_once()
+    azure_ledger_fixture["mock_credential"].close.assert_awaited_once()
@@ -0,0 +1,111 @@
+import json
+import asyncio
+import pytest
+
+from src.infrastructure.services.confidential_ledger.ifake_json_ledger import (
+    FakeJsonLedger)
+from src.utils.checksum import dict_hash
+
+
+@pytest.fixture
+def fake_ledger(tmp_path, monkeypatch):
+    monkeypatch.setattr(FakeJsonLedger, "_db_file", tmp_path / "ledger.jsonl")
+    monkeypatch.setattr(FakeJsonLedger, "_instance", None)
+    return FakeJsonLedger()
+
+
+@pytest.mark.asyncio
+async def test_insert_and_retrieve_transaction(fake_ledger):
+    # Arrange
+    data = {"status": "created", "catalog_id": "1"}
+
+    # Act
+    inserted = await fake_ledger.insert_transaction(data)
+    retrieved = await fake_ledger.retrieve_transaction(inserted.transaction_id)
+
+    # Assert
+    assert inserted.status == "ready"
+    assert retrieved == inserted
+    assert retrieved.transaction_data["hash"] == dict_hash(data)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_inserts_are_all_kept(fake_ledger):
+    # Act
+    inserted = await asyncio.gather(*[
+        fake_ledger.insert_transaction({"n": str(n)}) for n in range(20)])
+    retrieved = await asyncio.gather(*[
+        fake_ledger.retrieve_transaction(t.transaction_id) for t in inserted])
+
+    # Assert
+    assert all(t is not None for t in retrieved)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_unknown_transaction(fake_ledger):
+    # Act & Assert
+    assert await fake_ledger.retrieve_transaction("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_entries_are_appended_one_per_line(fake_ledger):
+    # Act
+    await fake_ledger.insert_transaction({"n": "1"})
+    await fake_ledger.insert_transaction({"n": "2"})
+
+    # Assert
+    lines = FakeJsonLedger._db_file.read_text().splitlines()
+    assert [json.loads(line)["transaction_data"]["data"] for line in lines] \
+        == [{"n": "1"}, {"n": "2"}]
+
+
+@pytest.mark.asyncio
+async def test_reads_entries_written_by_another_process(fake_ledger, monkeypatch):
+    # Arrange
+    inserted = await fake_ledger.insert_transaction({"n": "1"})
+    # a partially written line from a concurrent writer is left for later
+    with FakeJsonLedger._db_file.open("a") as f:
+        f.write('{"transaction_id": "partial"')
+    monkeypatch.setattr(FakeJsonLedger, "_instance", None)
+    other_process = FakeJsonLedger()
+
+    # Act
+    retrieved = await other_process.retrieve_transaction(
+        inserted.transaction_id)
+
+    # Assert
+    assert other_process is not fake_ledger
+    assert retrieved == inserted
+    assert await other_process.retrieve_transaction("partial") is None
+
+
+@pytest.mark.asyncio
+async def test_loads_the_file_when_built(fake_ledger, monkeypatch):
+    # Arrange
+    inserted = await fake_ledger.insert_transaction({"n": "1"})
+    monkeypatch.setattr(FakeJsonLedger, "_instance", None)
+
+    # Act
+    other_process = FakeJsonLedger()
+
+    # Assert
+    assert inserted.transaction_id in other_process._index
+    assert other_process._offset == FakeJsonLedger._db_file.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_own_appends_are_not_read_again(fake_ledger, monkeypatch):
+    # Arrange
+    read_lines = []
+    loads = json.loads
+    monkeypatch.setattr(
+        json, "loads", lambda line: read_lines.append(line) or loads(line))
+
+    # Act
+    await fake_ledger.insert_transaction({"n": "1"})
+    await fake_ledger.insert_transaction({"n": "2"})
+    await fake_ledger.retrieve_transaction("missing")
+
+    # Assert
+    assert read_lines == []
+    assert fake_ledger._offset == FakeJsonLedger._db_file.stat().st_size
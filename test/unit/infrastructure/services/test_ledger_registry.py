@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.infrastructure.services import confidential_ledger
+from src.infrastructure.services.confidential_ledger import (
+    get_ledger, shutdown_ledger, startup_ledger)
+
+
+@pytest.fixture(autouse=True)
+def reset_ledger(monkeypatch):
+    monkeypatch.setattr(confidential_ledger, "_ledger", None)
+
+
+@pytest.mark.asyncio
+@patch("src.infrastructure.services.confidential_ledger.ledger_builder")
+async def test_ledger_is_built_once_per_process(mock_ledger_builder):
+    # Arrange
+    mock_ledger_builder.return_value = AsyncMock()
+    config = MagicMock(ENVIRONMENT="PROD")
+
+    # Act
+    started = startup_ledger(config)
+    first = get_ledger()
+    second = get_ledger()
+
+    # Assert
+    mock_ledger_builder.assert_called_once_with(
+        config.AZURE_LEDGER_URL,
+        config.AZURE_LEDGER_CERTIFICATE_PATH,
+        config.AZURE_CREDENTIAL_TENNANT_ID,
+        config.AZURE_CREDENTIAL_CLIENT_ID,
+        config.AZURE_CREDENTIAL_CERTIFICATE_PATH,
+        "PROD",
+    )
+    assert started is first is second
+
+
+@pytest.mark.asyncio
+@patch("src.infrastructure.services.confidential_ledger.ledger_builder")
+async def test_shutdown_closes_and_forgets_the_ledger(mock_ledger_builder):
+    # Arrange
+    mock_ledger_builder.side_effect = [AsyncMock(), AsyncMock()]
+    ledger = startup_ledger(MagicMock())
+
+    # Act
+    await shutdown_ledger()
+    await shutdown_ledger()
+
+    # Assert
+    ledger.close.assert_awaited_once()
+    assert get_ledger() is not ledger
+
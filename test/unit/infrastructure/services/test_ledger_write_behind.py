@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from src.infrastructure.services.confidential_ledger.contract import (
+    TransactionInserted)
+from src.infrastructure.services.confidential_ledger.write_behind import (
+    LedgerWriteBehind)
+
+
+def _ledger(gate: asyncio.Event | None = None):
+    calls = []
+
+    async def insert_transaction(data):
+        calls.append(data["n"])
+        if gate is not None:
+            await gate.wait()
+        if data["n"] == "fail":
+            raise ConnectionError("ledger down")
+        return TransactionInserted(
+            transaction_id=f"tx-{data['n']}", status="ready")
+
+    ledger = AsyncMock()
+    ledger.insert_transaction.side_effect = insert_transaction
+    return ledger, calls
+
+
+async def _collect(writes, wait=False):
+    return [(data["n"], transaction.transaction_id)
+            async for data, transaction in writes.written(wait)]
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_before_the_entry_is_written():
+    # Arrange
+    gate = asyncio.Event()
+    ledger, calls = _ledger(gate)
+    writes = LedgerWriteBehind(ledger)
+
+    # Act
+    await writes.submit({"n": "1"})
+    await asyncio.sleep(0)
+    pending = await _collect(writes)
+    gate.set()
+    written = await _collect(writes, wait=True)
+
+    # Assert
+    assert calls == ["1"]
+    assert pending == []
+    assert written == [("1", "tx-1")]
+
+
+@pytest.mark.asyncio
+async def test_entries_are_written_one_after_another_in_order():
+    # Arrange
+    ledger, calls = _ledger()
+    writes = LedgerWriteBehind(ledger, max_pending=3)
+    after = []
+
+    async def wait_ready(transaction):
+        await asyncio.sleep(0.01)
+        after.append((transaction.transaction_id, list(calls)))
+
+    # Act
+    await writes.submit({"n": "1"}, wait_ready)
+    await writes.submit({"n": "2"}, wait_ready)
+    await writes.submit({"n": "3"})
+    written = await _collect(writes, wait=True)
+
+    # Assert
+    assert written == [("1", "tx-1"), ("2", "tx-2"), ("3", "tx-3")]
+    # the next entry is only written once the previous one is ready
+    assert after == [("tx-1", ["1"]), ("tx-2", ["1", "2"])]
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_beyond_max_pending():
+    # Arrange
+    gate = asyncio.Event()
+    ledger, calls = _ledger(gate)
+    writes = LedgerWriteBehind(ledger, max_pending=1)
+    await writes.submit({"n": "1"})
+
+    # Act
+    second = asyncio.create_task(writes.submit({"n": "2"}))
+    await asyncio.sleep(0.01)
+    blocked = not second.done()
+    gate.set()
+    await second
+    written = await _collect(writes, wait=True)
+
+    # Assert
+    assert blocked
+    assert written == [("1", "tx-1"), ("2", "tx-2")]
+
+
+@pytest.mark.asyncio
+async def test_a_failed_write_raises_and_keeps_the_later_entries():
+    # Arrange
+    ledger, _ = _ledger()
+    writes = LedgerWriteBehind(ledger, max_pending=3)
+    await writes.submit({"n": "1"})
+    await writes.submit({"n": "fail"})
+    await writes.submit({"n": "3"})
+    written = []
+
+    # Act
+    with pytest.raises(ConnectionError):
+        async for data, transaction in writes.written(wait=True):
+            written.append(transaction.transaction_id)
+    after_failure = await _collect(writes, wait=True)
+
+    # Assert
+    assert written == ["tx-1"]
+    assert after_failure == [("3", "tx-3")]
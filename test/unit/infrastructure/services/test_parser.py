@@ -3,7 +3,8 @@ import pandas as pd
 from io import BytesIO
 
 from src.infrastructure.services.pandas_parser.drug.exc import InvalidFileFormat
-from src.infrastructure.services.pandas_parser.mapping.parse import DrugMappingParse, MappingParser
+from src.infrastructure.services.pandas_parser.mapping.parse import (
+    DrugMappingParse, MappingParser, MappingParserLoader)
 
 
 def make_csv_bytes(data: pd.DataFrame) -> bytes:
@@ -71,3 +72,76 @@ def test_mapping_parser_chunked_parsing():
     assert len(chunks[1]) == 1
     assert chunks[0][0].drug_code == "A"
     assert chunks[1][0].drug_code == "C"
+
+
+def test_mapping_parser_chunks_by_payload_size():
+    # Arrange
+    df = pd.DataFrame({
+        "drug_code": ["A", "B", "C" * 200, "D", "E"],
+        "related_drug_code": ["X", "Y", "Z", "W", "V"]
+    })
+    csv_bytes = make_csv_bytes(df)
+
+    # Act
+    parser = MappingParser(csv_bytes)
+    chunks = list(parser.parse(chunk_size=10, max_bytes=100))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [2, 1, 2]
+    assert chunks[1][0].drug_code == "C" * 200
+    assert [m.drug_code for chunk in chunks for m in chunk] == [
+        "A", "B", "C" * 200, "D", "E"]
+
+
+def test_mapping_parser_reads_file_path(tmp_path):
+    # Arrange
+    path = tmp_path / "mapping.csv"
+    path.write_bytes(make_csv_bytes(pd.DataFrame({
+        "drug_code": ["A"],
+        "related_drug_code": ["X"]
+    })))
+
+    # Act
+    parser = MappingParser(str(path))
+    chunks = list(parser.parse())
+
+    # Assert
+    assert chunks[0][0].related_drug_code == "X"
+
+
+def test_mapping_parser_validate_header_rewinds_source():
+    # Arrange
+    source = BytesIO(b"drug_code,related_drug_code\nA,X\n")
+
+    # Act
+    MappingParser.validate_header(source)
+
+    # Assert
+    assert source.tell() == 0
+
+
+def test_mapping_parser_validate_header_missing_columns():
+    # Arrange
+    source = BytesIO(b"drug_code,other_column\nA,X\n")
+
+    # Act & Assert
+    with pytest.raises(InvalidFileFormat):
+        MappingParser.validate_header(source)
+    assert source.tell() == 0
+
+
+@pytest.mark.asyncio
+async def test_mapping_parser_loader_opens_the_file_in_a_thread(tmp_path):
+    # Arrange
+    path = tmp_path / "mapping.csv"
+    path.write_bytes(b"drug_code,related_drug_code\nA,X\n")
+    invalid = tmp_path / "invalid.csv"
+    invalid.write_bytes(b"drug_code,other_column\nA,X\n")
+
+    # Act
+    parser = await MappingParserLoader(str(path)).load()
+
+    # Assert
+    assert list(parser.parse())[0][0].drug_code == "A"
+    with pytest.raises(InvalidFileFormat):
+        await MappingParserLoader(str(invalid)).load()
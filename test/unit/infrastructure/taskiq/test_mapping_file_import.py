@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import AsyncMock, patch, MagicMock
+
+from src.infrastructure.taskiq.mapping_file_import import (
+    task, MappingFileTaskData)
+
+
+@pytest.mark.asyncio
+@patch("src.infrastructure.taskiq.mapping_file_import.get_file", new_callable=AsyncMock)
+@patch("src.infrastructure.taskiq.mapping_file_import.MappingParserLoader")
+@patch("src.infrastructure.taskiq.mapping_file_import.IMappingTransactionRepository")
+@patch("src.infrastructure.taskiq.mapping_file_import.IMappingRepository")
+@patch("src.infrastructure.taskiq.mapping_file_import.MappingImportUseCase")
+async def test_task_happy_path(
+    mock_use_case,
+    mock_mapping_repository,
+    mock_transaction_repository,
+    mock_mapping_parser,
+    mock_get_file,
+):
+    # Arrange
+    session = MagicMock()
+    data = MappingFileTaskData(
+        mapping_id=1,
+        central_catalog_id=2,
+        related_catalog_id=3,
+        filename="uuid_mapping.csv",
+        source_filename="mapping.csv",
+    )
+    config = MagicMock()
+    mock_get_file.return_value = "mocked/path/uuid_mapping.csv"
+    mock_ledger_service = AsyncMock()
+    mock_use_case_instance = AsyncMock()
+    mock_use_case.return_value = mock_use_case_instance
+
+    # Act
+    await task(session, data, config, mock_ledger_service)
+
+    # Assert
+    mock_get_file.assert_awaited_once_with("uuid_mapping.csv", config)
+    mock_mapping_parser.assert_called_once_with("mocked/path/uuid_mapping.csv")
+    mock_transaction_repository.assert_called_once_with(session)
+    mock_use_case.assert_called_once_with(
+        transaction_repository=mock_transaction_repository.return_value,
+        ledger_service=mock_ledger_service,
+        mapping_parser=mock_mapping_parser.return_value,
+        mapping_id=1,
+        central_catalog_id=2,
+        related_catalog_id=3,
+        chunk_rows=config.MAPPING_CHUNK_ROWS,
+        chunk_bytes=config.MAPPING_CHUNK_BYTES,
+        mapping_repository=mock_mapping_repository.return_value,
+        max_in_flight=config.MAPPING_MAX_IN_FLIGHT,
+        in_flight_timeout=config.MAPPING_IN_FLIGHT_TIMEOUT,
+    )
+    mock_use_case_instance.prepare_task.assert_awaited_once_with(
+        "mapping.csv", "mocked/path/uuid_mapping.csv")
+    mock_use_case_instance.execute.assert_awaited_once()
+    mock_ledger_service.close.assert_not_awaited()
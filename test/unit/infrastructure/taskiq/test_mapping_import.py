@@ -30,15 +30,18 @@ async def test_task_creates_and_logs_mappings(mock_mapping_repo_cls, mock_drug_r
         {"C1": 101, "C2": 102},  # central_drug_codes
         {"R1": 201, "R2": 202},  # related_drug_codes
     ])
-    # Simulate save: first True (created), then False (already exists)
-    mock_mapping_repo.save = AsyncMock(side_effect=[True, False])
+    # Simulate save_many: first pair created, second already exists
+    mock_mapping_repo.save_many = AsyncMock(return_value={(101, 201)})
 
     # Act
     await task(session, data, logger=logger)
 
     # Assert
     assert mock_drug_repo.get_drug_map_by_catalog_id.await_count == 2
-    assert mock_mapping_repo.save.await_count == 2
+    mock_mapping_repo.save_many.assert_awaited_once()
+    saved = mock_mapping_repo.save_many.await_args.args[0]
+    assert [(m._drug_id, m._related_drug_id) for m in saved] == [
+        (101, 201), (102, 202)]
 
     # Check logging for created and already exists
     logger.info.assert_any_call(
@@ -92,3 +95,30 @@ async def test_task_skips_if_no_ids_found(mock_mapping_repo_cls, mock_drug_repo_
         "99 > Creating a hash map with all related drug codes")
     logger.info.assert_any_call("99 > Importing mappins")
     logger.info.assert_any_call("99 > Mapping chunk import completed")
+
+
+@pytest.mark.asyncio
+@patch("src.infrastructure.taskiq.mapping_import.IDrugRepository")
+@patch("src.infrastructure.taskiq.mapping_import.IMappingRepository")
+async def test_task_counts_failed_chunks(mock_mapping_repo_cls, mock_drug_repo_cls):
+    # Arrange
+    session = AsyncMock()
+    data = MappingsTaskData(
+        mappings=[DrugMappingParse(drug_code="C1", related_drug_code="R1")],
+        central_catalog_id=1,
+        related_catalog_id=2,
+        mapping_id=42,
+        counted=True,
+    )
+    mock_drug_repo_cls.return_value.get_drug_map_by_catalog_id = AsyncMock(
+        side_effect=RuntimeError("database gone"))
+    mock_mapping_repo = mock_mapping_repo_cls.return_value
+    mock_mapping_repo.chunk_done = AsyncMock()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        await task(session, data, logger=MagicMock())
+
+    # Assert
+    session.rollback.assert_awaited_once()
+    mock_mapping_repo.chunk_done.assert_awaited_once_with(42)
@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.application.dto.drug_dto import DrugMappingsCount
+from src.application.use_cases.drug.get_all_by_country import (
+    GetDrugsByCountryUseCase)
+from src.infrastructure.repositories.contract import (
+    DrugCatalogRepositoryInterface, DrugRepositoryInterface)
+from src.infrastructure.services.drug_autocomplete import DrugAutocomplete
+
+
+@pytest.mark.asyncio
+async def test_execute_searches_the_country_catalog():
+    # Arrange
+    mock_catalog_repository = AsyncMock(spec=DrugCatalogRepositoryInterface)
+    mock_drug_repository = AsyncMock(spec=DrugRepositoryInterface)
+    mock_catalog_repository.get_first_by_country.return_value = Mock(_id=7)
+    mock_drug_repository.search_by_catalog_id.return_value = [
+        Mock(id="1", drug_code="A1", drug_name="Aspirin")]
+    use_case = GetDrugsByCountryUseCase(
+        mock_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute("PT", "asp", 5)
+
+    # Assert
+    mock_catalog_repository.get_first_by_country.assert_called_once_with("PT")
+    mock_drug_repository.search_by_catalog_id.assert_called_once_with(
+        7, "asp", 5)
+    assert result == [
+        DrugMappingsCount(drug_id="1", drug_code="A1", drug_name="Aspirin")]
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_empty_list_without_catalog():
+    # Arrange
+    mock_catalog_repository = AsyncMock(spec=DrugCatalogRepositoryInterface)
+    mock_drug_repository = AsyncMock(spec=DrugRepositoryInterface)
+    mock_catalog_repository.get_first_by_country.return_value = None
+    use_case = GetDrugsByCountryUseCase(
+        mock_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute("PT", "asp")
+
+    # Assert
+    assert result == []
+    mock_drug_repository.search_by_catalog_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_uses_the_autocomplete_index():
+    # Arrange
+    mock_catalog_repository = AsyncMock(spec=DrugCatalogRepositoryInterface)
+    mock_drug_repository = AsyncMock(spec=DrugRepositoryInterface)
+    catalog = Mock(_id=7)
+    mock_catalog_repository.get_first_by_country.return_value = catalog
+    mock_autocomplete = AsyncMock(spec=DrugAutocomplete)
+    mock_autocomplete.search.return_value = [(1, "A1", "Aspirin")]
+    use_case = GetDrugsByCountryUseCase(
+        mock_catalog_repository, mock_drug_repository, mock_autocomplete)
+
+    # Act
+    result = await use_case.execute("PT", "asp", 5)
+
+    # Assert
+    mock_autocomplete.search.assert_awaited_once_with(
+        catalog, "asp", 5,
+        mock_drug_repository.get_search_entries_by_catalog_id)
+    mock_drug_repository.search_by_catalog_id.assert_not_called()
+    assert result == [
+        DrugMappingsCount(drug_id="1", drug_code="A1", drug_name="Aspirin")]
+
+
+@pytest.mark.asyncio
+async def test_execute_falls_back_to_the_database_without_index():
+    # Arrange
+    mock_catalog_repository = AsyncMock(spec=DrugCatalogRepositoryInterface)
+    mock_drug_repository = AsyncMock(spec=DrugRepositoryInterface)
+    mock_catalog_repository.get_first_by_country.return_value = Mock(_id=7)
+    mock_drug_repository.search_by_catalog_id.return_value = []
+    mock_autocomplete = AsyncMock(spec=DrugAutocomplete)
+    mock_autocomplete.search.return_value = None
+    use_case = GetDrugsByCountryUseCase(
+        mock_catalog_repository, mock_drug_repository, mock_autocomplete)
+
+    # Act
+    result = await use_case.execute("PT", "asp", 5)
+
+    # Assert
+    mock_drug_repository.search_by_catalog_id.assert_called_once_with(
+        7, "asp", 5)
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_execute_falls_back_to_the_database_when_indexing_fails():
+    # Arrange
+    mock_catalog_repository = AsyncMock(spec=DrugCatalogRepositoryInterface)
+    mock_drug_repository = AsyncMock(spec=DrugRepositoryInterface)
+    mock_catalog_repository.get_first_by_country.return_value = Mock(
+        _id=7, status="completed", drug_count=1)
+    mock_drug_repository.get_search_entries_by_catalog_id.side_effect = (
+        ConnectionError("database gone"))
+    mock_drug_repository.search_by_catalog_id.return_value = [
+        Mock(id="1", drug_code="A1", drug_name="Aspirin")]
+    use_case = GetDrugsByCountryUseCase(
+        mock_catalog_repository, mock_drug_repository, DrugAutocomplete())
+
+    # Act
+    result = await use_case.execute("PT", "asp", 5)
+
+    # Assert
+    mock_drug_repository.search_by_catalog_id.assert_called_once_with(
+        7, "asp", 5)
+    assert result == [
+        DrugMappingsCount(drug_id="1", drug_code="A1", drug_name="Aspirin")]
@@ -4,7 +4,8 @@ from unittest.mock import AsyncMock, Mock
 from src.application.use_cases.drug.get_paginated import GetPaginatedDrugsUseCase
 from src.application.dto.drug_dto import DrugPaginatedDto
 from src.domain.entities.drug import Drug
-from src.utils.exc import ResourceNotFound
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.exc import BadRequest, ResourceNotFound
 
 
 @pytest.mark.asyncio
@@ -20,7 +21,8 @@ async def test_execute_returns_paginated_drug_dto():
         ],
         current_page=1,
         page_size=2,
-        total_count=10
+        total_count=10,
+        has_next=True
     )
     use_case = GetPaginatedDrugsUseCase(
         mock_drug_catalog_repository, mock_drug_repository)
@@ -37,8 +39,10 @@ async def test_execute_returns_paginated_drug_dto():
     assert result.total == 10
     assert result.data[0].drug_name == "Drug 1"
     assert result.data[1].drug_code == "A2"
+    assert decode_cursor(result.next) == 2
+    assert result.has_next is True
     mock_drug_repository.get_paginated_by_catalog_id.assert_awaited_once_with(
-        1, 2, 123, "Drug"
+        1, 2, 123, "Drug", with_total=True
     )
 
 @pytest.mark.asyncio
@@ -59,3 +63,143 @@ async def test_execute_returns_paginated_drug_dto_invalid_catalog_id():
     
     #Assert
     assert exc_info.value.message == "Catalog not found"
+
+
+@pytest.mark.asyncio
+async def test_execute_with_cursor_uses_keyset_page():
+    # Arrange
+    mock_drug_catalog_repository = AsyncMock()
+    mock_drug_catalog_repository.get_central.return_value = Mock(_id=123)
+
+    mock_drug_repository = AsyncMock()
+    mock_drug_repository.get_page_after_id.return_value = [
+        Drug._mock(6), Drug._mock(7), Drug._mock(8),
+    ]
+    use_case = GetPaginatedDrugsUseCase(
+        mock_drug_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute(
+        page=1, page_size=2, name_or_code_filter="",
+        after=encode_cursor(5))
+
+    # Assert
+    mock_drug_repository.get_page_after_id.assert_awaited_once_with(
+        5, 3, 123, "")
+    mock_drug_repository.get_paginated_by_catalog_id.assert_not_awaited()
+    mock_drug_repository.get_total_count.assert_not_awaited()
+    assert [d.id for d in result.data] == ["6", "7"]
+    assert result.total is None
+    assert decode_cursor(result.next) == 7
+
+
+@pytest.mark.asyncio
+async def test_execute_with_empty_cursor_starts_at_first_page():
+    # Arrange
+    mock_drug_catalog_repository = AsyncMock()
+    mock_drug_catalog_repository.get_central.return_value = Mock(_id=123)
+
+    mock_drug_repository = AsyncMock()
+    mock_drug_repository.get_page_after_id.return_value = [Drug._mock(1)]
+    use_case = GetPaginatedDrugsUseCase(
+        mock_drug_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute(
+        page=1, page_size=2, name_or_code_filter="", after="")
+
+    # Assert
+    mock_drug_repository.get_page_after_id.assert_awaited_once_with(
+        None, 3, 123, "")
+    assert result.has_next is False
+    assert result.next is None
+
+
+@pytest.mark.asyncio
+async def test_execute_with_invalid_cursor():
+    # Arrange
+    mock_drug_catalog_repository = AsyncMock()
+    mock_drug_catalog_repository.get_central.return_value = Mock(_id=123)
+    use_case = GetPaginatedDrugsUseCase(
+        mock_drug_catalog_repository, AsyncMock())
+
+    # Act & Assert
+    with pytest.raises(BadRequest, match="Invalid pagination cursor"):
+        await use_case.execute(
+            page=1, page_size=2, name_or_code_filter="", after="not-a-cursor")
+
+
+def paged_drugs(total_count):
+    return Mock(items=[Drug._mock(1)], current_page=1, page_size=2,
+                total_count=total_count, has_next=False)
+
+
+@pytest.mark.asyncio
+async def test_execute_estimated_count_reads_catalog_counter():
+    # Arrange
+    mock_drug_catalog_repository = AsyncMock()
+    mock_drug_catalog_repository.get_central.return_value = Mock(
+        _id=123, drug_count=500_000)
+    mock_drug_repository = AsyncMock()
+    mock_drug_repository.get_paginated_by_catalog_id.return_value = \
+        paged_drugs(None)
+    use_case = GetPaginatedDrugsUseCase(
+        mock_drug_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute(
+        page=1, page_size=2, name_or_code_filter="", count="ESTIMATED")
+
+    # Assert
+    mock_drug_repository.get_paginated_by_catalog_id.assert_awaited_once_with(
+        1, 2, 123, "", with_total=False)
+    assert result.total == 500_000
+
+
+@pytest.mark.asyncio
+async def test_execute_estimated_count_without_counter_counts_exactly():
+    # Arrange
+    mock_drug_catalog_repository = AsyncMock()
+    mock_drug_catalog_repository.get_central.return_value = Mock(
+        _id=123, drug_count=None)
+    mock_drug_repository = AsyncMock()
+    mock_drug_repository.get_paginated_by_catalog_id.return_value = \
+        paged_drugs(1)
+    use_case = GetPaginatedDrugsUseCase(
+        mock_drug_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute(
+        page=1, page_size=2, name_or_code_filter="", count="ESTIMATED")
+
+    # Assert
+    mock_drug_repository.get_paginated_by_catalog_id.assert_awaited_once_with(
+        1, 2, 123, "", with_total=True)
+    assert result.total == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count, name_or_code_filter", [
+    ("NONE", ""), ("ESTIMATED", "Drug"),
+])
+async def test_execute_skips_count(count, name_or_code_filter):
+    # Arrange
+    mock_drug_catalog_repository = AsyncMock()
+    mock_drug_catalog_repository.get_central.return_value = Mock(
+        _id=123, drug_count=500_000)
+    mock_drug_repository = AsyncMock()
+    mock_drug_repository.get_paginated_by_catalog_id.return_value = \
+        paged_drugs(None)
+    use_case = GetPaginatedDrugsUseCase(
+        mock_drug_catalog_repository, mock_drug_repository)
+
+    # Act
+    result = await use_case.execute(
+        page=1, page_size=2, name_or_code_filter=name_or_code_filter,
+        count=count)
+
+    # Assert
+    mock_drug_repository.get_paginated_by_catalog_id.assert_awaited_once_with(
+        1, 2, 123, name_or_code_filter, with_total=False)
+    assert result.total is None
+    assert result.has_next is False
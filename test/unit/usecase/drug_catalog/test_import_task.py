@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,11 +17,12 @@ async def test_prepare_transaction_data(monkeypatch):
     mock_drug_catalog_repo = AsyncMock()
     mock_transaction_repo = AsyncMock()
     mock_drug_repo = AsyncMock()
-    mock_ledger_service = MagicMock()
+    mock_ledger_service = AsyncMock()
     mock_parser = MagicMock()
     mock_session = MagicMock()
     mock_ledger_transaction = MagicMock()
     mock_ledger_transaction.transaction_id = "txid123"
+    mock_ledger_transaction.status = "ready"
     mock_ledger_service.insert_transaction.return_value = mock_ledger_transaction
 
     monkeypatch.setattr(
@@ -44,11 +46,15 @@ async def test_prepare_transaction_data(monkeypatch):
 
     # Act
     await use_case.prepare_transaction_data("test.csv", "/path/to/testfile.csv")
+    await use_case._save_transactions(wait=True)
 
     # Assert
     mock_drug_catalog_repo.status_update.assert_awaited_once_with(1, 'created')
     mock_transaction_repo.save.assert_awaited_once()
-    mock_ledger_service.insert_transaction.assert_called_once()
+    saved = mock_transaction_repo.save.await_args.args[0]
+    assert saved.transaction_id == "txid123"
+    assert saved.payload["status"] == "created"
+    mock_ledger_service.insert_transaction.assert_awaited_once()
     assert use_case._transaction_data['status'] == 'created'
     assert use_case._transaction_data['filename'] == "test.csv"
     assert use_case._transaction_data['file_checksum'] == "checksum123"
@@ -60,10 +66,13 @@ async def test_execute_success(monkeypatch):
     mock_drug_catalog_repo = AsyncMock()
     mock_transaction_repo = AsyncMock()
     mock_drug_repo = AsyncMock()
-    mock_ledger_service = MagicMock()
+    mock_ledger_service = AsyncMock()
+    mock_ledger_service.insert_transaction.return_value = MagicMock(
+        status="ready")
     mock_parser = MagicMock()
-    mock_parser.parse = MagicMock()
-    mock_parser.save_all = AsyncMock()
+    loaded_parser = MagicMock()
+    loaded_parser.save_all = AsyncMock()
+    mock_parser.load = AsyncMock(return_value=loaded_parser)
     mock_session = MagicMock()
     catalog_id = 2
 
@@ -82,8 +91,11 @@ async def test_execute_success(monkeypatch):
     await use_case.execute()
 
     # Assert
-    assert mock_parser.parse.called
-    mock_parser.save_all.assert_awaited_once_with(mock_session, catalog_id)
+    mock_parser.load.assert_awaited_once()
+    loaded_parser.save_all.assert_awaited_once_with(
+        mock_session, catalog_id, "ORM")
+    mock_drug_catalog_repo.drug_count_update.assert_awaited_once_with(
+        catalog_id, loaded_parser.save_all.return_value.rows)
     assert mock_drug_catalog_repo.status_update.await_count >= 2
     mock_drug_repo.delete_all_by_catalog_id.assert_not_awaited()
 
@@ -94,10 +106,11 @@ async def test_execute_failure(monkeypatch):
     mock_drug_catalog_repo = AsyncMock()
     mock_transaction_repo = AsyncMock()
     mock_drug_repo = AsyncMock()
-    mock_ledger_service = MagicMock()
+    mock_ledger_service = AsyncMock()
+    mock_ledger_service.insert_transaction.return_value = MagicMock(
+        status="ready")
     mock_parser = MagicMock()
-    mock_parser.parse = MagicMock(side_effect=Exception("parse error"))
-    mock_parser.save_all = AsyncMock()
+    mock_parser.load = AsyncMock(side_effect=Exception("parse error"))
     mock_session = MagicMock()
     catalog_id = 3
 
@@ -121,3 +134,146 @@ async def test_execute_failure(monkeypatch):
     mock_drug_catalog_repo.status_update.assert_any_await(catalog_id, 'failed')
     mock_drug_repo.delete_all_by_catalog_id.assert_awaited_once_with(
         catalog_id)
+
+
+@pytest.mark.asyncio
+async def test_execute_imports_while_the_ledger_entry_is_written():
+    # Arrange
+    written = asyncio.Event()
+    statuses = []
+
+    async def insert_transaction(data):
+        statuses.append(data["status"])
+        if data["status"] == "processing":
+            await written.wait()
+        return MagicMock(transaction_id=f"tx-{data['status']}", status="ready")
+
+    async def load():
+        # the import starts before the 'processing' entry is written
+        assert not written.is_set()
+        written.set()
+        return loaded_parser
+
+    mock_ledger_service = AsyncMock()
+    mock_ledger_service.insert_transaction.side_effect = insert_transaction
+    mock_transaction_repo = AsyncMock()
+    loaded_parser = MagicMock(save_all=AsyncMock())
+    use_case = CatalogImportUseCase(
+        drug_catalog_repository=AsyncMock(),
+        transaction_repository=mock_transaction_repo,
+        drug_repository=AsyncMock(),
+        ledger_service=mock_ledger_service,
+        catalog_id=5,
+        parser=MagicMock(load=load),
+        session=MagicMock()
+    )
+    use_case._transaction_data = {}
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    assert statuses == ["processing", "completed"]
+    saved = [call.args[0] for call in mock_transaction_repo.save.await_args_list]
+    assert [t.transaction_id for t in saved] == ["tx-processing", "tx-completed"]
+    assert [t.payload["status"] for t in saved] == ["processing", "completed"]
+
+
+@pytest.mark.asyncio
+async def test_execute_marks_failed_when_a_ledger_write_fails():
+    # Arrange
+    mock_ledger_service = AsyncMock()
+    mock_ledger_service.insert_transaction.side_effect = [
+        ConnectionError("ledger down"),
+        MagicMock(transaction_id="tx-failed", status="ready"),
+    ]
+    mock_drug_catalog_repo = AsyncMock()
+    mock_drug_repo = AsyncMock()
+    mock_transaction_repo = AsyncMock()
+    loaded_parser = MagicMock(save_all=AsyncMock())
+    use_case = CatalogImportUseCase(
+        drug_catalog_repository=mock_drug_catalog_repo,
+        transaction_repository=mock_transaction_repo,
+        drug_repository=mock_drug_repo,
+        ledger_service=mock_ledger_service,
+        catalog_id=6,
+        parser=MagicMock(load=AsyncMock(return_value=loaded_parser)),
+        session=MagicMock(),
+        logger=MagicMock()
+    )
+    use_case._transaction_data = {}
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    mock_drug_catalog_repo.status_update.assert_awaited_with(6, 'failed')
+    with pytest.raises(AssertionError):
+        mock_drug_catalog_repo.status_update.assert_any_await(6, 'completed')
+    mock_drug_repo.delete_all_by_catalog_id.assert_awaited_once_with(6)
+    saved = mock_transaction_repo.save.await_args.args[0]
+    assert saved.transaction_id == "tx-failed"
+
+
+def _polling_use_case(ledger_service, timeout):
+    return CatalogImportUseCase(
+        drug_catalog_repository=AsyncMock(),
+        transaction_repository=AsyncMock(),
+        drug_repository=AsyncMock(),
+        ledger_service=ledger_service,
+        catalog_id=4,
+        parser=MagicMock(),
+        session=MagicMock(),
+        ledger_ready_timeout=timeout,
+    )
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_polls_the_ledger():
+    # Arrange
+    mock_ledger_service = AsyncMock()
+    mock_ledger_service.retrieve_transaction.side_effect = [
+        None,
+        MagicMock(status="processing"),
+        MagicMock(status="ready"),
+    ]
+    use_case = _polling_use_case(mock_ledger_service, timeout=5)
+    transaction = MagicMock(transaction_id="tx1", status="processing")
+
+    # Act
+    await use_case._wait_until_ready(transaction)
+
+    # Assert
+    assert mock_ledger_service.retrieve_transaction.await_count == 3
+    mock_ledger_service.retrieve_transaction.assert_awaited_with("tx1")
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_gives_up_after_timeout():
+    # Arrange
+    mock_ledger_service = AsyncMock()
+    mock_ledger_service.retrieve_transaction.return_value = MagicMock(
+        status="processing")
+    use_case = _polling_use_case(mock_ledger_service, timeout=0.2)
+    use_case._logger = MagicMock()
+    transaction = MagicMock(transaction_id="tx1", status="processing")
+
+    # Act
+    await use_case._wait_until_ready(transaction)
+
+    # Assert
+    assert mock_ledger_service.retrieve_transaction.awaited
+    use_case._logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_skips_ready_transactions():
+    # Arrange
+    mock_ledger_service = AsyncMock()
+    use_case = _polling_use_case(mock_ledger_service, timeout=5)
+
+    # Act
+    await use_case._wait_until_ready(MagicMock(status="ready"))
+
+    # Assert
+    mock_ledger_service.retrieve_transaction.assert_not_awaited()
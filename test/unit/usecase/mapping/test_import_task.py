@@ -1,12 +1,12 @@
 import pytest
-from fastapi import UploadFile
 
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from src.application.use_cases.mapping.import_task import MappingImportUseCase
+from src.infrastructure.services.pandas_parser.drug.exc import InvalidFileFormat
 from src.infrastructure.services.pandas_parser.mapping.parse import DrugMappingParse
 
 
-async def mock_checksum(file: UploadFile, algorithm: str = "sha256"):
+async def mock_checksum(file_path: str, algorithm: str = "sha256"):
     return "checksum123"
 
 
@@ -30,15 +30,13 @@ async def test_prepare_task_sets_transaction_data_and_updates_status(monkeypatch
     )
 
     monkeypatch.setattr(
-        "src.application.use_cases.mapping.import_task.uploadfile_checksum",
+        "src.application.use_cases.mapping.import_task.filepath_checksum",
         mock_checksum
     )
 
-    file_mock = MagicMock(spec=UploadFile)
-    file_mock.filename = "test.csv"
     with patch.object(use_case, "_update_status", new=AsyncMock()) as update_status_mock:
         # Act
-        await use_case.prepare_task(file_mock)
+        await use_case.prepare_task("test.csv", "/storage/uuid_test.csv")
 
         # Assert
         update_status_mock.assert_awaited_once_with('created')
@@ -79,7 +77,8 @@ async def test_execute_successful_flow(monkeypatch):
 
     mappings = [[MagicMock(spec=DrugMappingParse)], [
         MagicMock(spec=DrugMappingParse)]]
-    mapping_parser.parse.return_value = mappings
+    mapping_parser.load = AsyncMock(
+        return_value=MagicMock(parse=MagicMock(return_value=mappings)))
     use_case._save_mappings = AsyncMock()
     use_case._update_status = AsyncMock()
 
@@ -89,3 +88,168 @@ async def test_execute_successful_flow(monkeypatch):
     # Assert
     use_case._update_status.assert_any_await('processing')
     use_case._update_status.assert_any_await('completed')
+
+
+@pytest.mark.asyncio
+async def test_status_entries_are_saved_with_their_transaction_ids(monkeypatch):
+    # Arrange
+    transaction_repo = AsyncMock()
+    ledger_service = MagicMock()
+    ledger_service.insert_transaction = AsyncMock(side_effect=lambda data: MagicMock(
+        transaction_id=f"tx-{data['status']}", status="ready"))
+    mapping_parser = MagicMock(
+        load=AsyncMock(return_value=MagicMock(parse=MagicMock(return_value=[]))))
+    monkeypatch.setattr(
+        "src.application.use_cases.mapping.import_task.filepath_checksum",
+        mock_checksum
+    )
+    use_case = MappingImportUseCase(
+        transaction_repo, ledger_service, mapping_parser, 1, 2, 3)
+
+    # Act
+    await use_case.prepare_task("test.csv", "/storage/uuid_test.csv")
+    await use_case.execute()
+
+    # Assert
+    saved = [call.args[0] for call in transaction_repo.save.await_args_list]
+    assert [t.transaction_id for t in saved] == [
+        "tx-created", "tx-processing", "tx-completed"]
+    assert [t.payload["status"] for t in saved] == [
+        "created", "processing", "completed"]
+
+
+@pytest.mark.asyncio
+async def test_execute_queues_chunks_of_the_configured_size(monkeypatch):
+    # Arrange
+    parser = MagicMock()
+    parser.parse.return_value = [
+        [DrugMappingParse(drug_code=f"C{i}", related_drug_code=f"R{i}")]
+        for i in range(3)
+    ]
+    mapping_parser = MagicMock(load=AsyncMock(return_value=parser))
+    taskiq_task = Mock(kiq=AsyncMock())
+    monkeypatch.setattr(
+        "src.application.use_cases.mapping.import_task.mapping_import_taskiq",
+        taskiq_task
+    )
+
+    use_case = MappingImportUseCase(
+        AsyncMock(), MagicMock(), mapping_parser, 1, 2, 3,
+        chunk_rows=500, chunk_bytes=65536
+    )
+    use_case._update_status = AsyncMock()
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    parser.parse.assert_called_once_with(500, 65536)
+    assert taskiq_task.kiq.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_marks_failed_on_parse_error():
+    # Arrange
+    parser = MagicMock()
+    parser.parse.side_effect = ValueError("bad row")
+    mapping_parser = MagicMock(load=AsyncMock(return_value=parser))
+    use_case = MappingImportUseCase(
+        AsyncMock(), MagicMock(), mapping_parser, 1, 2, 3, logger=MagicMock())
+    use_case._update_status = AsyncMock()
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    use_case._update_status.assert_any_await('processing')
+    use_case._update_status.assert_awaited_with('failed')
+
+
+@pytest.mark.asyncio
+async def test_execute_marks_failed_when_the_file_does_not_open():
+    # Arrange
+    mapping_parser = MagicMock(
+        load=AsyncMock(side_effect=InvalidFileFormat("bad file")))
+    use_case = MappingImportUseCase(
+        AsyncMock(), MagicMock(), mapping_parser, 1, 2, 3, logger=MagicMock())
+    use_case._update_status = AsyncMock()
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    mapping_parser.load.assert_awaited_once()
+    use_case._update_status.assert_any_await('processing')
+    use_case._update_status.assert_awaited_with('failed')
+
+
+@pytest.mark.asyncio
+async def test_execute_waits_for_chunks_past_the_cap(monkeypatch):
+    # Arrange
+    parser = MagicMock()
+    parser.parse.return_value = [
+        [DrugMappingParse(drug_code=f"C{i}", related_drug_code=f"R{i}")]
+        for i in range(4)
+    ]
+    taskiq_task = Mock(kiq=AsyncMock())
+    monkeypatch.setattr(
+        "src.application.use_cases.mapping.import_task.mapping_import_taskiq",
+        taskiq_task
+    )
+    monkeypatch.setattr(
+        "src.application.use_cases.mapping.import_task.asyncio.sleep",
+        AsyncMock())
+    mapping_repository = AsyncMock()
+    # nothing processed, then the first chunk, then the second
+    mapping_repository.get_chunks_done.side_effect = [0, 1, 2]
+
+    use_case = MappingImportUseCase(
+        AsyncMock(), MagicMock(), MagicMock(load=AsyncMock(return_value=parser)),
+        1, 2, 3, mapping_repository=mapping_repository, max_in_flight=2
+    )
+    use_case._update_status = AsyncMock()
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    mapping_repository.start_progress.assert_awaited_once_with(1)
+    assert mapping_repository.get_chunks_done.await_count == 3
+    assert taskiq_task.kiq.await_count == 4
+    assert all(call.args[0]["counted"] for call in taskiq_task.kiq.await_args_list)
+    mapping_repository.end_progress.assert_awaited_once_with(1)
+    use_case._update_status.assert_awaited_with('completed')
+
+
+@pytest.mark.asyncio
+async def test_execute_stops_capping_when_no_chunk_finishes(monkeypatch):
+    # Arrange
+    parser = MagicMock()
+    parser.parse.return_value = [
+        [DrugMappingParse(drug_code=f"C{i}", related_drug_code=f"R{i}")]
+        for i in range(4)
+    ]
+    taskiq_task = Mock(kiq=AsyncMock())
+    monkeypatch.setattr(
+        "src.application.use_cases.mapping.import_task.mapping_import_taskiq",
+        taskiq_task
+    )
+    mapping_repository = AsyncMock()
+    mapping_repository.get_chunks_done.return_value = 0
+    logger = MagicMock()
+
+    use_case = MappingImportUseCase(
+        AsyncMock(), MagicMock(), MagicMock(load=AsyncMock(return_value=parser)),
+        1, 2, 3, mapping_repository=mapping_repository, max_in_flight=1,
+        in_flight_timeout=0, logger=logger
+    )
+    use_case._update_status = AsyncMock()
+
+    # Act
+    await use_case.execute()
+
+    # Assert
+    mapping_repository.get_chunks_done.assert_awaited_once()
+    logger.warning.assert_called_once()
+    assert taskiq_task.kiq.await_count == 4
+    use_case._update_status.assert_awaited_with('completed')
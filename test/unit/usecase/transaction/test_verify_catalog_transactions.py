@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.dto.transaction import TransactionVerificationDto
+from src.application.use_cases.transaction.verify_catalog_transactions import (
+    VerifyCatalogTransactionsUseCase
+)
+from src.infrastructure.services.confidential_ledger.contract import (
+    TransactionInserted
+)
+from src.utils.checksum import dict_hash
+
+
+def ledger_entry(transaction_id, payload):
+    return TransactionInserted(
+        transaction_id=transaction_id, status="ready",
+        transaction_data={"data": payload, "hash": dict_hash(payload)})
+
+
+@pytest.mark.asyncio
+async def test_execute_verifies_every_catalog_transaction():
+    # Arrange
+    created = {"status": "created", "catalog_id": "1"}
+    completed = {"status": "completed", "catalog_id": "1"}
+    ct_repository = AsyncMock()
+    ct_repository.get_all_by_catalog_id.return_value = [
+        MagicMock(transaction_id="tx2", payload=completed),
+        MagicMock(transaction_id="tx1", payload=created),
+    ]
+    entries = {
+        # the stored payload of tx2 no longer matches the ledger
+        "tx2": ledger_entry("tx2", {"status": "failed", "catalog_id": "1"}),
+        "tx1": ledger_entry("tx1", created),
+    }
+    ledger_service = AsyncMock()
+    ledger_service.retrieve_transaction.side_effect = entries.get
+    use_case = VerifyCatalogTransactionsUseCase(ct_repository, ledger_service)
+
+    # Act
+    result = await use_case.execute(1)
+
+    # Assert
+    ct_repository.get_all_by_catalog_id.assert_awaited_once_with(1)
+    assert result == [
+        TransactionVerificationDto(transaction_id="tx2", valid=False),
+        TransactionVerificationDto(transaction_id="tx1", valid=True),
+    ]
@@ -5,6 +5,10 @@ from src.application.dto.transaction import TransactionDto
 from src.application.use_cases.transaction.verify_transaction import (
     VerifyTransactionUseCase
 )
+from src.infrastructure.services.confidential_ledger.contract import (
+    TransactionInserted
+)
+from src.utils.cache import TTLCache
 
 transaction_id = "ce0795d6-7df0-45b5-9f80-0d50d2eba41b"
 payload = {
@@ -25,7 +29,7 @@ async def test_execute_returns_invalid_when_payload_is_none():
     # Arrange
     t_repository = AsyncMock()
     t_repository.get_payload_by_transaction_id.return_value = None
-    ledger_service = MagicMock()
+    ledger_service = AsyncMock()
     use_case = VerifyTransactionUseCase(t_repository, ledger_service)
 
     # Act
@@ -41,7 +45,7 @@ async def test_execute_returns_invalid_when_transaction_is_none():
     # Arrange
     t_repository = AsyncMock()
     t_repository.get_payload_by_transaction_id.return_value = payload
-    ledger_service = MagicMock()
+    ledger_service = AsyncMock()
     ledger_service.retrieve_transaction.return_value = None
     use_case = VerifyTransactionUseCase(t_repository, ledger_service)
 
@@ -61,10 +65,10 @@ async def test_execute_returns_valid_when_hash_matches(monkeypatch):
     t_repository = AsyncMock()
     t_repository.get_payload_by_transaction_id.return_value = payload
 
-    transaction_mock = MagicMock()
+    transaction_mock = MagicMock(status="ready")
     transaction_mock.transaction_data = {'hash': expected_hash}
 
-    ledger_service = MagicMock()
+    ledger_service = AsyncMock()
     ledger_service.retrieve_transaction.return_value = transaction_mock
 
     # Patch dict_hash to return the expected hash
@@ -91,10 +95,10 @@ async def test_execute_returns_invalid_when_hash_does_not_match(monkeypatch):
     t_repository = AsyncMock()
     t_repository.get_payload_by_transaction_id.return_value = payload
 
-    transaction_mock = MagicMock()
+    transaction_mock = MagicMock(status="ready")
     transaction_mock.transaction_data = {'hash': ledger_hash}
 
-    ledger_service = MagicMock()
+    ledger_service = AsyncMock()
     ledger_service.retrieve_transaction.return_value = transaction_mock
 
     # Patch dict_hash to return a different hash
@@ -111,3 +115,51 @@ async def test_execute_returns_invalid_when_hash_does_not_match(monkeypatch):
     # Assert
     assert isinstance(result, TransactionDto)
     assert result.valid is False
+
+
+@pytest.mark.asyncio
+async def test_execute_caches_ready_ledger_hash():
+    # Arrange
+    t_repository = AsyncMock()
+    t_repository.get_payload_by_transaction_id.return_value = payload
+    ledger_service = AsyncMock()
+    ledger_service.retrieve_transaction.return_value = TransactionInserted(
+        transaction_id=transaction_id, status="ready",
+        transaction_data={"data": payload, "hash": payload_hash})
+    cache = TTLCache()
+    use_case = VerifyTransactionUseCase(t_repository, ledger_service, cache)
+
+    # Act
+    first = await use_case.execute(transaction_id)
+    second = await use_case.execute(transaction_id)
+
+    # Assert
+    assert first.valid is True and second.valid is True
+    ledger_service.retrieve_transaction.assert_awaited_once_with(transaction_id)
+    assert t_repository.get_payload_by_transaction_id.await_count == 2
+    assert cache.get(transaction_id) == payload_hash
+
+
+@pytest.mark.asyncio
+async def test_execute_retries_processing_entries_after_ttl():
+    # Arrange
+    t_repository = AsyncMock()
+    t_repository.get_payload_by_transaction_id.return_value = payload
+    ledger_service = AsyncMock()
+    ledger_service.retrieve_transaction.side_effect = [
+        TransactionInserted(transaction_id=transaction_id, status="processing"),
+        TransactionInserted(
+            transaction_id=transaction_id, status="ready",
+            transaction_data={"data": payload, "hash": payload_hash}),
+    ]
+    use_case = VerifyTransactionUseCase(
+        t_repository, ledger_service, TTLCache(), pending_ttl=0)
+
+    # Act
+    pending = await use_case.execute(transaction_id)
+    ready = await use_case.execute(transaction_id)
+
+    # Assert
+    assert pending.valid is False
+    assert ready.valid is True
+    assert ledger_service.retrieve_transaction.await_count == 2
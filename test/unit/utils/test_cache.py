@@ -0,0 +1,75 @@
+from src.utils.cache import TTLCache
+
+
+def test_get_returns_default_on_miss():
+    # Arrange
+    cache = TTLCache()
+
+    # Act & Assert
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+    assert "missing" not in cache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    # Arrange
+    now = [100.0]
+    monkeypatch.setattr("src.utils.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=None)
+
+    # Act
+    now[0] += 11
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_none_values_are_cached():
+    # Arrange
+    cache = TTLCache()
+
+    # Act
+    cache.set("a", None)
+
+    # Assert
+    assert "a" in cache
+    assert cache.pop("a", 0) is None
+    assert "a" not in cache
+
+
+def test_lookups_are_counted():
+    # Arrange
+    cache = TTLCache()
+    cache.set("a", 1)
+
+    # Act
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    "a" in cache
+    cache.pop("a")
+
+    # Assert
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_ratio == 2 / 3
+    assert TTLCache().hit_ratio is None
@@ -0,0 +1,29 @@
+import base64
+import pytest
+
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.exc import BadRequest
+
+
+def raw_cursor(value: str) -> str:
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("last_id", [0, 1, 123456, 2**63 - 1])
+def test_decode_cursor_roundtrips(last_id):
+    # Act & Assert
+    assert decode_cursor(encode_cursor(last_id)) == last_id
+
+
+@pytest.mark.parametrize("value", ["-1", str(2**63), "9" * 40])
+def test_decode_cursor_rejects_ids_out_of_bigint_range(value):
+    # Act & Assert
+    with pytest.raises(BadRequest, match="Invalid pagination cursor"):
+        decode_cursor(raw_cursor(value))
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", raw_cursor("abc"), "é"])
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    # Act & Assert
+    with pytest.raises(BadRequest, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
@@ -0,0 +1,28 @@
+import pytest
+from io import BytesIO
+
+from src.utils.file import decodes_with
+
+
+@pytest.mark.parametrize("encoding, expected", [
+    ("utf-8", False), ("ISO-8859-1", True), ("not-an-encoding", False)])
+def test_decodes_with_checks_the_whole_stream(encoding, expected):
+    # Arrange
+    stream = BytesIO(b"a" * 100 + "é".encode("ISO-8859-1"))
+
+    # Act
+    result = decodes_with(stream, encoding, block_size=10)
+
+    # Assert
+    assert result is expected
+    assert stream.tell() == 0
+
+
+def test_decodes_with_reads_file_paths(tmp_path):
+    # Arrange
+    path = tmp_path / "drugs.csv"
+    path.write_bytes("Café".encode("utf-8"))
+
+    # Act & Assert
+    assert decodes_with(str(path), "utf-8")
+    assert not decodes_with(str(path), "ascii")